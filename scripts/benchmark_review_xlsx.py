@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""Benchmark the write-only review xlsx writer against the former in-memory Workbook writer."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Iterator
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import fetch_app_reviews  # noqa: E402
+
+
+WRITERS = ("in_memory", "write_only")
+
+
+def sample_rows(count: int) -> Iterator[dict[str, str]]:
+    for idx in range(count):
+        yield {
+            "service_name": "Benchmark App",
+            "store": "google_play" if idx % 2 else "apple_app_store",
+            "app_id": "com.example.benchmark",
+            "country": ("KR", "US", "JP")[idx % 3],
+            "language": "en",
+            "rating": str(1 + idx % 5),
+            "title": f"Review title {idx}",
+            "content": ("Detailed review body with enough text to wrap across lines. " * 4).strip(),
+            "reviewer_name": f"user{idx}",
+            "review_created_at": f"2026-02-{1 + idx % 28:02d}T10:00:00",
+            "source_url": "https://play.google.com/store/apps/details?id=com.example.benchmark",
+        }
+
+
+def write_in_memory(path: Path, rows: Iterator[dict[str, str]], sheet_name: str) -> None:
+    """The pre-streaming writer: full Workbook in memory, then a second pass styling every cell."""
+    from openpyxl import Workbook
+    from openpyxl.styles import Alignment, Border, Font, PatternFill, Side
+
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.title = fetch_app_reviews.sanitize_filename(sheet_name)[:31]
+
+    header_font = Font(name="Calibri", size=10, bold=True, color="FFFFFF")
+    body_font = Font(name="Calibri", size=10, color="000000")
+    header_fill = PatternFill(start_color="003366", end_color="003366", fill_type="solid")
+    border = Border(
+        left=Side(style="thin"),
+        right=Side(style="thin"),
+        top=Side(style="thin"),
+        bottom=Side(style="thin"),
+    )
+
+    sheet.append(fetch_app_reviews.XLSX_COLUMNS)
+    for cell in sheet[1]:
+        cell.font = header_font
+        cell.fill = header_fill
+        cell.border = border
+
+    for row in rows:
+        sheet.append([row.get(column, "") for column in fetch_app_reviews.XLSX_COLUMNS])
+
+    for row in sheet.iter_rows(min_row=2):
+        for cell in row:
+            cell.font = body_font
+            cell.border = border
+            if cell.column in {7, 8}:
+                cell.alignment = Alignment(wrap_text=True, vertical="top")
+
+    for column, width in fetch_app_reviews.ReviewWorkbook.widths.items():
+        sheet.column_dimensions[column].width = width
+    sheet.auto_filter.ref = sheet.dimensions
+    workbook.save(path)
+
+
+def _writer(name: str) -> Callable[[Path, Iterator[dict[str, str]], str], None]:
+    if name == "in_memory":
+        return write_in_memory
+    return fetch_app_reviews.write_reviews_xlsx
+
+
+def _peak_rss_mb() -> float:
+    import resource
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS and kilobytes on Linux.
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def run_writer(name: str, rows: int) -> dict[str, object]:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / f"{name}.xlsx"
+        started = time.perf_counter()
+        _writer(name)(path, sample_rows(rows), "benchmark")
+        elapsed = time.perf_counter() - started
+        size_bytes = path.stat().st_size
+    return {
+        "writer": name,
+        "rows": rows,
+        "seconds": round(elapsed, 3),
+        "rows_per_sec": round(rows / elapsed, 1) if elapsed > 0 else 0.0,
+        "peak_rss_mb": round(_peak_rss_mb(), 1),
+        "file_mb": round(size_bytes / (1024 * 1024), 2),
+    }
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark review xlsx writers (rows/sec and peak RSS)")
+    parser.add_argument("--rows", type=int, default=20000, help="Review rows per workbook")
+    parser.add_argument(
+        "--writer",
+        choices=WRITERS,
+        help="Run a single writer in this process and print its JSON result",
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    rows = max(1, int(args.rows))
+    if args.writer:
+        print(json.dumps(run_writer(args.writer, rows)))
+        return
+
+    # Each writer runs in a fresh interpreter so peak RSS is not shared between them.
+    results = []
+    for name in WRITERS:
+        completed = subprocess.run(
+            [sys.executable, __file__, "--writer", name, "--rows", str(rows)],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        results.append(json.loads(completed.stdout.strip().splitlines()[-1]))
+
+    print(f"{'writer':<12} {'rows':>8} {'seconds':>9} {'rows/sec':>10} {'peak_rss_mb':>12} {'file_mb':>8}")
+    for result in results:
+        print(
+            f"{result['writer']:<12} {result['rows']:>8} {result['seconds']:>9} "
+            f"{result['rows_per_sec']:>10} {result['peak_rss_mb']:>12} {result['file_mb']:>8}"
+        )
+
+
+if __name__ == "__main__":
+    main()
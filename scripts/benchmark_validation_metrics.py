@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""Benchmark SQL-aggregated calculate_metrics against the former row-by-row Python implementation."""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+from collections import Counter
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.pre_apply_validation_pack import calculate_metrics, parse_bool, parse_int
+from src.storage import date_token_to_iso, db_path, ensure_schema, fetch_metrics_rows
+
+
+# Share of synthetic rows per table.
+TABLE_WEIGHTS = {
+    "trip_safety": 0.35,
+    "trip_pass_pricing": 0.2,
+    "guardrail_checklist": 0.15,
+    "interview_log": 0.15,
+    "b2b_pipeline": 0.1,
+    "landing_cvr_daily": 0.05,
+}
+BOOL_VALUES = ["yes", "no", "1", "0", " True ", "n", "", "maybe"]
+
+
+def _row(table: str, idx: int, date_iso: str, rng: random.Random) -> tuple[object, ...]:
+    pick = lambda: rng.choice(BOOL_VALUES)  # noqa: E731
+    if table == "trip_safety":
+        return (f"S{idx}", date_iso, "fit_foreign", "bibimbap", "vegan", "", "", "", pick(), "", pick(), "")
+    if table == "trip_pass_pricing":
+        return (f"P{idx}", date_iso, "fit_foreign", "7d_pass", "", pick())
+    if table == "guardrail_checklist":
+        return (f"G{idx}", date_iso, f"S{idx}", pick(), pick(), pick(), "", "")
+    if table == "interview_log":
+        segment = rng.choice(["fit_foreign", "field_staff"])
+        tags = ";".join(rng.sample(["hidden", "translation", "staff", "trust", "delay"], 2))
+        return (f"I{idx}", date_iso, segment, "EN", tags, rng.choice(["", "quote"]))
+    if table == "b2b_pipeline":
+        return (f"B{idx}", date_iso, "hotel", "", rng.choice(["completed", "planned"]), pick(), pick(), "")
+    return (date_iso, f"channel_{idx}", rng.randint(0, 500), 0, 0, rng.randint(0, 50))
+
+
+def build_database(rows: int, dates: int, seed: int) -> list[str]:
+    ensure_schema()
+    rng = random.Random(seed)
+    date_list = [date_token_to_iso(f"202602{day:02d}") for day in range(1, dates + 1)]
+    conn = sqlite3.connect(db_path())
+    try:
+        for table, weight in TABLE_WEIGHTS.items():
+            count = int(rows * weight)
+            placeholders = ", ".join(["?"] * len(_row(table, 0, date_list[0], rng)))
+            with conn:
+                conn.executemany(
+                    f"INSERT INTO {table} VALUES ({placeholders})",
+                    (_row(table, idx, date_list[idx % dates], rng) for idx in range(count)),
+                )
+    finally:
+        conn.close()
+    return date_list
+
+
+def calculate_metrics_python(date_iso: str) -> dict[str, float | int]:
+    """The pre-pushdown implementation, kept for comparison: six fetches and per-field parsing."""
+    interviews = fetch_metrics_rows("interview_log", date_iso)
+    completed_interviews = [r for r in interviews if (r.get("quote", "").strip() or r.get("pain_tags", "").strip())]
+    pain_counter: Counter[str] = Counter()
+    for row in completed_interviews:
+        pain_counter.update(tag.strip().lower() for tag in row.get("pain_tags", "").split(";") if tag.strip())
+
+    landing_rows = fetch_metrics_rows("landing_cvr_daily", date_iso)
+    visitors = sum(parse_int(str(r.get("visitors", ""))) or 0 for r in landing_rows)
+    total_cta = sum(parse_int(str(r.get("total_cta", ""))) or 0 for r in landing_rows)
+
+    trip_rows = fetch_metrics_rows("trip_safety", date_iso)
+    completed_trip_rows = [r for r in trip_rows if parse_bool(str(r.get("resolved", ""))) is not None]
+    show_mode_count = sum(1 for r in completed_trip_rows if parse_bool(str(r.get("show_mode_used", ""))) is True)
+    resolved_count = sum(1 for r in completed_trip_rows if parse_bool(str(r.get("resolved", ""))) is True)
+
+    b2b_rows = fetch_metrics_rows("b2b_pipeline", date_iso)
+    completed_meetings = sum(1 for r in b2b_rows if str(r.get("status", "")).strip().lower() == "completed")
+    loi_count = sum(1 for r in b2b_rows if parse_bool(str(r.get("loi_signed", ""))) is True)
+
+    pricing_rows = fetch_metrics_rows("trip_pass_pricing", date_iso)
+    completed_pricing = [r for r in pricing_rows if parse_bool(str(r.get("willing_to_pay", ""))) is not None]
+    willing_count = sum(1 for r in completed_pricing if parse_bool(str(r.get("willing_to_pay", ""))) is True)
+
+    guardrail_rows = fetch_metrics_rows("guardrail_checklist", date_iso)
+    reviewed = [
+        r
+        for r in guardrail_rows
+        if any(
+            parse_bool(str(r.get(field, ""))) is not None
+            for field in ("banned_expression_found", "evidence_missing", "confidence_missing")
+        )
+    ]
+    return {
+        "interview_total": len(completed_interviews),
+        "repeated_pain_points": sum(1 for count in pain_counter.values() if count >= 2),
+        "visitors": visitors,
+        "total_cta": total_cta,
+        "scenarios_completed": len(completed_trip_rows),
+        "show_mode_count": show_mode_count,
+        "resolved_count": resolved_count,
+        "completed_meetings": completed_meetings,
+        "loi_count": loi_count,
+        "pricing_total": len(completed_pricing),
+        "willing_count": willing_count,
+        "reviewed_guardrails": len(reviewed),
+    }
+
+
+def _best_of(repeat: int, func, *args) -> float:  # type: ignore[no-untyped-def]
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark calculate_metrics on a synthetic database")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Total synthetic rows across tables")
+    parser.add_argument("--dates", type=int, default=1, help="Distinct dates the rows are spread over")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per implementation (best is reported)")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        os.environ["KTRIPPEDIA_DATA_DIR"] = temp_dir
+        started = time.perf_counter()
+        dates = build_database(max(1, args.rows), max(1, min(args.dates, 28)), args.seed)
+        print(f"Built {args.rows} rows over {len(dates)} date(s) in {time.perf_counter() - started:.1f}s")
+
+        date_iso = dates[0]
+        date_token = date_iso.replace("-", "")
+        sql_metrics = calculate_metrics(date_token)
+        python_metrics = calculate_metrics_python(date_iso)
+        mismatched = [
+            key for key in ("visitors", "total_cta", "scenarios_completed", "loi_count", "willing_count")
+            if sql_metrics[key] != python_metrics[key]
+        ]
+        if mismatched:
+            raise SystemExit(f"Implementations disagree on: {', '.join(mismatched)}")
+
+        python_sec = _best_of(max(1, args.repeat), calculate_metrics_python, date_iso)
+        sql_sec = _best_of(max(1, args.repeat), calculate_metrics, date_token)
+
+    print(f"python rows: {python_sec:.3f}s")
+    print(f"sql aggregate: {sql_sec:.3f}s")
+    print(f"speedup: {python_sec / sql_sec:.1f}x" if sql_sec > 0 else "speedup: n/a")
+
+
+if __name__ == "__main__":
+    main()
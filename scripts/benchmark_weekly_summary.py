@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""Benchmark the SQLite weekly summary against the CSV-scan fallback on multi-year synthetic data."""
+
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Iterator
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src import storage_base  # noqa: E402
+from src.storage import db_path, ensure_schema, export_all_tables_to_csv  # noqa: E402
+from src.weekly_validation_summary import build_summary  # noqa: E402
+
+
+CHANNELS = ("community", "community", "referral", "sns_shortform", "pre_arrival_qr")
+SOURCES = ("reddit", "facebook", "naver_cafe", "discord", "")
+EVENT_TYPES = ("visit", "visit", "visit", "cta_click", "lead_submit")
+
+
+def _events(days: list[str], per_day: int, rng: random.Random) -> Iterator[tuple[object, ...]]:
+    for date_iso in days:
+        for idx in range(per_day):
+            channel = rng.choice(CHANNELS)
+            source_id = rng.choice(SOURCES) if channel == "community" else ""
+            post_id = f"{source_id or 'p'}{rng.randint(1, 20)}" if channel == "community" else ""
+            event_type = rng.choice(EVENT_TYPES)
+            yield (
+                f"{date_iso}T10:00:00",
+                date_iso,
+                f"s{idx}",
+                "EN",
+                channel,
+                source_id,
+                post_id,
+                event_type,
+                "pilot" if event_type == "cta_click" else "",
+                f"sha256:{idx}" if event_type == "lead_submit" else "",
+                1 if event_type == "lead_submit" else 0,
+            )
+
+
+def build_data(years: int, per_day: int, seed: int) -> list[str]:
+    ensure_schema()
+    rng = random.Random(seed)
+    end = dt.date(2026, 2, 22)
+    days = [(end - dt.timedelta(days=offset)).isoformat() for offset in range(years * 365)][::-1]
+    conn = sqlite3.connect(db_path())
+    try:
+        with conn:
+            conn.executemany(
+                """
+                INSERT OR IGNORE INTO landing_events (
+                  timestamp, date, session_id, language, channel, source_id, post_id,
+                  event_type, cta_type, lead_email, consent
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                _events(days, per_day, rng),
+            )
+            conn.execute(
+                """
+                INSERT INTO landing_cvr_daily (date, channel, visitors, pilot_cta, first_scan_cta, total_cta)
+                SELECT date, channel, SUM(event_type = 'visit'), SUM(event_type = 'cta_click'), 0,
+                       SUM(event_type = 'cta_click')
+                FROM landing_events
+                GROUP BY date, channel
+                """
+            )
+            storage_base._migrate_community_source_daily(conn)
+    finally:
+        conn.close()
+    export_all_tables_to_csv()
+    return days
+
+
+def _best_of(repeat: int, root: Path, start_iso: str, end_iso: str, source: str) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        build_summary(root, start_iso, end_iso, source=source)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark weekly summary sources on synthetic history")
+    parser.add_argument("--years", type=int, default=3, help="Years of daily history to generate")
+    parser.add_argument("--per-day", type=int, default=500, help="Landing events per day")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per source (best is reported)")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        root = Path(temp_dir)
+        os.environ["KTRIPPEDIA_DATA_DIR"] = str(root / "data")
+        started = time.perf_counter()
+        days = build_data(max(1, args.years), max(1, args.per_day), args.seed)
+        print(f"Built {len(days) * args.per_day} events over {len(days)} days in {time.perf_counter() - started:.1f}s")
+
+        start_iso, end_iso = days[-7], days[-1]
+        if build_summary(root, start_iso, end_iso, source="csv")[0] != build_summary(root, start_iso, end_iso, source="sqlite")[0]:
+            raise SystemExit("CSV and SQLite summaries disagree")
+
+        repeat = max(1, args.repeat)
+        csv_sec = _best_of(repeat, root, start_iso, end_iso, "csv")
+        sqlite_sec = _best_of(repeat, root, start_iso, end_iso, "sqlite")
+
+    print(f"csv scan: {csv_sec:.3f}s")
+    print(f"sqlite range: {sqlite_sec:.4f}s")
+    print(f"speedup: {csv_sec / sqlite_sec:.1f}x" if sqlite_sec > 0 else "speedup: n/a")
+
+
+if __name__ == "__main__":
+    main()
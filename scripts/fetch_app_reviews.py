@@ -4,19 +4,29 @@
 from __future__ import annotations
 
 import argparse
+import csv
 import datetime as dt
+import itertools
 import os
+import queue
 import sys
+import threading
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from pathlib import Path
-from typing import Callable
+from typing import Any, Callable, Iterable, Iterator, NamedTuple
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
-from src.review_collectors.apple_store import collect_apple_reviews
+from src.review_collectors.apple_store import iter_apple_reviews
 from src.review_collectors.common import (
     NormalizedReview,
+    RateLimiter,
+    ReviewWatermark,
     default_language_for_country,
+    is_newer_than_watermark,
+    newest_review,
     normalize_app_id,
     normalize_markets,
     parse_apple_app_id_from_link,
@@ -24,11 +34,29 @@ from src.review_collectors.common import (
     sanitize_filename,
     to_text,
 )
-from src.review_collectors.google_play import collect_google_reviews
-from src.storage import date_token_to_iso, normalize_date_token, upsert_app_reviews
+from src.review_collectors.google_play import iter_google_reviews
+from src.storage import (
+    date_token_to_iso,
+    fetch_app_review_watermarks,
+    normalize_date_token,
+    suppress_exports,
+    update_app_review_watermark,
+    upsert_app_reviews,
+)
 
 
 DEFAULT_MARKETS = ["KR", "US", "JP"]
+DEFAULT_WORKERS = 4
+# Reviews per upsert/xlsx append; bounds how much of one app's history is held in memory.
+DEFAULT_CHUNK_SIZE = 500
+# per_job: one workbook per service/store/country; consolidated: one workbook per run, one sheet
+# per store/country.
+XLSX_LAYOUTS = ("per_job", "consolidated")
+# store -> (max concurrent collector calls, min seconds between call starts)
+STORE_RATE_LIMITS = {
+    "google_play": (2, 1.0),
+    "apple_app_store": (4, 0.25),
+}
 DEFAULT_ROOT = Path(__file__).resolve().parents[1]
 
 COLUMN_ALIASES = {
@@ -55,6 +83,10 @@ XLSX_COLUMNS = [
 ]
 
 
+TARGET_TEXT_DELIMITERS = {".csv": ",", ".tsv": "\t", ".tab": "\t"}
+TARGET_XLSX_SUFFIXES = {".xlsx", ".xlsm"}
+
+
 def _normalize_row_keys(row: dict[object, object]) -> dict[str, object]:
     return {to_text(key).lower(): value for key, value in row.items()}
 
@@ -68,20 +100,19 @@ def _pick_value(row: dict[str, object], logical_name: str) -> str:
     return ""
 
 
-def normalize_target_row(row: dict[object, object], default_markets: list[str]) -> dict[str, object]:
-    normalized_row = _normalize_row_keys(row)
-    service_name = _pick_value(normalized_row, "service_name")
-    google_app_id = normalize_app_id(_pick_value(normalized_row, "google_app_id"))
-    apple_app_id = normalize_app_id(_pick_value(normalized_row, "apple_app_id"))
-    google_link = _pick_value(normalized_row, "google_link")
-    apple_link = _pick_value(normalized_row, "apple_link")
+def _build_target(pick: Callable[[str], str], default_markets: list[str]) -> dict[str, object]:
+    service_name = pick("service_name")
+    google_app_id = normalize_app_id(pick("google_app_id"))
+    apple_app_id = normalize_app_id(pick("apple_app_id"))
+    google_link = pick("google_link")
+    apple_link = pick("apple_link")
 
     if not google_app_id:
         google_app_id = parse_google_app_id_from_link(google_link)
     if not apple_app_id:
         apple_app_id = parse_apple_app_id_from_link(apple_link)
 
-    markets_value = _pick_value(normalized_row, "markets")
+    markets_value = pick("markets")
     markets = normalize_markets(markets_value, default_markets)
 
     if not service_name:
@@ -95,25 +126,90 @@ def normalize_target_row(row: dict[object, object], default_markets: list[str])
     }
 
 
-def load_targets_from_excel(input_path: Path, default_markets: list[str]) -> list[dict[str, object]]:
+def normalize_target_row(row: dict[object, object], default_markets: list[str]) -> dict[str, object]:
+    normalized_row = _normalize_row_keys(row)
+    return _build_target(lambda logical_name: _pick_value(normalized_row, logical_name), default_markets)
+
+
+def resolve_column_aliases(header: list[object]) -> dict[str, list[int]]:
+    """Map each logical column to its header positions, in alias priority order."""
+    # Later duplicates win, matching dict-based row normalisation.
+    positions = {to_text(name).lower(): index for index, name in enumerate(header)}
+    return {
+        logical_name: [positions[alias.lower()] for alias in aliases if alias.lower() in positions]
+        for logical_name, aliases in COLUMN_ALIASES.items()
+    }
+
+
+def _target_from_values(
+    values: tuple[object, ...] | list[object],
+    resolved: dict[str, list[int]],
+    default_markets: list[str],
+) -> dict[str, object]:
+    def pick(logical_name: str) -> str:
+        for index in resolved.get(logical_name, []):
+            value = to_text(values[index]) if index < len(values) else ""
+            if value:
+                return value
+        return ""
+
+    return _build_target(pick, default_markets)
+
+
+def _iter_target_sheet(input_path: Path) -> Iterator[tuple[object, ...] | list[object]]:
+    suffix = input_path.suffix.lower()
+    if suffix in TARGET_TEXT_DELIMITERS:
+        with input_path.open("r", newline="", encoding="utf-8-sig") as handle:
+            yield from csv.reader(handle, delimiter=TARGET_TEXT_DELIMITERS[suffix])
+        return
+
+    if suffix in TARGET_XLSX_SUFFIXES:
+        try:
+            from openpyxl import load_workbook
+        except ImportError as exc:
+            raise RuntimeError("openpyxl is required to read input Excel files") from exc
+        workbook = load_workbook(input_path, read_only=True, data_only=True)
+        try:
+            # Like pandas.read_excel, read the first sheet rather than the active one.
+            yield from workbook.worksheets[0].iter_rows(values_only=True)
+        finally:
+            workbook.close()
+        return
+
+    # Legacy formats such as .xls still go through pandas.
     try:
         import pandas as pd
     except ImportError as exc:
         raise RuntimeError("pandas is required to read input Excel files") from exc
+    frame = pd.read_excel(input_path, dtype=object)
+    yield list(frame.columns)
+    yield from frame.itertuples(index=False, name=None)
+
 
+def load_targets(input_path: Path, default_markets: list[str]) -> list[dict[str, object]]:
+    """Load app targets from an .xlsx/.xlsm sheet or a CSV/TSV list (first row is the header)."""
     if not input_path.exists():
         raise FileNotFoundError(f"input file does not exist: {input_path}")
 
-    frame = pd.read_excel(input_path)
+    rows = _iter_target_sheet(input_path)
+    header = next(rows, None)
+    if header is None:
+        return []
+    resolved = resolve_column_aliases(list(header))
+
     targets: list[dict[str, object]] = []
-    for _, row in frame.iterrows():
-        target = normalize_target_row(row.to_dict(), default_markets)
+    for values in rows:
+        target = _target_from_values(values, resolved, default_markets)
         if not target["google_app_id"] and not target["apple_app_id"]:
             continue
         targets.append(target)
     return targets
 
 
+def load_targets_from_excel(input_path: Path, default_markets: list[str]) -> list[dict[str, object]]:
+    return load_targets(input_path, default_markets)
+
+
 def _build_db_rows(
     *,
     timestamp: str,
@@ -123,7 +219,7 @@ def _build_db_rows(
     app_id: str,
     country: str,
     language: str,
-    reviews: list[NormalizedReview],
+    reviews: Iterable[NormalizedReview],
 ) -> list[dict[str, str]]:
     rows: list[dict[str, str]] = []
     for review in reviews:
@@ -149,43 +245,11 @@ def _build_db_rows(
     return rows
 
 
-def write_reviews_xlsx(path: Path, rows: list[dict[str, str]], sheet_name: str) -> None:
-    try:
-        from openpyxl import Workbook
-        from openpyxl.styles import Alignment, Border, Font, PatternFill, Side
-    except ImportError as exc:
-        raise RuntimeError("openpyxl is required when --xlsx is enabled") from exc
-
-    path.parent.mkdir(parents=True, exist_ok=True)
-    workbook = Workbook()
-    sheet = workbook.active
-    sheet.title = sanitize_filename(sheet_name)[:31]
-
-    header_font = Font(name="Calibri", size=10, bold=True, color="FFFFFF")
-    body_font = Font(name="Calibri", size=10, color="000000")
-    header_fill = PatternFill(start_color="003366", end_color="003366", fill_type="solid")
-    border = Border(
-        left=Side(style="thin"),
-        right=Side(style="thin"),
-        top=Side(style="thin"),
-        bottom=Side(style="thin"),
-    )
-
-    sheet.append(XLSX_COLUMNS)
-    for cell in sheet[1]:
-        cell.font = header_font
-        cell.fill = header_fill
-        cell.border = border
-
-    for row in rows:
-        sheet.append([row.get(column, "") for column in XLSX_COLUMNS])
+class ReviewWorkbook:
+    """Write-only xlsx writer: rows are styled and streamed to disk as they are appended.
 
-    for row in sheet.iter_rows(min_row=2):
-        for cell in row:
-            cell.font = body_font
-            cell.border = border
-            if cell.column in {7, 8}:
-                cell.alignment = Alignment(wrap_text=True, vertical="top")
+    Sheets are created on first use, so one workbook can hold a single job or a whole run.
+    """
 
     widths = {
         "A": 24,
@@ -200,10 +264,238 @@ def write_reviews_xlsx(path: Path, rows: list[dict[str, str]], sheet_name: str)
         "J": 22,
         "K": 50,
     }
-    for column, width in widths.items():
-        sheet.column_dimensions[column].width = width
-    sheet.auto_filter.ref = sheet.dimensions
-    workbook.save(path)
+    wrapped_columns = {"title", "content"}
+
+    def __init__(self, path: Path, sheet_name: str | None = None) -> None:
+        try:
+            from openpyxl import Workbook
+            from openpyxl.cell import WriteOnlyCell
+            from openpyxl.styles import Alignment, Border, Font, NamedStyle, PatternFill, Side
+            from openpyxl.utils import get_column_letter
+        except ImportError as exc:
+            raise RuntimeError("openpyxl is required when --xlsx is enabled") from exc
+
+        self.path = path
+        self._cell_type = WriteOnlyCell
+        self._last_column = get_column_letter(len(XLSX_COLUMNS))
+        self._workbook = Workbook(write_only=True)
+        self._sheets: dict[str, Any] = {}
+        self._row_counts: dict[str, int] = {}
+        self._default_sheet = sheet_name
+
+        border = Border(
+            left=Side(style="thin"),
+            right=Side(style="thin"),
+            top=Side(style="thin"),
+            bottom=Side(style="thin"),
+        )
+        body_font = Font(name="Calibri", size=10, color="000000")
+        # Registered once per workbook; each cell then references a style by name instead of
+        # building its own font/border/alignment objects.
+        header = NamedStyle(
+            name="review_header",
+            font=Font(name="Calibri", size=10, bold=True, color="FFFFFF"),
+            fill=PatternFill(start_color="003366", end_color="003366", fill_type="solid"),
+            border=border,
+        )
+        body = NamedStyle(name="review_body", font=body_font, border=border)
+        wrapped = NamedStyle(
+            name="review_body_wrapped",
+            font=body_font,
+            border=border,
+            alignment=Alignment(wrap_text=True, vertical="top"),
+        )
+        for style in (header, body, wrapped):
+            self._workbook.add_named_style(style)
+        self._header_style = header.name
+        self._column_styles = [
+            wrapped.name if column in self.wrapped_columns else body.name for column in XLSX_COLUMNS
+        ]
+        if sheet_name:
+            self._sheet(sheet_name)
+
+    def _sheet(self, sheet_name: str) -> Any:
+        title = sanitize_filename(sheet_name)[:31]
+        sheet = self._sheets.get(title)
+        if sheet is None:
+            sheet = self._sheets[title] = self._workbook.create_sheet(title=title)
+            self._row_counts[title] = 0
+            # Write-only sheets emit column widths with the sheet header, i.e. before the first row.
+            for column, width in self.widths.items():
+                sheet.column_dimensions[column].width = width
+            sheet.append([self._styled_cell(sheet, column, self._header_style) for column in XLSX_COLUMNS])
+        return sheet
+
+    def _styled_cell(self, sheet: Any, value: object, style_name: str) -> Any:
+        cell = self._cell_type(sheet, value=value)
+        cell.style = style_name
+        return cell
+
+    def append(self, rows: Iterable[dict[str, str]], sheet_name: str | None = None) -> None:
+        name = sheet_name or self._default_sheet
+        if not name:
+            raise ValueError("sheet_name is required for a workbook without a default sheet")
+        sheet = self._sheet(name)
+        title = sheet.title
+        for row in rows:
+            sheet.append(
+                [
+                    self._styled_cell(sheet, row.get(column, ""), style_name)
+                    for column, style_name in zip(XLSX_COLUMNS, self._column_styles)
+                ]
+            )
+            self._row_counts[title] += 1
+
+    def save(self) -> None:
+        for title, sheet in self._sheets.items():
+            sheet.auto_filter.ref = f"A1:{self._last_column}{self._row_counts[title] + 1}"
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._workbook.save(self.path)
+
+
+def open_reviews_xlsx(path: Path, sheet_name: str | None = None) -> ReviewWorkbook:
+    return ReviewWorkbook(path, sheet_name)
+
+
+def write_reviews_xlsx(path: Path, rows: Iterable[dict[str, str]], sheet_name: str) -> None:
+    workbook = open_reviews_xlsx(path, sheet_name)
+    workbook.append(rows)
+    workbook.save()
+
+
+def consolidated_xlsx_path(out_dir: Path, date_token: str) -> Path:
+    return out_dir / f"app_reviews_{date_token}.xlsx"
+
+
+class CollectionJob(NamedTuple):
+    service_name: str
+    store: str
+    app_id: str
+    country: str
+    language: str
+
+
+class JobResult(NamedTuple):
+    collected: int = 0
+    inserted: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    error: str = ""
+
+
+def build_collection_jobs(targets: list[dict[str, object]]) -> list[CollectionJob]:
+    jobs: list[CollectionJob] = []
+    for target in targets:
+        service_name = to_text(target.get("service_name"))
+        google_app_id = to_text(target.get("google_app_id"))
+        apple_app_id = to_text(target.get("apple_app_id"))
+        markets = [to_text(code).upper() for code in target.get("markets", []) if to_text(code)]
+        if not markets:
+            markets = DEFAULT_MARKETS[:]
+        for country in markets:
+            language = default_language_for_country(country)
+            if google_app_id:
+                jobs.append(CollectionJob(service_name, "google_play", google_app_id, country, language))
+            if apple_app_id:
+                jobs.append(CollectionJob(service_name, "apple_app_store", apple_app_id, country, language))
+    return jobs
+
+
+def default_rate_limiters() -> dict[str, RateLimiter]:
+    return {
+        store: RateLimiter(max_concurrent=max_concurrent, min_interval_sec=min_interval_sec)
+        for store, (max_concurrent, min_interval_sec) in STORE_RATE_LIMITS.items()
+    }
+
+
+def _iter_chunks(items: Iterable[Any], size: int) -> Iterator[list[Any]]:
+    iterator = iter(items)
+    while chunk := list(itertools.islice(iterator, size)):
+        yield chunk
+
+
+class _JobSink:
+    """Writer-thread state for one job: upserts each streamed chunk and appends it to the xlsx."""
+
+    def __init__(
+        self,
+        *,
+        job: CollectionJob,
+        date_iso: str,
+        save_xlsx: bool,
+        out_dir: Path,
+        watermark: ReviewWatermark | None,
+        shared_workbook: Callable[[], ReviewWorkbook] | None = None,
+    ) -> None:
+        self.job = job
+        self.date_iso = date_iso
+        self.save_xlsx = save_xlsx
+        self.out_dir = out_dir
+        self.watermark = watermark
+        self.timestamp = dt.datetime.now().isoformat(timespec="seconds")
+        self.collected = 0
+        self.inserted = 0
+        self.updated = 0
+        self.unchanged = 0
+        self.newest: NormalizedReview | None = None
+        self.shared_workbook = shared_workbook
+        self.workbook: ReviewWorkbook | None = None
+
+    def write(self, reviews: list[NormalizedReview]) -> None:
+        job = self.job
+        db_rows = _build_db_rows(
+            timestamp=self.timestamp,
+            date_iso=self.date_iso,
+            service_name=job.service_name,
+            store=job.store,
+            app_id=job.app_id,
+            country=job.country,
+            language=job.language,
+            reviews=reviews,
+        )
+        stats = upsert_app_reviews(db_rows)
+        self.collected += len(reviews)
+        self.inserted += int(stats["inserted"])
+        self.updated += int(stats["updated"])
+        self.unchanged += int(stats["unchanged"])
+        self.newest = newest_review([*([self.newest] if self.newest else []), *reviews])
+        if self.save_xlsx and self.shared_workbook is not None:
+            self.shared_workbook().append(db_rows, sheet_name=f"{job.store}_{job.country}")
+        elif self.save_xlsx:
+            if self.workbook is None:
+                output_name = f"{sanitize_filename(job.service_name)}_{job.store}_{job.app_id}_{job.country}.xlsx"
+                self.workbook = open_reviews_xlsx(
+                    self.out_dir / output_name,
+                    sheet_name=f"{job.service_name}_{job.country}",
+                )
+            self.workbook.append(db_rows)
+
+    def finish(self, complete: bool = True) -> JobResult:
+        # Only a fully consumed stream may advance the watermark; a stream cut short (by an error or
+        # the per-app/country limit) leaves unread reviews between the old watermark and the newest one.
+        newest = self.newest
+        if (
+            complete
+            and newest is not None
+            and newest["review_updated_at"]
+            and is_newer_than_watermark(newest, self.watermark)
+        ):
+            update_app_review_watermark(
+                store=self.job.store,
+                app_id=self.job.app_id,
+                country=self.job.country,
+                review_updated_at=newest["review_updated_at"],
+                review_id=newest["review_id"],
+                updated_at=self.timestamp,
+            )
+        if self.workbook is not None:
+            self.workbook.save()
+        return JobResult(
+            collected=self.collected,
+            inserted=self.inserted,
+            updated=self.updated,
+            unchanged=self.unchanged,
+        )
 
 
 def run_collection(
@@ -214,96 +506,184 @@ def run_collection(
     limit_per_app_country: int,
     save_xlsx: bool,
     out_dir: Path,
-    google_collector: Callable[[str, str, str, int], list[NormalizedReview]] = collect_google_reviews,
-    apple_collector: Callable[[str, str, str, int], list[NormalizedReview]] = collect_apple_reviews,
+    google_collector: Callable[..., Iterable[NormalizedReview]] = iter_google_reviews,
+    apple_collector: Callable[..., Iterable[NormalizedReview]] = iter_apple_reviews,
+    workers: int = DEFAULT_WORKERS,
+    rate_limiters: dict[str, RateLimiter] | None = None,
+    incremental: bool = False,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    xlsx_layout: str = "per_job",
 ) -> dict[str, object]:
+    if xlsx_layout not in XLSX_LAYOUTS:
+        raise ValueError(f"xlsx_layout must be one of {', '.join(XLSX_LAYOUTS)}")
     os.environ["KTRIPPEDIA_DATA_DIR"] = str(root / "data")
     date_iso = date_token_to_iso(normalize_date_token(date_token))
+    collectors = {"google_play": google_collector, "apple_app_store": apple_collector}
+    limiters = rate_limiters if rate_limiters is not None else default_rate_limiters()
+    jobs = build_collection_jobs(targets)
+    results = [JobResult() for _ in jobs]
+    watermarks = fetch_app_review_watermarks()
+
+    def _watermark(job: CollectionJob) -> ReviewWatermark | None:
+        stored = watermarks.get((job.store, job.app_id, job.country))
+        if stored is None:
+            return None
+        return {"review_updated_at": stored["review_updated_at"], "review_id": stored["review_id"]}
+
+    # Collectors fan out across the pool and stream chunks to a single writer thread that owns every
+    # SQLite/xlsx write. The queue is bounded so a slow writer throttles collectors instead of
+    # letting fetched reviews pile up in memory. An (index, None, error, capped) item ends a job's
+    # stream; capped means the limit was reached, so the stream may not have been read to the end.
+    write_queue: queue.Queue[tuple[int, list[NormalizedReview] | None, str, bool] | None] = queue.Queue(
+        maxsize=max(1, workers) * 2
+    )
 
-    summary: dict[str, object] = {
-        "apps_total": len(targets),
-        "apps_processed": 0,
-        "rows_collected": 0,
-        "rows_inserted": 0,
-        "rows_updated": 0,
-        "by_store_country": defaultdict(int),
-        "errors": [],
-    }
-
-    for target in targets:
-        service_name = to_text(target.get("service_name"))
-        google_app_id = to_text(target.get("google_app_id"))
-        apple_app_id = to_text(target.get("apple_app_id"))
-        markets = [to_text(code).upper() for code in target.get("markets", []) if to_text(code)]
-        if not markets:
-            markets = DEFAULT_MARKETS[:]
-
-        summary["apps_processed"] = int(summary["apps_processed"]) + 1
-        for country in markets:
-            language = default_language_for_country(country)
-
-            def _save(store: str, app_id: str, reviews: list[NormalizedReview]) -> None:
-                if not reviews:
-                    return
-                timestamp = dt.datetime.now().isoformat(timespec="seconds")
-                db_rows = _build_db_rows(
-                    timestamp=timestamp,
-                    date_iso=date_iso,
-                    service_name=service_name,
-                    store=store,
-                    app_id=app_id,
-                    country=country,
-                    language=language,
-                    reviews=reviews,
-                )
-                stats = upsert_app_reviews(db_rows)
-                summary["rows_collected"] = int(summary["rows_collected"]) + len(reviews)
-                summary["rows_inserted"] = int(summary["rows_inserted"]) + int(stats["inserted"])
-                summary["rows_updated"] = int(summary["rows_updated"]) + int(stats["updated"])
-                key = f"{store}:{country}"
-                summary["by_store_country"][key] += len(reviews)
-
-                if save_xlsx:
-                    output_name = f"{sanitize_filename(service_name)}_{store}_{app_id}_{country}.xlsx"
-                    write_reviews_xlsx(out_dir / output_name, db_rows, sheet_name=f"{service_name}_{country}")
-
-            if google_app_id:
-                try:
-                    google_reviews = google_collector(
-                        google_app_id,
-                        country,
-                        language,
-                        limit_per_app_country,
+    def _job_error(job: CollectionJob, exc: Exception) -> str:
+        return f"{job.store}:{job.service_name}:{job.country}:{exc}"
+
+    run_workbook: list[ReviewWorkbook] = []
+    run_errors: list[str] = []
+
+    def _run_workbook() -> ReviewWorkbook:
+        if not run_workbook:
+            workbook = open_reviews_xlsx(consolidated_xlsx_path(out_dir, normalize_date_token(date_token)))
+            # Create sheets up front in job order so the sheet order does not depend on which
+            # collector finishes first.
+            for sheet_name in dict.fromkeys(f"{job.store}_{job.country}" for job in jobs):
+                workbook.append([], sheet_name=sheet_name)
+            run_workbook.append(workbook)
+        return run_workbook[0]
+
+    shared_workbook = _run_workbook if save_xlsx and xlsx_layout == "consolidated" else None
+
+    def _writer() -> None:
+        sinks: dict[int, _JobSink] = {}
+        failed: set[int] = set()
+        while True:
+            item = write_queue.get()
+            if item is None:
+                if run_workbook:
+                    try:
+                        run_workbook[0].save()
+                    except Exception as exc:
+                        run_errors.append(f"xlsx:{run_workbook[0].path}:{exc}")
+                return
+            index, reviews, error, capped = item
+            job = jobs[index]
+            if index in failed:
+                continue
+            try:
+                if reviews is None:
+                    sink = sinks.pop(index, None)
+                    if error:
+                        results[index] = JobResult(
+                            collected=sink.collected if sink else 0,
+                            inserted=sink.inserted if sink else 0,
+                            updated=sink.updated if sink else 0,
+                            unchanged=sink.unchanged if sink else 0,
+                            error=error,
+                        )
+                    elif sink is not None:
+                        results[index] = sink.finish(complete=not capped)
+                    continue
+                sink = sinks.get(index)
+                if sink is None:
+                    sink = sinks[index] = _JobSink(
+                        job=job,
+                        date_iso=date_iso,
+                        save_xlsx=save_xlsx,
+                        out_dir=out_dir,
+                        watermark=_watermark(job),
+                        shared_workbook=shared_workbook,
                     )
-                    _save("google_play", google_app_id, google_reviews)
-                except Exception as exc:
-                    summary["errors"].append(f"google_play:{service_name}:{country}:{exc}")
-
-            if apple_app_id:
-                try:
-                    apple_reviews = apple_collector(
-                        apple_app_id,
-                        country,
-                        language,
+                sink.write(reviews)
+            except Exception as exc:
+                failed.add(index)
+                sinks.pop(index, None)
+                results[index] = JobResult(error=_job_error(job, exc))
+
+    def _collect(index: int) -> None:
+        job = jobs[index]
+        error = ""
+        collected = 0
+        try:
+            collector = collectors[job.store]
+            with limiters.get(job.store, nullcontext()):
+                if incremental:
+                    reviews = collector(
+                        job.app_id,
+                        job.country,
+                        job.language,
                         limit_per_app_country,
+                        since=_watermark(job),
                     )
-                    _save("apple_app_store", apple_app_id, apple_reviews)
-                except Exception as exc:
-                    summary["errors"].append(f"apple_app_store:{service_name}:{country}:{exc}")
+                else:
+                    reviews = collector(job.app_id, job.country, job.language, limit_per_app_country)
+                for chunk in _iter_chunks(reviews, max(1, chunk_size)):
+                    collected += len(chunk)
+                    write_queue.put((index, chunk, "", False))
+        except Exception as exc:
+            error = _job_error(job, exc)
+        write_queue.put((index, None, error, collected >= limit_per_app_country > 0))
+
+    # Every streamed chunk marks app_reviews dirty; without a background exporter each mark would
+    # rewrite the whole CSV, so defer them and export once when the run's writes are done.
+    with suppress_exports():
+        writer = threading.Thread(target=_writer, name="review-writer")
+        writer.start()
+        try:
+            with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="review-collector") as pool:
+                list(pool.map(_collect, range(len(jobs))))
+        finally:
+            write_queue.put(None)
+            writer.join()
+
+    by_store_country: dict[str, int] = defaultdict(int)
+    errors: list[str] = []
+    for job, result in zip(jobs, results):
+        if result.error:
+            errors.append(result.error)
+        elif result.collected:
+            by_store_country[f"{job.store}:{job.country}"] += result.collected
+    errors.extend(run_errors)
 
-    summary["by_store_country"] = dict(summary["by_store_country"])
-    return summary
+    return {
+        "apps_total": len(targets),
+        "apps_processed": len(targets),
+        "rows_collected": sum(result.collected for result in results),
+        "rows_inserted": sum(result.inserted for result in results),
+        "rows_updated": sum(result.updated for result in results),
+        "rows_unchanged": sum(result.unchanged for result in results),
+        "by_store_country": dict(by_store_country),
+        "errors": errors,
+    }
 
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Fetch Google + Apple reviews in one run")
     parser.add_argument("--root", default=str(DEFAULT_ROOT), help="Project root")
-    parser.add_argument("--input", default="data/app_review_targets.xlsx", help="Input Excel path")
+    parser.add_argument(
+        "--input",
+        default="data/app_review_targets.xlsx",
+        help="Input target list (.xlsx/.xlsm, .csv or .tsv)",
+    )
     parser.add_argument("--date", default=dt.datetime.now().strftime("%Y%m%d"), help="Tracking date YYYYMMDD")
     parser.add_argument("--markets", default="KR,US,JP", help="Default markets, comma separated")
     parser.add_argument("--limit-per-app-country", type=int, default=0, help="0 means unlimited")
     parser.add_argument("--xlsx", action="store_true", help="Export per app/store/country xlsx files")
     parser.add_argument("--out-dir", default="data/reviews", help="XLSX output directory")
+    parser.add_argument(
+        "--xlsx-layout",
+        choices=XLSX_LAYOUTS,
+        default="per_job",
+        help="per_job: one file per app/store/country; consolidated: one file per run, sheet per store/country",
+    )
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="Concurrent collector workers")
+    parser.add_argument(
+        "--full-refresh",
+        action="store_true",
+        help="Ignore stored watermarks and refetch the full review history",
+    )
     return parser.parse_args()
 
 
@@ -315,7 +695,7 @@ def main() -> None:
     if not input_path.is_absolute():
         input_path = root / input_path
 
-    targets = load_targets_from_excel(input_path=input_path, default_markets=default_markets)
+    targets = load_targets(input_path=input_path, default_markets=default_markets)
     summary = run_collection(
         root=root,
         date_token=args.date,
@@ -323,6 +703,9 @@ def main() -> None:
         limit_per_app_country=max(0, int(args.limit_per_app_country)),
         save_xlsx=bool(args.xlsx),
         out_dir=(root / args.out_dir) if not Path(args.out_dir).is_absolute() else Path(args.out_dir),
+        workers=max(1, int(args.workers)),
+        incremental=not bool(args.full_refresh),
+        xlsx_layout=args.xlsx_layout,
     )
 
     print(f"Targets loaded: {summary['apps_total']}")
@@ -330,6 +713,7 @@ def main() -> None:
     print(f"Rows collected: {summary['rows_collected']}")
     print(f"Rows inserted: {summary['rows_inserted']}")
     print(f"Rows updated: {summary['rows_updated']}")
+    print(f"Rows unchanged: {summary['rows_unchanged']}")
     for key, count in sorted(dict(summary["by_store_country"]).items()):
         print(f"{key}: {count}")
     if summary["errors"]:
@@ -4,12 +4,13 @@
 from __future__ import annotations
 
 import argparse
+import os
 from pathlib import Path
 import sys
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
-from src.weekly_validation_summary import run_weekly_summary
+from src.weekly_validation_summary import SUMMARY_SOURCES, run_weekly_summary, run_weekly_trend
 
 
 def main() -> None:
@@ -18,11 +19,40 @@ def main() -> None:
     parser.add_argument("--start", default="20260216", help="Start date YYYYMMDD")
     parser.add_argument("--end", default="20260222", help="End date YYYYMMDD")
     parser.add_argument("--out", default="reports/weekly_validation_summary.md", help="Output markdown path")
+    parser.add_argument(
+        "--source",
+        choices=SUMMARY_SOURCES,
+        default="auto",
+        help="Read SQLite or the CSV exports (auto: SQLite when data/ktrippedia.db exists)",
+    )
+    parser.add_argument(
+        "--trend-weeks",
+        type=int,
+        default=0,
+        help="Also write a trend report for this many weekly windows ending at --end",
+    )
+    parser.add_argument("--trend-out", default="reports/weekly_validation_trend.md", help="Trend markdown path")
     args = parser.parse_args()
 
     root = Path(args.root).resolve()
-    out_path = run_weekly_summary(root=root, start_token=args.start, end_token=args.end, out_relative_path=args.out)
+    os.environ["KTRIPPEDIA_DATA_DIR"] = str(root / "data")
+    out_path = run_weekly_summary(
+        root=root,
+        start_token=args.start,
+        end_token=args.end,
+        out_relative_path=args.out,
+        source=args.source,
+    )
     print(f"Generated {out_path}")
+    if args.trend_weeks > 0:
+        trend_path = run_weekly_trend(
+            root=root,
+            end_token=args.end,
+            weeks=args.trend_weeks,
+            out_relative_path=args.trend_out,
+            source=args.source,
+        )
+        print(f"Generated {trend_path}")
 
 
 if __name__ == "__main__":
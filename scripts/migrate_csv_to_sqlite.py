@@ -4,7 +4,10 @@
 from __future__ import annotations
 
 import argparse
+import logging
+import os
 import sys
+import time
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
@@ -16,12 +19,33 @@ def main() -> None:
     parser = argparse.ArgumentParser(description="Migrate CSV datasets into SQLite")
     parser.add_argument("--root", default=".", help="Project root")
     parser.add_argument("--dry-run", action="store_true", help="Do not write; print counts only")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Processes parsing dated event CSVs in parallel (1 parses sequentially)",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Re-read every source file, ignoring the migration manifest (analytics events are appended again)",
+    )
     args = parser.parse_args()
 
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
     root = Path(args.root).resolve()
-    stats = run_migration(root=root, dry_run=bool(args.dry_run))
+    started = time.perf_counter()
+    stats = run_migration(
+        root=root,
+        dry_run=bool(args.dry_run),
+        workers=max(1, int(args.workers)),
+        force=bool(args.force),
+    )
+    elapsed = time.perf_counter() - started
     for name, count in stats.items():
         print(f"{name}: {count}")
+    total = sum(stats.values())
+    print(f"elapsed: {elapsed:.2f}s ({total / elapsed if elapsed else 0.0:.0f} rows/sec)")
 
 
 if __name__ == "__main__":
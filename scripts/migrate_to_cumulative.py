@@ -3,12 +3,18 @@
 
 from __future__ import annotations
 
+import argparse
 import csv
 import hashlib
 import re
+import sys
 from collections import OrderedDict
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.csv_to_sqlite_migration import map_sources
+
 
 CSV_PATTERNS = {
     "trip_safety.csv": "*_trip_safety.csv",
@@ -34,6 +40,12 @@ def read_rows(path: Path) -> tuple[list[str], list[dict[str, str]]]:
     return fields, rows
 
 
+def read_source_values(path: Path) -> tuple[list[str], list[tuple[str, ...]]]:
+    """Read a source CSV into its header and compact per-row tuples (cheap to pass between processes)."""
+    fields, rows = read_rows(path)
+    return fields, [tuple(row.get(f) or "" for f in fields) for row in rows]
+
+
 def write_rows(path: Path, fields: list[str], rows: list[dict[str, str]]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     with path.open("w", newline="", encoding="utf-8") as handle:
@@ -109,7 +121,7 @@ def move_to_archive(path: Path, archive_root: Path) -> None:
     path.rename(target)
 
 
-def migrate_csvs(root: Path) -> None:
+def migrate_csvs(root: Path, workers: int = 1) -> None:
     data_dir = root / "data"
     archive_dir = data_dir / "archive"
 
@@ -128,11 +140,10 @@ def migrate_csvs(root: Path) -> None:
             all_fields = existing_fields
             all_rows.extend(existing_rows)
 
-        for path in matched:
-            fields, rows = read_rows(path)
+        for fields, values in map_sources(read_source_values, matched, workers):
             if not all_fields and fields:
                 all_fields = fields
-            all_rows.extend(rows)
+            all_rows.extend(dict(zip(fields, row)) for row in values)
 
         if not all_fields:
             continue
@@ -164,8 +175,17 @@ def archive_dated_reports_and_logs(root: Path) -> None:
 
 
 def main() -> None:
+    parser = argparse.ArgumentParser(description="Merge dated CSV artifacts into cumulative files")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Processes parsing dated CSVs in parallel (default 1 parses sequentially; the merge stays serial)",
+    )
+    args = parser.parse_args()
+
     root = Path(__file__).resolve().parents[1]
-    migrate_csvs(root)
+    migrate_csvs(root, workers=max(1, int(args.workers)))
     archive_dated_reports_and_logs(root)
     print("Migration completed: cumulative files ready and dated files archived.")
 
@@ -11,7 +11,13 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
-from src.storage import fetch_metrics_rows, normalize_date_token, upsert_table_rows, date_token_to_iso
+from src.storage import (
+    date_token_to_iso,
+    fetch_community_source_rows,
+    fetch_metrics_rows,
+    normalize_date_token,
+    upsert_table_rows,
+)
 
 
 def main() -> None:
@@ -27,26 +33,14 @@ def main() -> None:
     date_iso = date_token_to_iso(date_token)
 
     outreach_rows = fetch_metrics_rows("community_outreach_log", date_iso)
-    event_rows = fetch_metrics_rows("landing_events", date_iso)
 
     metrics: dict[tuple[str, str], dict[str, int]] = {}
-    for event in event_rows:
-        if str(event.get("channel", "")).strip() != "community":
-            continue
-        src = str(event.get("source_id", "")).strip() or ""
-        post_id = str(event.get("post_id", "")).strip() or ""
+    for source_row in fetch_community_source_rows(date_iso, date_iso):
+        src = str(source_row.get("source_id", "")).strip()
+        post_id = str(source_row.get("post_id", "")).strip()
         if not post_id:
             continue
-        key = (src, post_id)
-        if key not in metrics:
-            metrics[key] = {"visitors": 0, "cta": 0, "leads": 0}
-        event_type = str(event.get("event_type", "")).strip()
-        if event_type == "visit":
-            metrics[key]["visitors"] += 1
-        elif event_type == "cta_click":
-            metrics[key]["cta"] += 1
-        elif event_type == "lead_submit":
-            metrics[key]["leads"] += 1
+        metrics[(src, post_id)] = {field: int(source_row.get(field) or 0) for field in ("visitors", "cta", "leads")}
 
     updates = []
     for row in outreach_rows:
@@ -2,23 +2,214 @@
 
 from __future__ import annotations
 
+import atexit
 import datetime as dt
 import json
 import logging
 import os
+import queue
+import threading
+import time
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Callable
 from urllib.error import HTTPError, URLError
 from urllib import parse, request
 
 from src.storage import append_analytics_event, date_token_to_iso, normalize_date_token
 
 
+GA4_ENDPOINT = "https://www.google-analytics.com/mp/collect"
+DEFAULT_QUEUE_SIZE = 1000
+DEFAULT_BATCH_INTERVAL_MS = 1000
+DEFAULT_FLUSH_TIMEOUT_SEC = 5
+MAX_EVENTS_PER_REQUEST = 25
+RETRYABLE_HTTP_CODES = {408, 429, 500, 502, 503, 504}
+
+
+class GA4DispatchQueue:
+    """Background sender; each job returns whether its hit was delivered."""
+
+    def __init__(self, maxsize: int = DEFAULT_QUEUE_SIZE) -> None:
+        self._jobs: queue.Queue[Callable[[], bool]] = queue.Queue(maxsize=maxsize)
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._unfinished = 0
+        self._stats = {"enqueued": 0, "delivered": 0, "dropped": 0, "failed": 0}
+        self._thread = threading.Thread(target=self._run, name="ga4-dispatch", daemon=True)
+        self._thread.start()
+
+    def submit(self, job: Callable[[], bool]) -> bool:
+        with self._lock:
+            try:
+                self._jobs.put_nowait(job)
+            except queue.Full:
+                self._stats["dropped"] += 1
+                return False
+            self._stats["enqueued"] += 1
+            self._unfinished += 1
+        return True
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait until every submitted job has run; False if ``timeout`` seconds passed first."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._idle:
+            while self._unfinished:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._idle.wait(remaining)
+        return True
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {**self._stats, "pending": self._jobs.qsize()}
+
+    def _count(self, key: str) -> None:
+        with self._lock:
+            self._stats[key] += 1
+
+    def _run(self) -> None:
+        while True:
+            job = self._jobs.get()
+            try:
+                self._count("delivered" if job() else "failed")
+            except Exception:
+                self._count("failed")
+                logging.exception("GA4 dispatch job failed")
+            finally:
+                with self._idle:
+                    self._unfinished -= 1
+                    self._idle.notify_all()
+
+
+@dataclass
+class _PendingBatch:
+    tracker: GA4Tracker
+    events: list[dict[str, Any]]
+    deadline: float
+
+
+class GA4EventBatcher:
+    def __init__(self) -> None:
+        self._cond = threading.Condition()
+        self._pending: dict[tuple[str, ...], _PendingBatch] = {}
+        self._thread = threading.Thread(target=self._run, name="ga4-batcher", daemon=True)
+        self._thread.start()
+
+    def add(self, tracker: GA4Tracker, event: dict[str, Any]) -> None:
+        # Date, channel and language are part of the key because each batch is logged as a single row.
+        key = (
+            tracker.endpoint,
+            tracker.measurement_id,
+            tracker.api_secret,
+            str(event["client_id"]),
+            str(event["date_token"]),
+            str(event["channel"]),
+            str(event["language"]),
+        )
+        ready: _PendingBatch | None = None
+        with self._cond:
+            batch = self._pending.get(key)
+            if batch is None:
+                batch = _PendingBatch(tracker, [], time.monotonic() + tracker.batch_interval_ms / 1000)
+                self._pending[key] = batch
+                self._cond.notify()
+            batch.events.append(event)
+            if len(batch.events) >= tracker.effective_batch_size():
+                ready = self._pending.pop(key)
+        if ready is not None:
+            ready.tracker._submit(ready.events)
+
+    def flush(self) -> None:
+        with self._cond:
+            batches = list(self._pending.values())
+            self._pending.clear()
+        for batch in batches:
+            batch.tracker._submit(batch.events)
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                now = time.monotonic()
+                due = [key for key, batch in self._pending.items() if batch.deadline <= now]
+                expired = [self._pending.pop(key) for key in due]
+                if not expired:
+                    timeout = min((b.deadline for b in self._pending.values()), default=now + 60.0) - now
+                    self._cond.wait(timeout)
+                    continue
+            for batch in expired:
+                batch.tracker._submit(batch.events)
+
+
+_DISPATCH_LOCK = threading.Lock()
+_dispatch_queue: GA4DispatchQueue | None = None
+_event_batcher: GA4EventBatcher | None = None
+_atexit_registered = False
+
+
+def _env_int(name: str, default: int) -> int:
+    raw = os.getenv(name, "").strip()
+    try:
+        return max(1, int(raw)) if raw else default
+    except ValueError:
+        logging.warning("Invalid %s=%s; fallback to %s", name, raw, default)
+        return default
+
+
+def _flush_at_exit() -> None:
+    # Buffered batches go first so the dispatch queue drains everything that is still pending.
+    # Exit is only delayed up to the deadline; hits still queued after it are abandoned.
+    if _event_batcher is not None:
+        _event_batcher.flush()
+    if _dispatch_queue is not None:
+        timeout = _env_int("GA4_FLUSH_TIMEOUT_SEC", DEFAULT_FLUSH_TIMEOUT_SEC)
+        if not _dispatch_queue.flush(timeout):
+            logging.warning("GA4 flush timed out after %ss; pending=%s", timeout, _dispatch_queue.stats()["pending"])
+
+
+def _register_atexit() -> None:
+    global _atexit_registered
+    if not _atexit_registered:
+        atexit.register(_flush_at_exit)
+        _atexit_registered = True
+
+
+def dispatch_queue() -> GA4DispatchQueue:
+    global _dispatch_queue
+    with _DISPATCH_LOCK:
+        if _dispatch_queue is None:
+            _dispatch_queue = GA4DispatchQueue(maxsize=_env_int("GA4_QUEUE_SIZE", DEFAULT_QUEUE_SIZE))
+            _register_atexit()
+        return _dispatch_queue
+
+
+def event_batcher() -> GA4EventBatcher:
+    global _event_batcher
+    with _DISPATCH_LOCK:
+        if _event_batcher is None:
+            _event_batcher = GA4EventBatcher()
+            _register_atexit()
+        return _event_batcher
+
+
+def _is_retryable(exc: Exception) -> bool:
+    if isinstance(exc, HTTPError):
+        return exc.code in RETRYABLE_HTTP_CODES
+    return isinstance(exc, (URLError, TimeoutError, OSError))
+
+
 @dataclass
 class GA4Tracker:
     measurement_id: str
     api_secret: str
     enabled: bool = True
+    async_dispatch: bool = True
+    max_attempts: int = 3
+    retry_backoff_sec: float = 0.5
+    timeout_sec: float = 4.0
+    batch_size: int = 1
+    batch_interval_ms: int = DEFAULT_BATCH_INTERVAL_MS
+    endpoint: str = GA4_ENDPOINT
 
     @classmethod
     def from_env(cls) -> "GA4Tracker":
@@ -29,8 +220,14 @@ class GA4Tracker:
             measurement_id=measurement_id,
             api_secret=api_secret,
             enabled=enabled,
+            async_dispatch=os.getenv("GA4_ASYNC_DISPATCH", "1").strip() != "0",
+            batch_size=_env_int("GA4_BATCH_SIZE", 1),
+            batch_interval_ms=_env_int("GA4_BATCH_INTERVAL_MS", DEFAULT_BATCH_INTERVAL_MS),
         )
 
+    def effective_batch_size(self) -> int:
+        return max(1, min(self.batch_size, MAX_EVENTS_PER_REQUEST))
+
     def _log_event(
         self,
         *,
@@ -54,6 +251,69 @@ class GA4Tracker:
             payload=json.dumps(payload, ensure_ascii=False),
         )
 
+    def _post(self, payload: dict[str, Any]) -> str:
+        query = parse.urlencode(
+            {
+                "measurement_id": self.measurement_id,
+                "api_secret": self.api_secret,
+            }
+        )
+        url = f"{self.endpoint}?{query}"
+        body = json.dumps(payload).encode("utf-8")
+        req = request.Request(
+            url,
+            data=body,
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        with request.urlopen(req, timeout=self.timeout_sec) as resp:
+            return str(getattr(resp, "status", "200"))
+
+    def _post_with_retry(self, payload: dict[str, Any]) -> str:
+        attempt = 1
+        while True:
+            try:
+                return self._post(payload)
+            except (HTTPError, URLError, TimeoutError, OSError, ValueError) as exc:
+                if attempt >= self.max_attempts or not _is_retryable(exc):
+                    raise
+                delay = self.retry_backoff_sec * (2 ** (attempt - 1))
+                logging.info("GA4 retry attempt=%s delay=%.2fs error=%s", attempt, delay, exc)
+                time.sleep(delay)
+                attempt += 1
+
+    def _deliver(self, events: list[dict[str, Any]]) -> bool:
+        # One Measurement Protocol request (and one analytics_events row) per batch of same-client events.
+        first = events[0]
+        payload = {
+            "client_id": first["client_id"],
+            "events": [item for event in events for item in event["payload"]["events"]],
+        }
+        log_fields = {
+            "date_token": first["date_token"],
+            "event_name": ",".join(str(event["event_name"]) for event in events),
+            "client_id": first["client_id"],
+            "channel": first["channel"],
+            "language": first["language"],
+            "payload": payload,
+        }
+        try:
+            status = self._post_with_retry(payload)
+            self._log_event(**log_fields, status=f"sent_{status}")
+            logging.info("GA4 sent event=%s status=%s", log_fields["event_name"], status)
+            return True
+        except (HTTPError, URLError, TimeoutError, OSError, ValueError) as exc:
+            self._log_event(**log_fields, status=f"error_{type(exc).__name__}")
+            logging.warning("GA4 send failed event=%s error=%s", log_fields["event_name"], exc)
+            return False
+
+    def _submit(self, events: list[dict[str, Any]]) -> None:
+        if dispatch_queue().submit(lambda: self._deliver(events)):
+            return
+        for event in events:
+            self._log_event(**event, status="dropped_queue_full")
+        logging.warning("GA4 dispatch queue full; dropped events=%s", len(events))
+
     def track(
         self,
         *,
@@ -64,6 +324,7 @@ class GA4Tracker:
         language: str = "",
         params: dict[str, Any] | None = None,
     ) -> None:
+        normalize_date_token(date_token)
         payload = {
             "client_id": client_id,
             "events": [
@@ -77,56 +338,30 @@ class GA4Tracker:
                 }
             ],
         }
+        event: dict[str, Any] = {
+            "date_token": date_token,
+            "event_name": event_name,
+            "client_id": client_id,
+            "channel": channel,
+            "language": language,
+            "payload": payload,
+        }
 
         if not self.enabled:
-            self._log_event(
-                date_token=date_token,
-                event_name=event_name,
-                client_id=client_id,
-                channel=channel,
-                language=language,
-                status="skipped_env_missing",
-                payload=payload,
-            )
+            self._log_event(**event, status="skipped_env_missing")
             logging.info("GA4 skipped (missing env) event=%s", event_name)
             return
 
-        query = parse.urlencode(
-            {
-                "measurement_id": self.measurement_id,
-                "api_secret": self.api_secret,
-            }
-        )
-        url = f"https://www.google-analytics.com/mp/collect?{query}"
-        body = json.dumps(payload).encode("utf-8")
-        req = request.Request(
-            url,
-            data=body,
-            headers={"Content-Type": "application/json"},
-            method="POST",
-        )
+        if not self.async_dispatch:
+            self._deliver([event])
+        elif self.effective_batch_size() > 1:
+            event_batcher().add(self, event)
+        else:
+            self._submit([event])
 
-        try:
-            with request.urlopen(req, timeout=4) as resp:
-                status = str(getattr(resp, "status", "200"))
-            self._log_event(
-                date_token=date_token,
-                event_name=event_name,
-                client_id=client_id,
-                channel=channel,
-                language=language,
-                status=f"sent_{status}",
-                payload=payload,
-            )
-            logging.info("GA4 sent event=%s status=%s", event_name, status)
-        except (HTTPError, URLError, TimeoutError, OSError, ValueError) as exc:  # pragma: no cover
-            self._log_event(
-                date_token=date_token,
-                event_name=event_name,
-                client_id=client_id,
-                channel=channel,
-                language=language,
-                status=f"error_{type(exc).__name__}",
-                payload=payload,
-            )
-            logging.warning("GA4 send failed event=%s error=%s", event_name, exc)
+    def flush(self, timeout: float | None = None) -> bool:
+        if not self.async_dispatch:
+            return True
+        if self.effective_batch_size() > 1:
+            event_batcher().flush()
+        return dispatch_queue().flush(timeout)
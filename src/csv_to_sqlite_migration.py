@@ -1,28 +1,116 @@
 from __future__ import annotations
 
 import csv
+import hashlib
 import logging
 import os
 import re
+import time
 from collections import defaultdict
+from collections.abc import Callable, Collection, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
+from typing import Any, TypeVar
 
 from src.storage import (
-    append_analytics_event,
-    append_landing_event_if_new,
+    TABLE_EXPORTS,
+    bulk_insert_analytics_events,
+    bulk_insert_landing_events,
     date_token_to_iso,
-    export_all_tables_to_csv,
+    fetch_migration_manifest,
     normalize_date_token,
+    record_migration_manifest,
+    suppress_exports,
     upsert_table_rows,
 )
 
 
 DATE_FILE_RE = re.compile(r"^\d{8}_")
+HASH_CHUNK_SIZE = 1 << 20
+GENERIC_TABLES = (
+    ("trip_safety", "trip_safety.csv", ["date", "scenario_id"]),
+    ("interview_log", "interview_log.csv", ["date", "interview_id"]),
+    ("b2b_pipeline", "b2b_pipeline.csv", ["date", "meeting_id"]),
+    ("trip_pass_pricing", "trip_pass_pricing.csv", ["date", "response_id"]),
+    ("guardrail_checklist", "guardrail_checklist.csv", ["date", "check_id"]),
+    ("community_outreach_log", "community_outreach_log.csv", ["date", "post_id"]),
+)
+
+_T = TypeVar("_T")
 
 
 def read_rows(path: Path) -> list[dict[str, str]]:
+    return list(iter_rows(path))
+
+
+def iter_rows(path: Path) -> Iterator[dict[str, str]]:
     with path.open("r", newline="", encoding="utf-8") as handle:
-        return list(csv.DictReader(handle))
+        yield from csv.DictReader(handle)
+
+
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def manifest_entry(data_dir: Path, table_name: str, path: Path, content_hash: str | None = None) -> dict[str, Any]:
+    stat = path.stat()
+    return {
+        "path": path.relative_to(data_dir).as_posix(),
+        "table_name": table_name,
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "content_hash": content_hash or file_sha256(path),
+    }
+
+
+def pending_sources(
+    data_dir: Path,
+    table_name: str,
+    paths: Sequence[Path],
+    manifest: dict[str, dict[str, Any]],
+) -> list[tuple[Path, dict[str, Any]]]:
+    """Source files not yet ingested for ``table_name``, each with the manifest entry to record.
+
+    A file whose size and mtime match its manifest row is skipped without being read. Otherwise it is
+    hashed, and skipped if a file with the same content was already ingested for the table (for
+    example after being moved to ``archive/``); its manifest row is refreshed in that case.
+    """
+    ingested_hashes = {str(row["content_hash"]) for row in manifest.values() if row["table_name"] == table_name}
+    pending: list[tuple[Path, dict[str, Any]]] = []
+    refreshed: list[dict[str, Any]] = []
+    for path in paths:
+        stat = path.stat()
+        known = manifest.get(path.relative_to(data_dir).as_posix())
+        if known and int(known["size"]) == stat.st_size and int(known["mtime_ns"]) == stat.st_mtime_ns:
+            continue
+        entry = manifest_entry(data_dir, table_name, path)
+        if entry["content_hash"] in ingested_hashes:
+            refreshed.append({**entry, "row_count": int(known["row_count"]) if known else 0})
+            continue
+        pending.append((path, entry))
+    if refreshed:
+        record_migration_manifest(refreshed)
+    if len(pending) < len(paths):
+        logging.info("Skipping %d unchanged %s source file(s)", len(paths) - len(pending), table_name)
+    return pending
+
+
+def exported_sources(data_dir: Path, manifest: dict[str, dict[str, Any]]) -> frozenset[Path]:
+    """Cumulative CSVs owned by the database.
+
+    Once a migration has run, every ``data/<table>.csv`` is rewritten from SQLite, so reading it
+    again would count its rows a second time.
+    """
+    return frozenset(data_dir / filename for filename, _ in TABLE_EXPORTS.values() if filename in manifest)
+
+
+def migration_sources(data_dir: Path, suffix: str, exported: Collection[Path] = ()) -> list[Path]:
+    return [path for path in find_sources(data_dir, suffix) if path not in exported]
 
 
 def normalize_iso_date(value: str) -> str:
@@ -47,6 +135,15 @@ def find_sources(data_dir: Path, suffix: str) -> list[Path]:
     return matched
 
 
+def map_sources(parse: Callable[[Path], _T], paths: Sequence[Path], workers: int = 1) -> Iterator[_T]:
+    """Apply ``parse`` to each source file, in a process pool when ``workers > 1``; results keep file order."""
+    if workers <= 1 or len(paths) <= 1:
+        yield from map(parse, paths)
+        return
+    with ProcessPoolExecutor(max_workers=min(workers, len(paths))) as pool:
+        yield from pool.map(parse, paths)
+
+
 def parse_metric_int(raw: str, *, source_path: Path, metric: str) -> int:
     text = (raw or "").strip()
     if not text:
@@ -63,45 +160,117 @@ def parse_metric_int(raw: str, *, source_path: Path, metric: str) -> int:
         return 0
 
 
-def migrate_landing_events(data_dir: Path, dry_run: bool) -> int:
-    count = 0
-    for path in find_sources(data_dir, "landing_events.csv"):
-        for row in read_rows(path):
-            date_iso = normalize_iso_date(row.get("date", ""))
-            if not date_iso:
-                continue
-            if dry_run:
-                count += 1
-                continue
-            inserted = append_landing_event_if_new(
-                timestamp=(row.get("timestamp", "") or "").strip() or "1970-01-01T00:00:00",
-                date_iso=date_iso,
-                session_id=(row.get("session_id", "") or "").strip(),
-                language=(row.get("language", "") or "").strip(),
-                channel=(row.get("channel", "") or "").strip(),
-                source_id=(row.get("source_id", "") or "").strip(),
-                post_id=(row.get("post_id", "") or "").strip(),
-                event_type=(row.get("event_type", "") or "").strip(),
-                cta_type=(row.get("cta_type", "") or "").strip(),
-                lead_email=(row.get("lead_email", "") or "").strip(),
-                consent=(row.get("consent", "0") or "0").strip() in {"1", "true", "True"},
+def parse_landing_event_file(path: Path) -> list[tuple[str | int, ...]]:
+    values: list[tuple[str | int, ...]] = []
+    for row in iter_rows(path):
+        date_iso = normalize_iso_date(row.get("date", ""))
+        if not date_iso:
+            continue
+        values.append(
+            (
+                (row.get("timestamp", "") or "").strip() or "1970-01-01T00:00:00",
+                date_iso,
+                (row.get("session_id", "") or "").strip(),
+                (row.get("language", "") or "").strip(),
+                (row.get("channel", "") or "").strip(),
+                (row.get("source_id", "") or "").strip(),
+                (row.get("post_id", "") or "").strip(),
+                (row.get("event_type", "") or "").strip(),
+                (row.get("cta_type", "") or "").strip(),
+                (row.get("lead_email", "") or "").strip(),
+                1 if (row.get("consent", "0") or "0").strip() in {"1", "true", "True"} else 0,
             )
-            if inserted:
-                count += 1
-    return count
+        )
+    return values
+
 
+def iter_landing_event_values(data_dir: Path, workers: int = 1) -> Iterator[tuple[str | int, ...]]:
+    for values in map_sources(parse_landing_event_file, find_sources(data_dir, "landing_events.csv"), workers):
+        yield from values
+
+
+def migrate_landing_events(
+    data_dir: Path,
+    dry_run: bool,
+    workers: int = 1,
+    manifest: dict[str, dict[str, Any]] | None = None,
+    exported: Collection[Path] = (),
+) -> int:
+    if dry_run:
+        return sum(1 for _ in iter_landing_event_values(data_dir, workers))
+    return _ingest_event_files(
+        data_dir,
+        "landing_events",
+        migration_sources(data_dir, "landing_events.csv", exported),
+        parse_landing_event_file,
+        bulk_insert_landing_events,
+        workers,
+        manifest or {},
+    )
+
+
+def _ingest_event_files(
+    data_dir: Path,
+    table_name: str,
+    paths: Sequence[Path],
+    parse: Callable[[Path], list[_T]],
+    insert: Callable[[list[_T], list[dict[str, Any]]], int],
+    workers: int,
+    manifest: dict[str, dict[str, Any]],
+) -> int:
+    # One transaction per file, together with its manifest row, so an interrupted run resumes after
+    # the last committed file.
+    pending = pending_sources(data_dir, table_name, paths, manifest)
+    inserted = 0
+    started = time.perf_counter()
+    read = 0
+    for index, ((path, entry), values) in enumerate(
+        zip(pending, map_sources(parse, [path for path, _ in pending], workers)),
+        start=1,
+    ):
+        file_inserted = insert(values, [{**entry, "row_count": len(values)}])
+        inserted += file_inserted
+        read += len(values)
+        elapsed = time.perf_counter() - started
+        logging.info(
+            "Ingested %s (%d/%d): %d new of %d rows (%.0f rows/sec)",
+            path.name,
+            index,
+            len(pending),
+            file_inserted,
+            len(values),
+            read / elapsed if elapsed else 0.0,
+        )
+    return inserted
+
+
+def migrate_landing_cvr(
+    data_dir: Path,
+    dry_run: bool,
+    manifest: dict[str, dict[str, Any]] | None = None,
+    exported: Collection[Path] = (),
+) -> int:
+    paths = migration_sources(data_dir, "landing_cvr.csv", exported)
+    # Totals are summed across every source, so a new or changed file means re-reading them all;
+    # only the (date, channel) totals that file contributes to are rewritten.
+    pending = [] if dry_run else pending_sources(data_dir, "landing_cvr_daily", paths, manifest or {})
+    if not dry_run and not pending:
+        return 0
+    pending_paths = {path for path, _ in pending}
+    touched: set[tuple[str, str]] = set()
 
-def migrate_landing_cvr(data_dir: Path, dry_run: bool) -> int:
     grouped: dict[tuple[str, str], dict[str, int]] = defaultdict(
         lambda: {"visitors": 0, "pilot_cta": 0, "first_scan_cta": 0, "total_cta": 0}
     )
-    for path in find_sources(data_dir, "landing_cvr.csv"):
+    for path in paths:
         for row in read_rows(path):
             date_iso = normalize_iso_date(row.get("date", ""))
             channel = (row.get("channel", "") or "").strip()
             if not date_iso or not channel:
                 continue
             key = (date_iso, channel)
+            if path in pending_paths:
+                touched.add(key)
             for metric in ["visitors", "pilot_cta", "first_scan_cta", "total_cta"]:
                 raw = (row.get(metric, "") or "").strip()
                 grouped[key][metric] += parse_metric_int(raw, source_path=path, metric=metric)
@@ -111,6 +280,8 @@ def migrate_landing_cvr(data_dir: Path, dry_run: bool) -> int:
 
     rows = []
     for (date_iso, channel), values in sorted(grouped.items()):
+        if (date_iso, channel) not in touched:
+            continue
         rows.append(
             {
                 "date": date_iso,
@@ -122,12 +293,30 @@ def migrate_landing_cvr(data_dir: Path, dry_run: bool) -> int:
             }
         )
     upsert_table_rows("landing_cvr_daily", rows, overwrite_date=None)
+    record_migration_manifest(entry for _, entry in pending)
     return len(rows)
 
 
-def migrate_generic(data_dir: Path, table_name: str, suffix: str, key_fields: list[str], dry_run: bool) -> int:
+def migrate_generic(
+    data_dir: Path,
+    table_name: str,
+    suffix: str,
+    key_fields: list[str],
+    dry_run: bool,
+    manifest: dict[str, dict[str, Any]] | None = None,
+    exported: Collection[Path] = (),
+) -> int:
+    paths = migration_sources(data_dir, suffix, exported)
+    # Later files win per key, so a new or changed file means replaying them all in order; only the
+    # keys that file contains are rewritten.
+    pending = [] if dry_run else pending_sources(data_dir, table_name, paths, manifest or {})
+    if not dry_run and not pending:
+        return 0
+    pending_paths = {path for path, _ in pending}
+    touched: set[tuple[str, ...]] = set()
+
     by_key: dict[tuple[str, ...], dict[str, str]] = {}
-    for path in find_sources(data_dir, suffix):
+    for path in paths:
         for row in read_rows(path):
             if "date" in row:
                 row["date"] = normalize_iso_date(row.get("date", ""))
@@ -137,71 +326,106 @@ def migrate_generic(data_dir: Path, table_name: str, suffix: str, key_fields: li
             if any(not k for k in key):
                 continue
             by_key[key] = {k: (v or "").strip() for k, v in row.items()}
+            if path in pending_paths:
+                touched.add(key)
 
     if dry_run:
         return len(by_key)
 
-    upsert_table_rows(table_name, list(by_key.values()), overwrite_date=None)
-    return len(by_key)
+    rows = [row for key, row in by_key.items() if key in touched]
+    upsert_table_rows(table_name, rows, overwrite_date=None)
+    record_migration_manifest(entry for _, entry in pending)
+    return len(rows)
 
 
-def migrate_analytics(data_dir: Path, dry_run: bool) -> int:
-    count = 0
-    for path in find_sources(data_dir, "analytics_events.csv"):
-        for row in read_rows(path):
-            date_iso = normalize_iso_date(row.get("date", ""))
-            if not date_iso:
-                continue
-            count += 1
-            if dry_run:
-                continue
-            append_analytics_event(
-                timestamp=(row.get("timestamp", "") or "").strip() or "1970-01-01T00:00:00",
-                date_iso=date_iso,
-                event_name=(row.get("event_name", "") or "").strip(),
-                client_id=(row.get("client_id", "") or "").strip(),
-                channel=(row.get("channel", "") or "").strip(),
-                language=(row.get("language", "") or "").strip(),
-                status=(row.get("status", "") or "").strip(),
-                payload=(row.get("payload", "") or "").strip(),
+def parse_analytics_file(path: Path) -> list[tuple[str, ...]]:
+    values: list[tuple[str, ...]] = []
+    for row in iter_rows(path):
+        date_iso = normalize_iso_date(row.get("date", ""))
+        if not date_iso:
+            continue
+        values.append(
+            (
+                (row.get("timestamp", "") or "").strip() or "1970-01-01T00:00:00",
+                date_iso,
+                (row.get("event_name", "") or "").strip(),
+                (row.get("client_id", "") or "").strip(),
+                (row.get("channel", "") or "").strip(),
+                (row.get("language", "") or "").strip(),
+                (row.get("status", "") or "").strip(),
+                (row.get("payload", "") or "").strip(),
             )
-    return count
+        )
+    return values
+
+
+def iter_analytics_values(data_dir: Path, workers: int = 1) -> Iterator[tuple[str, ...]]:
+    for values in map_sources(parse_analytics_file, find_sources(data_dir, "analytics_events.csv"), workers):
+        yield from values
+
+
+def migrate_analytics(
+    data_dir: Path,
+    dry_run: bool,
+    workers: int = 1,
+    manifest: dict[str, dict[str, Any]] | None = None,
+    exported: Collection[Path] = (),
+) -> int:
+    if dry_run:
+        return sum(1 for _ in iter_analytics_values(data_dir, workers))
+    return _ingest_event_files(
+        data_dir,
+        "analytics_events",
+        migration_sources(data_dir, "analytics_events.csv", exported),
+        parse_analytics_file,
+        bulk_insert_analytics_events,
+        workers,
+        manifest or {},
+    )
 
 
-def run_migration(root: Path, dry_run: bool) -> dict[str, int]:
+def run_migration(root: Path, dry_run: bool, workers: int = 1, force: bool = False) -> dict[str, int]:
     data_dir = root / "data"
     os.environ.setdefault("KTRIPPEDIA_DATA_DIR", str(data_dir))
+    stored = {} if dry_run else fetch_migration_manifest()
+    exported = exported_sources(data_dir, stored)
+    # force re-reads every source; the manifest is still rewritten so later runs can skip again.
+    manifest = {} if force else stored
+
+    steps: list[tuple[str, Callable[[], int]]] = [
+        ("landing_events", lambda: migrate_landing_events(data_dir, dry_run, workers, manifest, exported)),
+        ("landing_cvr_daily", lambda: migrate_landing_cvr(data_dir, dry_run, manifest, exported)),
+        ("analytics_events", lambda: migrate_analytics(data_dir, dry_run, workers, manifest, exported)),
+    ]
+    for table_name, suffix, key_fields in GENERIC_TABLES:
+        steps.append(
+            (
+                table_name,
+                partial(migrate_generic, data_dir, table_name, suffix, key_fields, dry_run, manifest, exported),
+            )
+        )
 
     stats: dict[str, int] = {}
-    stats["landing_events"] = migrate_landing_events(data_dir, dry_run)
-    stats["landing_cvr_daily"] = migrate_landing_cvr(data_dir, dry_run)
-    stats["analytics_events"] = migrate_analytics(data_dir, dry_run)
-    stats["trip_safety"] = migrate_generic(data_dir, "trip_safety", "trip_safety.csv", ["date", "scenario_id"], dry_run)
-    stats["interview_log"] = migrate_generic(data_dir, "interview_log", "interview_log.csv", ["date", "interview_id"], dry_run)
-    stats["b2b_pipeline"] = migrate_generic(data_dir, "b2b_pipeline", "b2b_pipeline.csv", ["date", "meeting_id"], dry_run)
-    stats["trip_pass_pricing"] = migrate_generic(
-        data_dir,
-        "trip_pass_pricing",
-        "trip_pass_pricing.csv",
-        ["date", "response_id"],
-        dry_run,
-    )
-    stats["guardrail_checklist"] = migrate_generic(
-        data_dir,
-        "guardrail_checklist",
-        "guardrail_checklist.csv",
-        ["date", "check_id"],
-        dry_run,
-    )
-    stats["community_outreach_log"] = migrate_generic(
-        data_dir,
-        "community_outreach_log",
-        "community_outreach_log.csv",
-        ["date", "post_id"],
-        dry_run,
-    )
+    # Exports are deferred until every step has run, so each changed table is exported exactly once.
+    with suppress_exports():
+        for table_name, step in steps:
+            started = time.perf_counter()
+            stats[table_name] = step()
+            elapsed = time.perf_counter() - started
+            logging.info(
+                "Migrated %s: %d rows in %.2fs (%.0f rows/sec)",
+                table_name,
+                stats[table_name],
+                elapsed,
+                stats[table_name] / elapsed if elapsed else 0.0,
+            )
 
     if not dry_run:
-        export_all_tables_to_csv()
+        # From here on the cumulative CSVs are exports of the database and hold nothing new.
+        record_migration_manifest(
+            {**manifest_entry(data_dir, table_name, path), "row_count": 0}
+            for table_name, (filename, _) in TABLE_EXPORTS.items()
+            if (path := data_dir / filename).exists()
+        )
 
     return stats
@@ -16,6 +16,7 @@ from src.landing_tracker import (
     track_cta,
     track_visit,
 )
+from src.storage import start_background_exporter
 
 
 COPY = {
@@ -419,6 +420,7 @@ def _render_meta(text: dict[str, str], channel: str, date_token: str, source_id:
 def main() -> None:
     log_path = Path(__file__).resolve().parents[1] / "logs" / "app.log"
     _setup_logging(log_path)
+    start_background_exporter()
 
     st.set_page_config(page_title="Ask Before You Eat", page_icon="A", layout="centered")
     _render_style()
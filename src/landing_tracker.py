@@ -9,8 +9,8 @@ import re
 from src.storage import (
     append_landing_event_if_new,
     date_token_to_iso,
-    increment_landing_cvr,
     normalize_date_token,
+    record_interaction,
 )
 
 
@@ -74,7 +74,7 @@ def track_visit(
     date_iso = date_token_to_iso(date_token)
     now = dt.datetime.now().isoformat(timespec="seconds")
 
-    inserted = append_landing_event_if_new(
+    inserted = record_interaction(
         timestamp=now,
         date_iso=date_iso,
         session_id=normalized_session_id,
@@ -86,12 +86,12 @@ def track_visit(
         cta_type="",
         lead_email="",
         consent=False,
+        cvr_increments={"visitors": 1},
     )
     if not inserted:
         logging.info("Skip duplicate visit session=%s channel=%s", normalized_session_id, normalized_channel)
         return
 
-    increment_landing_cvr(date_iso=date_iso, channel=normalized_channel, field="visitors")
     logging.info(
         "Track visit session=%s channel=%s source=%s post_id=%s",
         normalized_session_id,
@@ -121,7 +121,8 @@ def track_cta(
 
     date_iso = date_token_to_iso(date_token)
     now = dt.datetime.now().isoformat(timespec="seconds")
-    append_landing_event_if_new(
+    cta_field = "pilot_cta" if normalized_cta == "pilot" else "first_scan_cta"
+    inserted = record_interaction(
         timestamp=now,
         date_iso=date_iso,
         session_id=normalized_session_id,
@@ -133,13 +134,16 @@ def track_cta(
         cta_type=normalized_cta,
         lead_email="",
         consent=False,
+        cvr_increments={cta_field: 1, "total_cta": 1},
     )
-
-    if normalized_cta == "pilot":
-        increment_landing_cvr(date_iso=date_iso, channel=normalized_channel, field="pilot_cta")
-    else:
-        increment_landing_cvr(date_iso=date_iso, channel=normalized_channel, field="first_scan_cta")
-    increment_landing_cvr(date_iso=date_iso, channel=normalized_channel, field="total_cta")
+    if not inserted:
+        logging.info(
+            "Skip duplicate cta session=%s channel=%s cta=%s",
+            normalized_session_id,
+            normalized_channel,
+            normalized_cta,
+        )
+        return
 
     logging.info(
         "Track cta session=%s channel=%s cta=%s language=%s source=%s post_id=%s",
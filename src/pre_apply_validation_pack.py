@@ -10,13 +10,19 @@ import os
 import sys
 from collections import Counter
 from pathlib import Path
+from typing import Any
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
 from src.storage import (
     append_pre_apply_history,
+    append_pre_apply_history_entries,
     date_token_to_iso,
+    fetch_community_source_rows,
+    fetch_grouped_counts,
+    fetch_grouped_counts_by_date,
     fetch_metrics_rows,
+    fetch_metrics_rows_range,
     normalize_date_token,
     upsert_table_rows,
 )
@@ -153,6 +159,18 @@ RESTRICTION_SEQUENCE = [
 ]
 
 
+# Columns each KPI depends on. Rows are counted per distinct value combination in SQL, so the
+# parsing helpers below run once per combination instead of once per row and field.
+METRIC_GROUP_COLUMNS = {
+    "interview_log": ("segment", "pain_tags", "quote"),
+    "landing_cvr_daily": ("visitors", "total_cta"),
+    "trip_safety": ("resolved", "show_mode_used"),
+    "b2b_pipeline": ("status", "loi_signed", "intent_email"),
+    "trip_pass_pricing": ("willing_to_pay",),
+    "guardrail_checklist": ("banned_expression_found", "evidence_missing", "confidence_missing"),
+}
+
+
 def validate_date_token(date_token: str) -> str:
     return normalize_date_token(date_token)
 
@@ -161,6 +179,14 @@ def to_iso_date(date_token: str) -> str:
     return date_token_to_iso(date_token)
 
 
+def date_range_tokens(start_token: str, end_token: str) -> list[str]:
+    start = dt.date.fromisoformat(to_iso_date(start_token))
+    end = dt.date.fromisoformat(to_iso_date(end_token))
+    if end < start:
+        raise ValueError("end date must not be before start date")
+    return [(start + dt.timedelta(days=offset)).strftime("%Y%m%d") for offset in range((end - start).days + 1)]
+
+
 def parse_bool(value: str) -> bool | None:
     value = (value or "").strip().lower()
     if value in {"1", "true", "yes", "y", "t"}:
@@ -326,58 +352,83 @@ def pass_fail(value: bool) -> str:
     return "PASS" if value else "NEEDS_DATA"
 
 
+def _rate(part: int, whole: int) -> float:
+    return round(part / whole * 100.0, 2) if whole else 0.0
+
+
+def _text(value: object) -> str:
+    return "" if value is None else str(value).strip()
+
+
 def calculate_metrics(date_token: str, root: Path | None = None) -> dict[str, float | int]:
     date_iso = to_iso_date(date_token)
+    return _metrics_from_groups(fetch_grouped_counts(date_iso, METRIC_GROUP_COLUMNS))
 
-    interviews = fetch_metrics_rows("interview_log", date_iso)
-    completed_interviews = [r for r in interviews if (r.get("quote", "").strip() or r.get("pain_tags", "").strip())]
-    interview_total = len(completed_interviews)
-    interview_fit = sum(1 for r in completed_interviews if r.get("segment", "").strip() == "fit_foreign")
-    interview_field = sum(1 for r in completed_interviews if r.get("segment", "").strip() == "field_staff")
 
+def calculate_metrics_range(start_token: str, end_token: str) -> dict[str, dict[str, float | int]]:
+    """Metrics for every date in the inclusive range, keyed by ISO date, from one grouped pass per table."""
+    date_tokens = date_range_tokens(start_token, end_token)
+    by_date = fetch_grouped_counts_by_date(to_iso_date(date_tokens[0]), to_iso_date(date_tokens[-1]), METRIC_GROUP_COLUMNS)
+    empty: dict[str, list[tuple[Any, ...]]] = {table_name: [] for table_name in METRIC_GROUP_COLUMNS}
+    return {
+        to_iso_date(token): _metrics_from_groups(by_date.get(to_iso_date(token), empty)) for token in date_tokens
+    }
+
+
+def _metrics_from_groups(groups: dict[str, list[tuple[Any, ...]]]) -> dict[str, float | int]:
+    interview_total = interview_fit = interview_field = 0
     pain_counter: Counter[str] = Counter()
-    for row in completed_interviews:
-        tags = [tag.strip().lower() for tag in row.get("pain_tags", "").split(";") if tag.strip()]
-        pain_counter.update(tags)
+    for segment, pain_tags, quote, count in groups["interview_log"]:
+        if not (_text(quote) or _text(pain_tags)):
+            continue
+        interview_total += count
+        segment = _text(segment)
+        if segment == "fit_foreign":
+            interview_fit += count
+        elif segment == "field_staff":
+            interview_field += count
+        for tag in _text(pain_tags).split(";"):
+            if tag.strip():
+                pain_counter[tag.strip().lower()] += count
     repeated_pain_points = sum(1 for _, count in pain_counter.items() if count >= 2)
 
-    landing_rows = fetch_metrics_rows("landing_cvr_daily", date_iso)
-    visitors = sum(parse_int(str(r.get("visitors", ""))) or 0 for r in landing_rows)
-    total_cta = sum(parse_int(str(r.get("total_cta", ""))) or 0 for r in landing_rows)
-    cta_rate = (total_cta / visitors * 100.0) if visitors else 0.0
-
-    trip_rows = fetch_metrics_rows("trip_safety", date_iso)
-    completed_trip_rows = [r for r in trip_rows if parse_bool(str(r.get("resolved", ""))) is not None]
-    scenarios_completed = len(completed_trip_rows)
-    show_mode_count = sum(1 for r in completed_trip_rows if parse_bool(str(r.get("show_mode_used", ""))) is True)
-    resolved_count = sum(1 for r in completed_trip_rows if parse_bool(str(r.get("resolved", ""))) is True)
-    show_mode_rate = (show_mode_count / scenarios_completed * 100.0) if scenarios_completed else 0.0
-    resolved_rate = (resolved_count / scenarios_completed * 100.0) if scenarios_completed else 0.0
-
-    b2b_rows = fetch_metrics_rows("b2b_pipeline", date_iso)
-    completed_meetings = sum(1 for r in b2b_rows if str(r.get("status", "")).strip().lower() == "completed")
-    loi_count = sum(1 for r in b2b_rows if parse_bool(str(r.get("loi_signed", ""))) is True)
-    intent_count = sum(1 for r in b2b_rows if parse_bool(str(r.get("intent_email", ""))) is True)
-
-    pricing_rows = fetch_metrics_rows("trip_pass_pricing", date_iso)
-    completed_pricing = [r for r in pricing_rows if parse_bool(str(r.get("willing_to_pay", ""))) is not None]
-    pricing_total = len(completed_pricing)
-    willing_count = sum(1 for r in completed_pricing if parse_bool(str(r.get("willing_to_pay", ""))) is True)
-    willing_rate = (willing_count / pricing_total * 100.0) if pricing_total else 0.0
-
-    guardrail_rows = fetch_metrics_rows("guardrail_checklist", date_iso)
-    reviewed_guardrails = [
-        r
-        for r in guardrail_rows
-        if (
-            parse_bool(str(r.get("banned_expression_found", ""))) is not None
-            or parse_bool(str(r.get("evidence_missing", ""))) is not None
-            or parse_bool(str(r.get("confidence_missing", ""))) is not None
-        )
-    ]
-    banned_count = sum(1 for r in reviewed_guardrails if parse_bool(str(r.get("banned_expression_found", ""))) is True)
-    evidence_missing_count = sum(1 for r in reviewed_guardrails if parse_bool(str(r.get("evidence_missing", ""))) is True)
-    confidence_missing_count = sum(1 for r in reviewed_guardrails if parse_bool(str(r.get("confidence_missing", ""))) is True)
+    visitors = total_cta = 0
+    for row_visitors, row_total_cta, count in groups["landing_cvr_daily"]:
+        visitors += (parse_int(str(row_visitors)) or 0) * count
+        total_cta += (parse_int(str(row_total_cta)) or 0) * count
+
+    scenarios_completed = show_mode_count = resolved_count = 0
+    for resolved, show_mode_used, count in groups["trip_safety"]:
+        resolved_flag = parse_bool(str(resolved))
+        if resolved_flag is None:
+            continue
+        scenarios_completed += count
+        resolved_count += count if resolved_flag else 0
+        show_mode_count += count if parse_bool(str(show_mode_used)) is True else 0
+
+    completed_meetings = loi_count = intent_count = 0
+    for status, loi_signed, intent_email, count in groups["b2b_pipeline"]:
+        completed_meetings += count if _text(status).lower() == "completed" else 0
+        loi_count += count if parse_bool(str(loi_signed)) is True else 0
+        intent_count += count if parse_bool(str(intent_email)) is True else 0
+
+    pricing_total = willing_count = 0
+    for willing_to_pay, count in groups["trip_pass_pricing"]:
+        willing = parse_bool(str(willing_to_pay))
+        if willing is None:
+            continue
+        pricing_total += count
+        willing_count += count if willing else 0
+
+    reviewed_guardrails = banned_count = evidence_missing_count = confidence_missing_count = 0
+    for banned, evidence_missing, confidence_missing, count in groups["guardrail_checklist"]:
+        flags = [parse_bool(str(value)) for value in (banned, evidence_missing, confidence_missing)]
+        if all(flag is None for flag in flags):
+            continue
+        reviewed_guardrails += count
+        banned_count += count if flags[0] is True else 0
+        evidence_missing_count += count if flags[1] is True else 0
+        confidence_missing_count += count if flags[2] is True else 0
 
     return {
         "interview_total": interview_total,
@@ -386,17 +437,17 @@ def calculate_metrics(date_token: str, root: Path | None = None) -> dict[str, fl
         "repeated_pain_points": repeated_pain_points,
         "visitors": visitors,
         "total_cta": total_cta,
-        "cta_rate": round(cta_rate, 2),
+        "cta_rate": _rate(total_cta, visitors),
         "scenarios_completed": scenarios_completed,
-        "show_mode_rate": round(show_mode_rate, 2),
-        "resolved_rate": round(resolved_rate, 2),
+        "show_mode_rate": _rate(show_mode_count, scenarios_completed),
+        "resolved_rate": _rate(resolved_count, scenarios_completed),
         "completed_meetings": completed_meetings,
         "loi_count": loi_count,
         "intent_count": intent_count,
         "pricing_total": pricing_total,
         "willing_count": willing_count,
-        "willing_rate": round(willing_rate, 2),
-        "reviewed_guardrails": len(reviewed_guardrails),
+        "willing_rate": _rate(willing_count, pricing_total),
+        "reviewed_guardrails": reviewed_guardrails,
         "banned_count": banned_count,
         "evidence_missing_count": evidence_missing_count,
         "confidence_missing_count": confidence_missing_count,
@@ -430,24 +481,14 @@ def evaluate_targets(metrics: dict[str, float | int]) -> dict[str, bool]:
 
 def build_community_breakdown(date_token: str) -> list[dict[str, int | float | str]]:
     date_iso = to_iso_date(date_token)
-    rows = fetch_metrics_rows("landing_events", date_iso)
     grouped: dict[tuple[str, str], dict[str, int]] = {}
 
-    for row in rows:
-        if str(row.get("channel", "")).strip() != "community":
-            continue
+    for row in fetch_community_source_rows(date_iso, date_iso):
         source_id = str(row.get("source_id", "")).strip() or "unknown"
         post_id = str(row.get("post_id", "")).strip() or "unknown"
-        key = (source_id, post_id)
-        if key not in grouped:
-            grouped[key] = {"visitors": 0, "cta": 0, "leads": 0}
-        event_type = str(row.get("event_type", "")).strip()
-        if event_type == "visit":
-            grouped[key]["visitors"] += 1
-        elif event_type == "cta_click":
-            grouped[key]["cta"] += 1
-        elif event_type == "lead_submit":
-            grouped[key]["leads"] += 1
+        values = grouped.setdefault((source_id, post_id), {"visitors": 0, "cta": 0, "leads": 0})
+        for field in values:
+            values[field] += int(row.get(field) or 0)
 
     table: list[dict[str, int | float | str]] = []
     for (source_id, post_id), values in sorted(grouped.items()):
@@ -468,36 +509,55 @@ def build_community_breakdown(date_token: str) -> list[dict[str, int | float | s
 
 
 def _upsert_markdown_section(path: Path, section_header: str, section_body: list[str]) -> None:
+    _upsert_markdown_sections(path, [(section_header, section_body)])
+
+
+def _upsert_markdown_sections(path: Path, sections: list[tuple[str, list[str]]]) -> None:
     ensure_dir(path.parent)
-    marker = f"## {section_header}"
-    new_section = [marker, *section_body]
-    if not path.exists():
-        path.write_text("\n".join(new_section) + "\n", encoding="utf-8")
-        return
+    lines: list[str] | None = path.read_text(encoding="utf-8").splitlines() if path.exists() else None
+    for section_header, section_body in sections:
+        marker = f"## {section_header}"
+        new_section = [marker, *section_body]
+        if lines is None:
+            lines = new_section
+            continue
 
-    lines = path.read_text(encoding="utf-8").splitlines()
-    start = -1
-    end = len(lines)
-    for i, line in enumerate(lines):
-        if line.strip() == marker:
-            start = i
-            break
-    if start >= 0:
-        for j in range(start + 1, len(lines)):
-            if lines[j].startswith("## "):
-                end = j
+        start = -1
+        end = len(lines)
+        for i, line in enumerate(lines):
+            if line.strip() == marker:
+                start = i
                 break
-        updated = lines[:start] + new_section + lines[end:]
-    else:
-        updated = lines + [""] + new_section
-    path.write_text("\n".join(updated) + "\n", encoding="utf-8")
+        if start >= 0:
+            for j in range(start + 1, len(lines)):
+                if lines[j].startswith("## "):
+                    end = j
+                    break
+            lines = lines[:start] + new_section + lines[end:]
+        else:
+            lines = lines + [""] + new_section
+    if lines is not None:
+        path.write_text("\n".join(lines) + "\n", encoding="utf-8")
 
 
 def build_decision_cards(date_token: str, root: Path) -> None:
     date_iso = to_iso_date(date_token)
     out_path = root / "reports" / "decision_cards.md"
     rows = fetch_metrics_rows("trip_safety", date_iso)[:10]
+    _upsert_markdown_section(out_path, f"Date {date_iso}", _decision_card_body(rows))
+    logging.info("Updated report: %s", out_path)
+
+
+def build_decision_cards_range(start_token: str, end_token: str, root: Path) -> None:
+    date_isos = [to_iso_date(token) for token in date_range_tokens(start_token, end_token)]
+    out_path = root / "reports" / "decision_cards.md"
+    rows_by_date = fetch_metrics_rows_range("trip_safety", date_isos[0], date_isos[-1])
+    sections = [(f"Date {date_iso}", _decision_card_body(rows_by_date.get(date_iso, [])[:10])) for date_iso in date_isos]
+    _upsert_markdown_sections(out_path, sections)
+    logging.info("Updated report: %s (%d dates)", out_path, len(date_isos))
+
 
+def _decision_card_body(rows: list[dict[str, Any]]) -> list[str]:
     body = [
         "",
         "Guardrail: no diagnosis, no prescription, no definitive medical judgment.",
@@ -520,17 +580,44 @@ def build_decision_cards(date_token: str, root: Path) -> None:
                 "",
             ]
         )
-    _upsert_markdown_section(out_path, f"Date {date_iso}", body)
-    logging.info("Updated report: %s", out_path)
+    return body
 
 
 def build_summary_report(date_token: str, root: Path) -> None:
     date_iso = to_iso_date(date_token)
     report_path = root / "reports" / "pre_apply_validation.md"
     metrics = calculate_metrics(date_token=date_token, root=root)
-    targets = evaluate_targets(metrics)
     community_rows = build_community_breakdown(date_token=date_token)
+    _write_summary_report(report_path, date_iso, metrics, community_rows)
+    append_pre_apply_history(report_path, date_iso, _history_line(metrics))
+    logging.info("Updated report: %s", report_path)
+
 
+def build_summary_report_range(start_token: str, end_token: str, root: Path) -> None:
+    """Render the summary for the last date in the range and record history for every date in it."""
+    report_path = root / "reports" / "pre_apply_validation.md"
+    metrics_by_date = calculate_metrics_range(start_token, end_token)
+    latest_iso = max(metrics_by_date)
+    community_rows = build_community_breakdown(date_token=latest_iso.replace("-", ""))
+    _write_summary_report(report_path, latest_iso, metrics_by_date[latest_iso], community_rows)
+    append_pre_apply_history_entries(
+        report_path,
+        [(date_iso, _history_line(metrics)) for date_iso, metrics in sorted(metrics_by_date.items())],
+    )
+    logging.info("Updated report: %s (%d dates)", report_path, len(metrics_by_date))
+
+
+def _history_line(metrics: dict[str, float | int]) -> str:
+    return f"visitors={metrics['visitors']}, cta={metrics['total_cta']}, interviews={metrics['interview_total']}"
+
+
+def _write_summary_report(
+    report_path: Path,
+    date_iso: str,
+    metrics: dict[str, float | int],
+    community_rows: list[dict[str, int | float | str]],
+) -> None:
+    targets = evaluate_targets(metrics)
     lines = [
         f"# Pre-Apply Demand Validation (Latest: {date_iso})",
         "",
@@ -599,12 +686,6 @@ def build_summary_report(date_token: str, root: Path) -> None:
         )
     lines.append("## History")
     report_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
-    append_pre_apply_history(
-        report_path,
-        date_iso,
-        f"visitors={metrics['visitors']}, cta={metrics['total_cta']}, interviews={metrics['interview_total']}",
-    )
-    logging.info("Updated report: %s", report_path)
 
 
 def build_interview_guide(root: Path) -> None:
@@ -717,18 +798,51 @@ def run(date_token: str, root: Path, overwrite: bool, bootstrap: bool = False) -
     build_measurement_sheet(root=root)
 
 
+def run_range(start_token: str, end_token: str, root: Path, overwrite: bool, bootstrap: bool = False) -> None:
+    date_tokens = date_range_tokens(start_token, end_token)
+    if bootstrap:
+        for date_token in date_tokens:
+            bootstrap_for_date(date_iso=to_iso_date(date_token), overwrite=overwrite)
+
+    build_decision_cards_range(start_token=date_tokens[0], end_token=date_tokens[-1], root=root)
+    build_summary_report_range(start_token=date_tokens[0], end_token=date_tokens[-1], root=root)
+    build_interview_guide(root=root)
+    build_landing_copy(root=root)
+    build_measurement_sheet(root=root)
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Build K-TripPedia pre-apply validation package.")
     parser.add_argument("--date", default=dt.datetime.now().strftime("%Y%m%d"), help="Date token in YYYYMMDD format")
+    parser.add_argument("--start", help="First date (YYYYMMDD) of a range to build in one pass; requires --end")
+    parser.add_argument("--end", help="Last date (YYYYMMDD) of the range, inclusive; requires --start")
     parser.add_argument("--root", default=".", help="Project root directory")
     parser.add_argument("--overwrite", action="store_true", help="Overwrite current date rows (bootstrap only)")
     parser.add_argument("--bootstrap", action="store_true", help="Create template rows for the target date")
     args = parser.parse_args()
+    if bool(args.start) != bool(args.end):
+        parser.error("--start and --end must be given together")
 
     root = Path(args.root).resolve()
     os.environ["KTRIPPEDIA_DATA_DIR"] = str(root / "data")
-    validated_date_token = validate_date_token(args.date)
     log_path = root / "logs" / "validation.log"
+    if args.start:
+        start_token = validate_date_token(args.start)
+        end_token = validate_date_token(args.end)
+        date_range_tokens(start_token, end_token)
+        setup_logging(log_path=log_path)
+        logging.info("Start validation package build. root=%s range=%s..%s", root, start_token, end_token)
+        run_range(
+            start_token=start_token,
+            end_token=end_token,
+            root=root,
+            overwrite=args.overwrite,
+            bootstrap=args.bootstrap,
+        )
+        logging.info("Completed validation package build.")
+        return
+
+    validated_date_token = validate_date_token(args.date)
     setup_logging(log_path=log_path)
     logging.info("Start validation package build. root=%s date=%s", root, validated_date_token)
     run(date_token=validated_date_token, root=root, overwrite=args.overwrite, bootstrap=args.bootstrap)
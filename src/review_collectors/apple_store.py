@@ -2,13 +2,101 @@
 
 from __future__ import annotations
 
+import asyncio
+import http.client
+import json
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Iterator
+from urllib.parse import urlsplit
+
 from src.review_collectors.common import (
     NormalizedReview,
+    ReviewWatermark,
     build_fallback_review_id,
     normalize_country,
+    reached_watermark,
     to_text,
 )
 
+APPLE_RSS_BASE_URL = "https://itunes.apple.com"
+MAX_RSS_PAGES = 10  # the customer-reviews feed stops serving after page 10
+RSS_PAGE_SIZE = 50
+DEFAULT_PAGE_CONCURRENCY = 4
+REQUEST_TIMEOUT_SEC = 10.0
+
+
+class _KeepAliveClient:
+    """Persistent HTTP(S) connections to one host, reused across RSS pages.
+
+    Blocking requests run on worker threads; each thread checks a connection out and puts it
+    back when the response is fully read, so a cancelled page never hands a busy socket to
+    another request.
+    """
+
+    def __init__(self, base_url: str, timeout_sec: float = REQUEST_TIMEOUT_SEC) -> None:
+        parts = urlsplit(base_url)
+        if parts.scheme not in {"http", "https"} or not parts.netloc:
+            raise ValueError(f"unsupported base_url: {base_url}")
+        self._scheme = parts.scheme
+        self._netloc = parts.netloc
+        self._prefix = parts.path.rstrip("/")
+        self._timeout_sec = timeout_sec
+        self._idle: queue.SimpleQueue[http.client.HTTPConnection] = queue.SimpleQueue()
+        self._closed = False
+
+    def _new_connection(self) -> http.client.HTTPConnection:
+        if self._scheme == "https":
+            return http.client.HTTPSConnection(self._netloc, timeout=self._timeout_sec)
+        return http.client.HTTPConnection(self._netloc, timeout=self._timeout_sec)
+
+    def _checkout(self) -> http.client.HTTPConnection:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            return self._new_connection()
+
+    def _request(self, conn: http.client.HTTPConnection, path: str) -> tuple[int, bytes]:
+        conn.request("GET", self._prefix + path, headers={"Accept": "application/json"})
+        response = conn.getresponse()
+        return response.status, response.read()
+
+    def get(self, path: str) -> tuple[int, bytes]:
+        conn = self._checkout()
+        try:
+            try:
+                return self._request(conn, path)
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                # The server dropped an idle keep-alive socket; retry once on a fresh one.
+                conn.close()
+                return self._request(conn, path)
+        except BaseException:
+            conn.close()
+            raise
+        finally:
+            self._idle.put(conn)
+            if self._closed:
+                # A request abandoned by close() finished late; drop its connection as well.
+                self.close()
+
+    async def get_json(self, path: str) -> tuple[int, Any]:
+        status, body = await asyncio.to_thread(self.get, path)
+        if status != 200:
+            return status, None
+        return status, json.loads(body)
+
+    def close(self) -> None:
+        self._closed = True
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+
+def _feed_path(app_id: str, country_code: str, page: int) -> str:
+    return f"/{country_code}/rss/customerreviews/page={page}/id={app_id}/sortBy=mostRecent/json"
+
 
 def _extract_review_entries(entries: list[dict]) -> list[dict]:
     return [entry for entry in entries if isinstance(entry, dict) and "im:rating" in entry]
@@ -37,53 +125,108 @@ def _parse_entry(entry: dict, app_id: str, country: str) -> NormalizedReview:
     }
 
 
-def collect_apple_reviews(
+def _iter_feed(
+    client: _KeepAliveClient,
+    app_id: str,
+    country_code: str,
+    limit: int,
+    since: ReviewWatermark | None,
+    max_concurrent_pages: int,
+) -> Iterator[NormalizedReview]:
+    loop = asyncio.new_event_loop()
+    window = max(1, max_concurrent_pages)
+    executor = ThreadPoolExecutor(max_workers=window, thread_name_prefix="apple-rss")
+    loop.set_default_executor(executor)
+    tasks: dict[int, asyncio.Task[tuple[int, Any]]] = {}
+
+    def request(page: int) -> None:
+        if page <= MAX_RSS_PAGES:
+            tasks[page] = loop.create_task(client.get_json(_feed_path(app_id, country_code, page)))
+
+    # Pages are consumed strictly in order with at most `window` requests in flight. Page N+window
+    # is only requested once page N has been consumed as a full page, so with a window of 1 every
+    # request is for a page the feed is known to reach. Once a page ends the feed (short page,
+    # error, watermark, limit or the consumer closing the generator) later requests are cancelled.
+    for page in range(1, window + 1):
+        request(page)
+    emitted = 0
+    try:
+        for page in range(1, MAX_RSS_PAGES + 1):
+            status, payload = loop.run_until_complete(tasks.pop(page))
+            if status != 200 or not isinstance(payload, dict):
+                return
+
+            entries = payload.get("feed", {}).get("entry", [])
+            if not entries:
+                return
+
+            review_entries = _extract_review_entries(entries)
+            if not review_entries:
+                return
+
+            for entry in review_entries:
+                review = _parse_entry(entry=entry, app_id=app_id, country=country_code)
+                # The feed is sorted by most recent, so everything from here on is already stored.
+                if reached_watermark(review, since):
+                    return
+                yield review
+                emitted += 1
+                if limit > 0 and emitted >= limit:
+                    return
+
+            if len(entries) < RSS_PAGE_SIZE:
+                return
+            request(page + window)
+    finally:
+        if tasks:
+            for task in tasks.values():
+                task.cancel()
+            loop.run_until_complete(asyncio.gather(*tasks.values(), return_exceptions=True))
+        loop.close()
+        # Cancelling a task does not stop a request already running on a worker thread; let it
+        # finish in the background instead of holding up the consumer for up to the timeout.
+        executor.shutdown(wait=False, cancel_futures=True)
+        client.close()
+
+
+def iter_apple_reviews(
     app_id: str,
     country: str,
     lang: str,
     limit: int = 0,
-) -> list[NormalizedReview]:
+    since: ReviewWatermark | None = None,
+    *,
+    base_url: str = APPLE_RSS_BASE_URL,
+    max_concurrent_pages: int = DEFAULT_PAGE_CONCURRENCY,
+) -> Iterator[NormalizedReview]:
+    """Yield normalized reviews newest-first as each RSS page arrives."""
     del lang  # kept for signature symmetry with google collector
     app = to_text(app_id)
     if not app:
         raise ValueError("app_id is required")
 
-    try:
-        import requests
-    except ImportError as exc:
-        raise RuntimeError("requests is required for Apple App Store review collection") from exc
-
     country_code = normalize_country(country)
-    reviews: list[NormalizedReview] = []
-    page = 1
+    return _iter_feed(_KeepAliveClient(base_url), app, country_code, limit, since, max_concurrent_pages)
 
-    while True:
-        url = (
-            f"https://itunes.apple.com/{country_code}/rss/customerreviews/"
-            f"page={page}/id={app}/sortBy=mostRecent/json"
+
+def collect_apple_reviews(
+    app_id: str,
+    country: str,
+    lang: str,
+    limit: int = 0,
+    since: ReviewWatermark | None = None,
+    *,
+    base_url: str = APPLE_RSS_BASE_URL,
+    max_concurrent_pages: int = DEFAULT_PAGE_CONCURRENCY,
+) -> list[NormalizedReview]:
+    return list(
+        iter_apple_reviews(
+            app_id,
+            country,
+            lang,
+            limit,
+            since,
+            base_url=base_url,
+            max_concurrent_pages=max_concurrent_pages,
         )
-        response = requests.get(url, timeout=10)
-        if response.status_code != 200:
-            break
-
-        payload = response.json()
-        entries = payload.get("feed", {}).get("entry", [])
-        if not entries:
-            break
-
-        review_entries = _extract_review_entries(entries)
-        if not review_entries:
-            break
-
-        for entry in review_entries:
-            reviews.append(_parse_entry(entry=entry, app_id=app, country=country_code))
-            if limit > 0 and len(reviews) >= limit:
-                return reviews[:limit]
-
-        if len(entries) < 50:
-            break
-        page += 1
-
-    if limit > 0:
-        return reviews[:limit]
-    return reviews
+    )
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import datetime as dt
 import hashlib
 import math
 import re
+import threading
+import time
 from typing import TypedDict
 from urllib.parse import parse_qs, urlparse
 
@@ -29,6 +32,13 @@ class NormalizedReview(TypedDict):
     source_url: str
 
 
+class ReviewWatermark(TypedDict):
+    """Newest review already stored for one store/app/country."""
+
+    review_updated_at: str
+    review_id: str
+
+
 def to_text(value: object) -> str:
     if value is None:
         return ""
@@ -104,3 +114,70 @@ def build_fallback_review_id(*parts: str) -> str:
     joined = "||".join([to_text(part) for part in parts])
     digest = hashlib.sha256(joined.encode("utf-8")).hexdigest()
     return f"hash:{digest[:24]}"
+
+
+def _parse_timestamp(value: str) -> dt.datetime | None:
+    try:
+        parsed = dt.datetime.fromisoformat(to_text(value))
+    except ValueError:
+        return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(dt.timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def _is_older(left: str, right: str) -> bool:
+    # Apple labels carry UTC offsets that flip with DST, so compare parsed instants when possible.
+    left_parsed = _parse_timestamp(left)
+    right_parsed = _parse_timestamp(right)
+    if left_parsed is not None and right_parsed is not None:
+        return left_parsed < right_parsed
+    return to_text(left) < to_text(right)
+
+
+def reached_watermark(review: NormalizedReview, watermark: ReviewWatermark | None) -> bool:
+    """True once a newest-first stream hits the stored watermark review or anything older."""
+    if not watermark:
+        return False
+    if watermark["review_id"] and review["review_id"] == watermark["review_id"]:
+        return True
+    if not watermark["review_updated_at"] or not review["review_updated_at"]:
+        return False
+    return _is_older(review["review_updated_at"], watermark["review_updated_at"])
+
+
+def newest_review(reviews: list[NormalizedReview]) -> NormalizedReview | None:
+    newest: NormalizedReview | None = None
+    for review in reviews:
+        if newest is None or _is_older(newest["review_updated_at"], review["review_updated_at"]):
+            newest = review
+    return newest
+
+
+def is_newer_than_watermark(review: NormalizedReview, watermark: ReviewWatermark | None) -> bool:
+    if not watermark or not watermark["review_updated_at"]:
+        return True
+    return _is_older(watermark["review_updated_at"], review["review_updated_at"])
+
+
+class RateLimiter:
+    """Caps concurrent calls against one store and spaces out their start times."""
+
+    def __init__(self, max_concurrent: int = 1, min_interval_sec: float = 0.0) -> None:
+        self._slots = threading.BoundedSemaphore(max(1, max_concurrent))
+        self._lock = threading.Lock()
+        self._min_interval_sec = max(0.0, min_interval_sec)
+        self._next_start = 0.0
+
+    def __enter__(self) -> "RateLimiter":
+        self._slots.acquire()
+        with self._lock:
+            now = time.monotonic()
+            start_at = max(now, self._next_start)
+            self._next_start = start_at + self._min_interval_sec
+        if start_at > now:
+            time.sleep(start_at - now)
+        return self
+
+    def __exit__(self, exc_type: object, exc: object, tb: object) -> None:
+        self._slots.release()
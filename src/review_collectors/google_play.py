@@ -2,9 +2,21 @@
 
 from __future__ import annotations
 
-from typing import Any
+import time
+from typing import Any, Iterator
 
-from src.review_collectors.common import NormalizedReview, build_fallback_review_id, normalize_country, to_text
+from src.review_collectors.common import (
+    NormalizedReview,
+    ReviewWatermark,
+    build_fallback_review_id,
+    normalize_country,
+    reached_watermark,
+    to_text,
+)
+
+
+PAGE_SIZE = 200
+PAGE_SLEEP_SEC = 0.3
 
 
 def _to_iso(value: Any) -> str:
@@ -15,54 +27,94 @@ def _to_iso(value: Any) -> str:
     return to_text(value)
 
 
-def collect_google_reviews(
+def _normalize_review(raw: dict[str, Any], source_url: str) -> NormalizedReview:
+    created = _to_iso(raw.get("at"))
+    review_id = to_text(raw.get("reviewId")) or build_fallback_review_id(
+        created,
+        to_text(raw.get("userName")),
+        to_text(raw.get("content")),
+    )
+    return {
+        "review_id": review_id,
+        "review_created_at": created,
+        "review_updated_at": created,
+        "rating": to_text(raw.get("score")),
+        "title": to_text(raw.get("title")),
+        "content": to_text(raw.get("content")),
+        "reviewer_name": to_text(raw.get("userName")),
+        "source_url": source_url,
+    }
+
+
+def _iter_pages(
+    scraper: Any,
+    app: str,
+    *,
+    language: str,
+    country_code: str,
+    limit: int,
+    since: ReviewWatermark | None,
+    source_url: str,
+) -> Iterator[NormalizedReview]:
+    emitted = 0
+    token = None
+    while True:
+        batch, token = scraper.reviews(
+            app,
+            lang=language,
+            country=country_code.lower(),
+            sort=scraper.Sort.NEWEST,
+            count=PAGE_SIZE,
+            continuation_token=token,
+        )
+        for raw in batch:
+            review = _normalize_review(raw, source_url)
+            # Newest-first paging lets an incremental run stop at the stored watermark.
+            if reached_watermark(review, since):
+                return
+            yield review
+            emitted += 1
+            if limit > 0 and emitted >= limit:
+                return
+        # The scraper marks the last page with a continuation token whose .token is None.
+        if not batch or token is None or getattr(token, "token", "") is None:
+            return
+        time.sleep(PAGE_SLEEP_SEC)
+
+
+def iter_google_reviews(
     app_id: str,
     country: str,
     lang: str,
     limit: int = 0,
-) -> list[NormalizedReview]:
+    since: ReviewWatermark | None = None,
+) -> Iterator[NormalizedReview]:
+    """Yield normalized reviews newest-first, fetching one scraper page at a time."""
     app = to_text(app_id)
     if not app:
         raise ValueError("app_id is required")
 
     try:
-        from google_play_scraper import Sort, reviews_all
+        import google_play_scraper
     except ImportError as exc:
         raise RuntimeError("google-play-scraper is required for Google Play review collection") from exc
 
-    country_code = normalize_country(country)
-    language = to_text(lang).lower() or "en"
-
-    raw_reviews = reviews_all(
+    return _iter_pages(
+        google_play_scraper,
         app,
-        sleep_milliseconds=300,
-        lang=language,
-        country=country_code.lower(),
-        sort=Sort.NEWEST,
+        language=to_text(lang).lower() or "en",
+        country_code=normalize_country(country),
+        limit=limit,
+        since=since,
+        source_url=f"https://play.google.com/store/apps/details?id={app}",
     )
 
-    if limit > 0:
-        raw_reviews = raw_reviews[:limit]
-
-    source_url = f"https://play.google.com/store/apps/details?id={app}"
-    normalized_rows: list[NormalizedReview] = []
-    for raw in raw_reviews:
-        created = _to_iso(raw.get("at"))
-        review_id = to_text(raw.get("reviewId")) or build_fallback_review_id(
-            created,
-            to_text(raw.get("userName")),
-            to_text(raw.get("content")),
-        )
-        normalized_rows.append(
-            {
-                "review_id": review_id,
-                "review_created_at": created,
-                "review_updated_at": created,
-                "rating": to_text(raw.get("score")),
-                "title": to_text(raw.get("title")),
-                "content": to_text(raw.get("content")),
-                "reviewer_name": to_text(raw.get("userName")),
-                "source_url": source_url,
-            }
-        )
-    return normalized_rows
+
+def collect_google_reviews(
+    app_id: str,
+    country: str,
+    lang: str,
+    limit: int = 0,
+    since: ReviewWatermark | None = None,
+) -> list[NormalizedReview]:
+    return list(iter_google_reviews(app_id, country, lang, limit, since))
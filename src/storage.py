@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import importlib
+from collections.abc import Iterable, Mapping, Sequence
+from contextlib import AbstractContextManager
 from pathlib import Path
 from typing import Any, Protocol, cast
 
@@ -22,12 +24,24 @@ class _StorageBaseModule(Protocol):
 
     def ensure_schema(self) -> None: ...
 
+    def connection_pool_stats(self) -> dict[str, int]: ...
+
+    def close_pooled_connections(self) -> None: ...
+
 
 class _StorageExportsModule(Protocol):
-    def export_table_to_csv(self, table_name: str) -> Path: ...
+    def export_table_to_csv(self, table_name: str, *, incremental: bool = False) -> Path: ...
 
     def export_all_tables_to_csv(self) -> None: ...
 
+    def start_background_exporter(self, interval_sec: float | None = None) -> bool: ...
+
+    def stop_background_exporter(self) -> None: ...
+
+    def flush_exports(self) -> None: ...
+
+    def suppress_exports(self) -> AbstractContextManager[None]: ...
+
 
 class _StorageRecordsModule(Protocol):
     def upsert_table_rows(self, table_name: str, rows: list[dict[str, str]], overwrite_date: str | None = None) -> None: ...
@@ -50,6 +64,23 @@ class _StorageRecordsModule(Protocol):
         consent: bool,
     ) -> bool: ...
 
+    def record_interaction(
+        self,
+        *,
+        timestamp: str,
+        date_iso: str,
+        session_id: str,
+        language: str,
+        channel: str,
+        source_id: str,
+        post_id: str,
+        event_type: str,
+        cta_type: str,
+        lead_email: str,
+        consent: bool,
+        cvr_increments: dict[str, int] | None = None,
+    ) -> bool: ...
+
     def increment_landing_cvr(self, date_iso: str, channel: str, field: str, amount: int = 1) -> None: ...
 
     def append_analytics_event(
@@ -65,12 +96,69 @@ class _StorageRecordsModule(Protocol):
         payload: str,
     ) -> None: ...
 
-    def upsert_app_reviews(self, rows: list[dict[str, str]]) -> dict[str, int]: ...
+    def bulk_insert_landing_events(
+        self,
+        rows: Iterable[Sequence[Any]],
+        manifest_entries: Iterable[dict[str, Any]] = (),
+    ) -> int: ...
+
+    def bulk_insert_analytics_events(
+        self,
+        rows: Iterable[Sequence[Any]],
+        manifest_entries: Iterable[dict[str, Any]] = (),
+    ) -> int: ...
+
+    def fetch_migration_manifest(self) -> dict[str, dict[str, Any]]: ...
+
+    def record_migration_manifest(self, entries: Iterable[dict[str, Any]]) -> None: ...
+
+    def upsert_app_reviews(self, rows: Iterable[dict[str, str]]) -> dict[str, int]: ...
+
+    def fetch_app_review_watermarks(self) -> dict[tuple[str, str, str], dict[str, str]]: ...
+
+    def update_app_review_watermark(
+        self,
+        *,
+        store: str,
+        app_id: str,
+        country: str,
+        review_updated_at: str,
+        review_id: str,
+        updated_at: str,
+    ) -> None: ...
 
     def fetch_metrics_rows(self, table_name: str, date_iso: str) -> list[dict[str, Any]]: ...
 
+    def fetch_metrics_rows_range(
+        self,
+        table_name: str,
+        start_iso: str,
+        end_iso: str,
+    ) -> dict[str, list[dict[str, Any]]]: ...
+
+    def fetch_landing_cvr_totals(self, channel: str, start_iso: str, end_iso: str) -> dict[str, int]: ...
+
+    def fetch_community_source_rows(self, start_iso: str, end_iso: str) -> list[dict[str, Any]]: ...
+
+    def fetch_community_daily_totals(self, start_iso: str, end_iso: str) -> list[dict[str, Any]]: ...
+
+    def fetch_grouped_counts(
+        self,
+        date_iso: str,
+        groups: Mapping[str, Sequence[str]],
+    ) -> dict[str, list[tuple[Any, ...]]]: ...
+
+    def fetch_grouped_counts_by_date(
+        self,
+        start_iso: str,
+        end_iso: str,
+        groups: Mapping[str, Sequence[str]],
+    ) -> dict[str, dict[str, list[tuple[Any, ...]]]]: ...
+
     def append_pre_apply_history(self, path: Path, date_iso: str, summary_line: str) -> None: ...
 
+    def append_pre_apply_history_entries(self, path: Path, entries: Iterable[tuple[str, str]]) -> None: ...
+
 
 def _base() -> _StorageBaseModule:
     return cast(_StorageBaseModule, cast(object, importlib.import_module("src.storage_base")))
@@ -115,14 +203,38 @@ def ensure_schema() -> None:
     _base().ensure_schema()
 
 
-def export_table_to_csv(table_name: str) -> Path:
-    return _exports().export_table_to_csv(table_name)
+def connection_pool_stats() -> dict[str, int]:
+    return _base().connection_pool_stats()
+
+
+def close_pooled_connections() -> None:
+    _base().close_pooled_connections()
+
+
+def export_table_to_csv(table_name: str, *, incremental: bool = False) -> Path:
+    return _exports().export_table_to_csv(table_name, incremental=incremental)
 
 
 def export_all_tables_to_csv() -> None:
     _exports().export_all_tables_to_csv()
 
 
+def start_background_exporter(interval_sec: float | None = None) -> bool:
+    return _exports().start_background_exporter(interval_sec)
+
+
+def stop_background_exporter() -> None:
+    _exports().stop_background_exporter()
+
+
+def flush_exports() -> None:
+    _exports().flush_exports()
+
+
+def suppress_exports() -> AbstractContextManager[None]:
+    return _exports().suppress_exports()
+
+
 def upsert_table_rows(table_name: str, rows: list[dict[str, str]], overwrite_date: str | None = None) -> None:
     _records().upsert_table_rows(table_name, rows, overwrite_date=overwrite_date)
 
@@ -160,6 +272,37 @@ def append_landing_event_if_new(
     )
 
 
+def record_interaction(
+    *,
+    timestamp: str,
+    date_iso: str,
+    session_id: str,
+    language: str,
+    channel: str,
+    source_id: str,
+    post_id: str,
+    event_type: str,
+    cta_type: str,
+    lead_email: str,
+    consent: bool,
+    cvr_increments: dict[str, int] | None = None,
+) -> bool:
+    return _records().record_interaction(
+        timestamp=timestamp,
+        date_iso=date_iso,
+        session_id=session_id,
+        language=language,
+        channel=channel,
+        source_id=source_id,
+        post_id=post_id,
+        event_type=event_type,
+        cta_type=cta_type,
+        lead_email=lead_email,
+        consent=consent,
+        cvr_increments=cvr_increments,
+    )
+
+
 def increment_landing_cvr(date_iso: str, channel: str, field: str, amount: int = 1) -> None:
     _records().increment_landing_cvr(date_iso, channel, field, amount=amount)
 
@@ -187,18 +330,95 @@ def append_analytics_event(
     )
 
 
-def upsert_app_reviews(rows: list[dict[str, str]]) -> dict[str, int]:
+def bulk_insert_landing_events(
+    rows: Iterable[Sequence[Any]],
+    manifest_entries: Iterable[dict[str, Any]] = (),
+) -> int:
+    return _records().bulk_insert_landing_events(rows, manifest_entries)
+
+
+def bulk_insert_analytics_events(
+    rows: Iterable[Sequence[Any]],
+    manifest_entries: Iterable[dict[str, Any]] = (),
+) -> int:
+    return _records().bulk_insert_analytics_events(rows, manifest_entries)
+
+
+def fetch_migration_manifest() -> dict[str, dict[str, Any]]:
+    return _records().fetch_migration_manifest()
+
+
+def record_migration_manifest(entries: Iterable[dict[str, Any]]) -> None:
+    _records().record_migration_manifest(entries)
+
+
+def upsert_app_reviews(rows: Iterable[dict[str, str]]) -> dict[str, int]:
     return _records().upsert_app_reviews(rows)
 
 
+def fetch_app_review_watermarks() -> dict[tuple[str, str, str], dict[str, str]]:
+    return _records().fetch_app_review_watermarks()
+
+
+def update_app_review_watermark(
+    *,
+    store: str,
+    app_id: str,
+    country: str,
+    review_updated_at: str,
+    review_id: str,
+    updated_at: str,
+) -> None:
+    _records().update_app_review_watermark(
+        store=store,
+        app_id=app_id,
+        country=country,
+        review_updated_at=review_updated_at,
+        review_id=review_id,
+        updated_at=updated_at,
+    )
+
+
 def fetch_metrics_rows(table_name: str, date_iso: str) -> list[dict[str, Any]]:
     return _records().fetch_metrics_rows(table_name, date_iso)
 
 
+def fetch_metrics_rows_range(table_name: str, start_iso: str, end_iso: str) -> dict[str, list[dict[str, Any]]]:
+    return _records().fetch_metrics_rows_range(table_name, start_iso, end_iso)
+
+
+def fetch_landing_cvr_totals(channel: str, start_iso: str, end_iso: str) -> dict[str, int]:
+    return _records().fetch_landing_cvr_totals(channel, start_iso, end_iso)
+
+
+def fetch_community_source_rows(start_iso: str, end_iso: str) -> list[dict[str, Any]]:
+    return _records().fetch_community_source_rows(start_iso, end_iso)
+
+
+def fetch_community_daily_totals(start_iso: str, end_iso: str) -> list[dict[str, Any]]:
+    return _records().fetch_community_daily_totals(start_iso, end_iso)
+
+
+def fetch_grouped_counts(date_iso: str, groups: Mapping[str, Sequence[str]]) -> dict[str, list[tuple[Any, ...]]]:
+    return _records().fetch_grouped_counts(date_iso, groups)
+
+
+def fetch_grouped_counts_by_date(
+    start_iso: str,
+    end_iso: str,
+    groups: Mapping[str, Sequence[str]],
+) -> dict[str, dict[str, list[tuple[Any, ...]]]]:
+    return _records().fetch_grouped_counts_by_date(start_iso, end_iso, groups)
+
+
 def append_pre_apply_history(path: Path, date_iso: str, summary_line: str) -> None:
     _records().append_pre_apply_history(path, date_iso, summary_line)
 
 
+def append_pre_apply_history_entries(path: Path, entries: Iterable[tuple[str, str]]) -> None:
+    _records().append_pre_apply_history_entries(path, entries)
+
+
 __all__ = [
     "TABLE_EXPORTS",
     "project_root",
@@ -208,14 +428,34 @@ __all__ = [
     "date_token_to_iso",
     "pseudonymize_lead_email",
     "ensure_schema",
+    "connection_pool_stats",
+    "close_pooled_connections",
     "export_table_to_csv",
     "export_all_tables_to_csv",
+    "start_background_exporter",
+    "stop_background_exporter",
+    "flush_exports",
+    "suppress_exports",
     "upsert_table_rows",
     "upsert_landing_cvr_row",
     "append_landing_event_if_new",
+    "record_interaction",
     "increment_landing_cvr",
     "append_analytics_event",
+    "bulk_insert_landing_events",
+    "bulk_insert_analytics_events",
+    "fetch_migration_manifest",
+    "record_migration_manifest",
     "upsert_app_reviews",
+    "fetch_app_review_watermarks",
+    "update_app_review_watermark",
     "fetch_metrics_rows",
+    "fetch_metrics_rows_range",
+    "fetch_landing_cvr_totals",
+    "fetch_community_source_rows",
+    "fetch_community_daily_totals",
+    "fetch_grouped_counts",
+    "fetch_grouped_counts_by_date",
     "append_pre_apply_history",
+    "append_pre_apply_history_entries",
 ]
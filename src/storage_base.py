@@ -7,6 +7,7 @@ import os
 import sqlite3
 import tempfile
 import threading
+from collections.abc import Generator, Iterable, Sequence
 from pathlib import Path
 from typing import Any
 
@@ -194,16 +195,92 @@ def date_token_to_iso(date_token: str) -> str:
     return f"{token[0:4]}-{token[4:6]}-{token[6:8]}"
 
 
-def _connect() -> sqlite3.Connection:
-    path = db_path()
+def _open_connection(path: Path) -> sqlite3.Connection:
     path.parent.mkdir(parents=True, exist_ok=True)
-    conn = sqlite3.connect(path, timeout=10.0)
+    # Pooled connections are only used by their owning thread; check_same_thread is off so the
+    # pool can close connections left behind by finished threads.
+    conn = sqlite3.connect(path, timeout=10.0, check_same_thread=False)
     conn.row_factory = sqlite3.Row
     conn.execute("PRAGMA foreign_keys=ON;")
     conn.execute("PRAGMA busy_timeout=5000;")
     return conn
 
 
+class _ConnectionPool:
+    def __init__(self) -> None:
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections: dict[tuple[int, Path], tuple[threading.Thread, int, sqlite3.Connection]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def acquire(self, path: Path) -> sqlite3.Connection:
+        key = (threading.get_ident(), path)
+        try:
+            inode = path.stat().st_ino
+        except OSError:
+            inode = -1
+        cached = getattr(self._local, "entry", None)
+        if cached is not None:
+            cached_path, cached_inode, conn = cached
+            if cached_path == path and cached_inode == inode:
+                with self._lock:
+                    self.hits += 1
+                return conn
+            # The thread moved to another database (or the file was replaced): drop the old handle.
+            self._local.entry = None
+            self._discard((key[0], cached_path))
+
+        conn = _open_connection(path)
+        inode = path.stat().st_ino
+        with self._lock:
+            self.misses += 1
+            self._prune_dead_threads()
+            self._connections[key] = (threading.current_thread(), inode, conn)
+        self._local.entry = (path, inode, conn)
+        return conn
+
+    def _discard(self, key: tuple[int, Path]) -> None:
+        with self._lock:
+            entry = self._connections.pop(key, None)
+        if entry is not None:
+            entry[2].close()
+
+    def _prune_dead_threads(self) -> None:
+        for key, (thread, _, conn) in list(self._connections.items()):
+            if not thread.is_alive():
+                del self._connections[key]
+                conn.close()
+
+    def close_all(self) -> None:
+        with self._lock:
+            entries = list(self._connections.values())
+            self._connections.clear()
+        for _, _, conn in entries:
+            conn.close()
+        self._local = threading.local()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            self._prune_dead_threads()
+            return {"hits": self.hits, "misses": self.misses, "open": len(self._connections)}
+
+
+_POOL = _ConnectionPool()
+
+
+def _connect() -> sqlite3.Connection:
+    return _POOL.acquire(db_path().resolve())
+
+
+def connection_pool_stats() -> dict[str, int]:
+    return _POOL.stats()
+
+
+def close_pooled_connections() -> None:
+    _POOL.close_all()
+
+
 def _ensure_column(conn: sqlite3.Connection, table_name: str, column_name: str, column_type: str) -> None:
     info_rows = conn.execute(f"PRAGMA table_info({table_name})").fetchall()
     existing = {row[1] for row in info_rows}
@@ -219,6 +296,132 @@ def pseudonymize_lead_email(lead_email: str) -> str:
     return f"sha256:{digest}"
 
 
+def review_content_hash(rating: object, title: object, content: object, review_updated_at: object) -> str:
+    # Fingerprint of the fields a store can change on an existing review.
+    parts = ["" if value is None else str(value).strip() for value in (rating, title, content, review_updated_at)]
+    return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+
+def _migrate_landing_event_attribution(conn: sqlite3.Connection) -> None:
+    _ensure_column(conn, "landing_events", "source_id", "TEXT")
+    _ensure_column(conn, "landing_events", "post_id", "TEXT")
+
+
+def _migrate_landing_events_dedup(conn: sqlite3.Connection) -> None:
+    # Hashing may collapse legacy emails that differ only in case, so the index is rebuilt afterwards.
+    conn.execute("DROP INDEX IF EXISTS ux_landing_events_dedup")
+    conn.create_function("pseudonymize_lead_email", 1, pseudonymize_lead_email, deterministic=True)
+    conn.execute(
+        """
+        UPDATE landing_events
+        SET lead_email = pseudonymize_lead_email(lead_email)
+        WHERE TRIM(COALESCE(lead_email, '')) != ''
+          AND lead_email NOT LIKE 'sha256:%'
+        """
+    )
+    conn.execute(
+        """
+        DELETE FROM landing_events
+        WHERE id NOT IN (
+          SELECT MIN(id)
+          FROM landing_events
+          GROUP BY date, session_id, channel, source_id, post_id, event_type, cta_type, lead_email
+        )
+        """
+    )
+    conn.execute(
+        """
+        CREATE UNIQUE INDEX IF NOT EXISTS ux_landing_events_dedup
+        ON landing_events (
+          date,
+          session_id,
+          channel,
+          source_id,
+          post_id,
+          event_type,
+          cta_type,
+          lead_email
+        )
+        """
+    )
+
+
+def _migrate_app_review_content_hash(conn: sqlite3.Connection) -> None:
+    _ensure_column(conn, "app_reviews", "content_hash", "TEXT")
+    conn.create_function("review_content_hash", 4, review_content_hash, deterministic=True)
+    conn.execute(
+        """
+        UPDATE app_reviews
+        SET content_hash = review_content_hash(rating, title, content, review_updated_at)
+        WHERE content_hash IS NULL
+        """
+    )
+
+
+def _rollup_community_events(conn: sqlite3.Connection, after_id: int = 0) -> None:
+    # Add community landing_events with id > after_id to the community_source_daily rollup.
+    conn.execute(
+        """
+        INSERT INTO community_source_daily (date, source_id, post_id, visitors, cta, leads)
+        SELECT
+          date,
+          TRIM(COALESCE(source_id, '')),
+          TRIM(COALESCE(post_id, '')),
+          SUM(TRIM(event_type) = 'visit'),
+          SUM(TRIM(event_type) = 'cta_click'),
+          SUM(TRIM(event_type) = 'lead_submit')
+        FROM landing_events
+        WHERE id > ?
+          AND TRIM(channel) = 'community'
+          AND TRIM(event_type) IN ('visit', 'cta_click', 'lead_submit')
+        GROUP BY date, TRIM(COALESCE(source_id, '')), TRIM(COALESCE(post_id, ''))
+        ON CONFLICT(date, source_id, post_id) DO UPDATE SET
+          visitors = visitors + excluded.visitors,
+          cta = cta + excluded.cta,
+          leads = leads + excluded.leads
+        """,
+        (after_id,),
+    )
+
+
+def _migrate_community_source_daily(conn: sqlite3.Connection) -> None:
+    # Backfill the rollup that record_interaction maintains for new community events.
+    conn.execute("DELETE FROM community_source_daily")
+    _rollup_community_events(conn)
+
+
+# Append-only: each entry runs once per database and its position is the PRAGMA user_version it sets.
+MIGRATIONS = (
+    _migrate_landing_event_attribution,
+    _migrate_landing_events_dedup,
+    _migrate_app_review_content_hash,
+    _migrate_community_source_daily,
+)
+SCHEMA_VERSION = len(MIGRATIONS)
+
+
+def schema_version(conn: sqlite3.Connection) -> int:
+    return int(conn.execute("PRAGMA user_version").fetchone()[0])
+
+
+def _run_migrations(conn: sqlite3.Connection) -> None:
+    if schema_version(conn) >= SCHEMA_VERSION:
+        return
+    for version, migration in enumerate(MIGRATIONS, start=1):
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            # Re-check under the write lock so concurrent processes never apply a step twice.
+            if schema_version(conn) >= version:
+                conn.rollback()
+                continue
+            migration(conn)
+            conn.execute(f"PRAGMA user_version = {version}")
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+
+
 def ensure_schema() -> None:
     global _schema_ready
     global _schema_ready_db
@@ -247,8 +450,6 @@ def ensure_schema() -> None:
               lead_email TEXT,
               consent INTEGER NOT NULL DEFAULT 0
             );
-            CREATE UNIQUE INDEX IF NOT EXISTS ux_landing_events_dedup
-            ON landing_events (date, session_id, channel, event_type, cta_type, lead_email);
 
             CREATE TABLE IF NOT EXISTS landing_cvr_daily (
               date TEXT NOT NULL,
@@ -259,6 +460,28 @@ def ensure_schema() -> None:
               total_cta INTEGER NOT NULL DEFAULT 0,
               PRIMARY KEY (date, channel)
             );
+            CREATE INDEX IF NOT EXISTS ix_landing_cvr_daily_channel_date
+              ON landing_cvr_daily (channel, date, visitors, total_cta);
+
+            CREATE TABLE IF NOT EXISTS community_source_daily (
+              date TEXT NOT NULL,
+              source_id TEXT NOT NULL,
+              post_id TEXT NOT NULL,
+              visitors INTEGER NOT NULL DEFAULT 0,
+              cta INTEGER NOT NULL DEFAULT 0,
+              leads INTEGER NOT NULL DEFAULT 0,
+              PRIMARY KEY (date, source_id, post_id)
+            );
+
+            CREATE TABLE IF NOT EXISTS migration_manifest (
+              path TEXT PRIMARY KEY,
+              table_name TEXT NOT NULL,
+              size INTEGER NOT NULL,
+              mtime_ns INTEGER NOT NULL,
+              content_hash TEXT NOT NULL,
+              row_count INTEGER NOT NULL DEFAULT 0,
+              ingested_at TEXT NOT NULL
+            );
 
             CREATE TABLE IF NOT EXISTS analytics_events (
               id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -288,11 +511,22 @@ def ensure_schema() -> None:
               content TEXT,
               reviewer_name TEXT,
               source_url TEXT,
+              content_hash TEXT,
               PRIMARY KEY (store, app_id, country, review_id)
             );
             CREATE INDEX IF NOT EXISTS ix_app_reviews_date_store
               ON app_reviews (date, store);
 
+            CREATE TABLE IF NOT EXISTS app_review_watermarks (
+              store TEXT NOT NULL,
+              app_id TEXT NOT NULL,
+              country TEXT NOT NULL,
+              review_updated_at TEXT NOT NULL,
+              review_id TEXT NOT NULL,
+              updated_at TEXT NOT NULL,
+              PRIMARY KEY (store, app_id, country)
+            );
+
             CREATE TABLE IF NOT EXISTS trip_safety (
               scenario_id TEXT NOT NULL,
               date TEXT NOT NULL,
@@ -371,53 +605,17 @@ def ensure_schema() -> None:
             );
                 """
             )
-            _ensure_column(conn, "landing_events", "source_id", "TEXT")
-            _ensure_column(conn, "landing_events", "post_id", "TEXT")
-            conn.execute("DROP INDEX IF EXISTS ux_landing_events_dedup")
-            rows = conn.execute(
-                """
-                SELECT id, lead_email
-                FROM landing_events
-                WHERE TRIM(COALESCE(lead_email, '')) != ''
-                  AND lead_email NOT LIKE 'sha256:%'
-                """
-            ).fetchall()
-            for row in rows:
-                conn.execute(
-                    "UPDATE landing_events SET lead_email = ? WHERE id = ?",
-                    (pseudonymize_lead_email(str(row["lead_email"])), int(row["id"])),
-                )
-            conn.execute(
-                """
-                DELETE FROM landing_events
-                WHERE id NOT IN (
-                  SELECT MIN(id)
-                  FROM landing_events
-                  GROUP BY date, session_id, channel, source_id, post_id, event_type, cta_type, lead_email
-                )
-                """
-            )
-            conn.execute(
-                """
-                CREATE UNIQUE INDEX IF NOT EXISTS ux_landing_events_dedup
-                ON landing_events (
-                  date,
-                  session_id,
-                  channel,
-                  source_id,
-                  post_id,
-                  event_type,
-                  cta_type,
-                  lead_email
-                )
-                """
-            )
+            _run_migrations(conn)
         _schema_ready = True
         _schema_ready_db = current_db
 
 
-def _atomic_write_csv(path: Path, fieldnames: list[str], rows: list[dict[str, Any]]) -> None:
+EXPORT_FETCH_SIZE = 1000
+
+
+def _atomic_write_csv(path: Path, fieldnames: list[str], rows: Iterable[Sequence[Any]]) -> int:
     path.parent.mkdir(parents=True, exist_ok=True)
+    written = 0
     with _EXPORT_LOCK:
         with tempfile.NamedTemporaryFile(
             mode="w",
@@ -428,12 +626,49 @@ def _atomic_write_csv(path: Path, fieldnames: list[str], rows: list[dict[str, An
             suffix=".tmp",
             delete=False,
         ) as handle:
-            writer = csv.DictWriter(handle, fieldnames=fieldnames)
-            writer.writeheader()
-            for row in rows:
-                writer.writerow({key: row.get(key, "") for key in fieldnames})
             tmp_path = Path(handle.name)
+            try:
+                writer = csv.writer(handle)
+                writer.writerow(fieldnames)
+                for row in rows:
+                    writer.writerow(row)
+                    written += 1
+            except BaseException:
+                handle.close()
+                tmp_path.unlink(missing_ok=True)
+                raise
         tmp_path.replace(path)
+    return written
+
+
+def _append_csv_rows(path: Path, rows: Iterable[Sequence[Any]]) -> int:
+    written = 0
+    with _EXPORT_LOCK:
+        with path.open("a", newline="", encoding="utf-8") as handle:
+            writer = csv.writer(handle)
+            for row in rows:
+                writer.writerow(row)
+                written += 1
+    return written
+
+
+def _iter_rows(
+    conn: sqlite3.Connection,
+    sql: str,
+    params: tuple[Any, ...] = (),
+    fetch_size: int = EXPORT_FETCH_SIZE,
+) -> Generator[tuple[Any, ...], None, None]:
+    cur = conn.cursor()
+    cur.row_factory = None
+    cur.execute(sql, params)
+    try:
+        while True:
+            batch = cur.fetchmany(fetch_size)
+            if not batch:
+                return
+            yield from batch
+    finally:
+        cur.close()
 
 
 def _fetch_rows(conn: sqlite3.Connection, sql: str, params: tuple[Any, ...] = ()) -> list[dict[str, Any]]:
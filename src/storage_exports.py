@@ -1,7 +1,16 @@
 from __future__ import annotations
 
+import atexit
 import importlib
+import itertools
+import logging
+import os
 import sqlite3
+import threading
+import time
+from collections.abc import Generator, Iterable, Iterator, Sequence
+from contextlib import contextmanager
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Protocol, cast
 
@@ -13,18 +22,128 @@ class _StorageBaseModule(Protocol):
 
     def _connect(self) -> sqlite3.Connection: ...
 
-    def _fetch_rows(self, conn: sqlite3.Connection, sql: str, params: tuple[Any, ...] = ()) -> list[dict[str, Any]]: ...
+    def _iter_rows(
+        self,
+        conn: sqlite3.Connection,
+        sql: str,
+        params: tuple[Any, ...] = (),
+    ) -> Generator[tuple[Any, ...], None, None]: ...
 
     def data_dir(self) -> Path: ...
 
-    def _atomic_write_csv(self, path: Path, fieldnames: list[str], rows: list[dict[str, Any]]) -> None: ...
+    def db_path(self) -> Path: ...
+
+    def _atomic_write_csv(self, path: Path, fieldnames: list[str], rows: Iterable[Sequence[Any]]) -> int: ...
+
+    def _append_csv_rows(self, path: Path, rows: Iterable[Sequence[Any]]) -> int: ...
 
 
 def _base() -> _StorageBaseModule:
     return cast(_StorageBaseModule, cast(object, importlib.import_module("src.storage_base")))
 
 
-def export_table_to_csv(table_name: str) -> Path:
+EXPORT_ORDER_BY = {
+    "landing_events": "timestamp ASC, id ASC",
+    "landing_cvr_daily": "date ASC, channel ASC",
+    "analytics_events": "timestamp ASC, id ASC",
+    "app_reviews": "date ASC, timestamp ASC, store ASC, app_id ASC, country ASC",
+}
+
+# Append-only tables whose CSV export can be extended in place instead of rewritten.
+INCREMENTAL_EXPORT_TABLES = ("landing_events", "analytics_events")
+
+
+def _export_select_sql(table_name: str, fieldnames: list[str], *, with_id: bool = False, after_id: bool = False) -> str:
+    # Selecting the CSV columns in header order lets rows stream straight into csv.writer.
+    columns = fieldnames + ["id"] if with_id else fieldnames
+    where_sql = " WHERE id > ?" if after_id else ""
+    order_sql = EXPORT_ORDER_BY.get(table_name, "date ASC")
+    return f"SELECT {', '.join(columns)} FROM {table_name}{where_sql} ORDER BY {order_sql}"
+
+
+@dataclass
+class _ExportWatermark:
+    db_path: Path
+    csv_path: Path
+    last_id: int
+    last_timestamp: str
+    csv_size: int
+
+    def matches(self, db_path: Path, csv_path: Path) -> bool:
+        if self.db_path != db_path or self.csv_path != csv_path:
+            return False
+        try:
+            return csv_path.stat().st_size == self.csv_size
+        except OSError:
+            return False
+
+
+# Strips the trailing id column while remembering the newest id/timestamp (first column) streamed.
+class _WatermarkTracker:
+    def __init__(self, last_id: int = 0, last_timestamp: str = "") -> None:
+        self.last_id = last_id
+        self.last_timestamp = last_timestamp
+
+    def track(self, rows: Iterable[tuple[Any, ...]]) -> Iterator[tuple[Any, ...]]:
+        for row in rows:
+            self.last_id = max(self.last_id, int(row[-1]))
+            self.last_timestamp = max(self.last_timestamp, str(row[0]))
+            yield row[:-1]
+
+
+_WATERMARK_LOCK = threading.Lock()
+_WATERMARKS: dict[str, _ExportWatermark] = {}
+
+
+def _log_export_rate(action: str, table_name: str, written: int, started: float) -> None:
+    elapsed = max(time.perf_counter() - started, 1e-9)
+    logging.info(
+        "CSV export %s table=%s rows=%s elapsed=%.3fs rows_per_sec=%.0f",
+        action,
+        table_name,
+        written,
+        elapsed,
+        written / elapsed,
+    )
+
+
+def _export_append_only_table(base: _StorageBaseModule, table_name: str, incremental: bool) -> Path:
+    filename, fieldnames = base.TABLE_EXPORTS[table_name]
+    out_path = base.data_dir() / filename
+    db = base.db_path().resolve()
+    started = time.perf_counter()
+    with _WATERMARK_LOCK:
+        mark = _WATERMARKS.get(table_name)
+        if incremental and mark is not None and mark.matches(db, out_path):
+            with base._connect() as conn:
+                sql = _export_select_sql(table_name, fieldnames, with_id=True, after_id=True)
+                rows = base._iter_rows(conn, sql, (mark.last_id,))
+                first = next(rows, None)
+                if first is None:
+                    return out_path
+                # Appending rows older than the last exported one would break the timestamp order of the CSV.
+                if str(first[0]) >= mark.last_timestamp:
+                    tracker = _WatermarkTracker(mark.last_id, mark.last_timestamp)
+                    written = base._append_csv_rows(out_path, tracker.track(itertools.chain([first], rows)))
+                    _WATERMARKS[table_name] = _ExportWatermark(
+                        db, out_path, tracker.last_id, tracker.last_timestamp, out_path.stat().st_size
+                    )
+                    logging.debug("CSV export appended table=%s rows=%s", table_name, written)
+                    return out_path
+                rows.close()
+
+        tracker = _WatermarkTracker()
+        with base._connect() as conn:
+            rows = base._iter_rows(conn, _export_select_sql(table_name, fieldnames, with_id=True))
+            written = base._atomic_write_csv(out_path, fieldnames, tracker.track(rows))
+        _WATERMARKS[table_name] = _ExportWatermark(
+            db, out_path, tracker.last_id, tracker.last_timestamp, out_path.stat().st_size
+        )
+    _log_export_rate("rewrite", table_name, written, started)
+    return out_path
+
+
+def export_table_to_csv(table_name: str, *, incremental: bool = False) -> Path:
     base = _base()
     table_exports = base.TABLE_EXPORTS
     if table_name not in table_exports:
@@ -32,79 +151,159 @@ def export_table_to_csv(table_name: str) -> Path:
     base.ensure_schema()
     filename, fieldnames = table_exports[table_name]
 
-    with base._connect() as conn:
-        if table_name == "landing_events":
-            rows = base._fetch_rows(
-                conn,
-                """
-                SELECT
-                  timestamp,
-                  date,
-                  session_id,
-                  language,
-                  channel,
-                  source_id,
-                  post_id,
-                  event_type,
-                  cta_type,
-                  lead_email,
-                  consent
-                FROM landing_events
-                ORDER BY timestamp ASC, id ASC
-                """,
-            )
-            for row in rows:
-                row["consent"] = str(int(row.get("consent") or 0))
-        elif table_name == "landing_cvr_daily":
-            rows = base._fetch_rows(
-                conn,
-                """
-                SELECT date, channel, visitors, pilot_cta, first_scan_cta, total_cta
-                FROM landing_cvr_daily
-                ORDER BY date ASC, channel ASC
-                """,
-            )
-        elif table_name == "analytics_events":
-            rows = base._fetch_rows(
-                conn,
-                """
-                SELECT timestamp, event_name, client_id, channel, language, status, payload
-                FROM analytics_events
-                ORDER BY timestamp ASC, id ASC
-                """,
-            )
-        elif table_name == "app_reviews":
-            rows = base._fetch_rows(
-                conn,
-                """
-                SELECT
-                  timestamp,
-                  date,
-                  service_name,
-                  store,
-                  app_id,
-                  country,
-                  language,
-                  review_id,
-                  review_created_at,
-                  review_updated_at,
-                  rating,
-                  title,
-                  content,
-                  reviewer_name,
-                  source_url
-                FROM app_reviews
-                ORDER BY date ASC, timestamp ASC, store ASC, app_id ASC, country ASC
-                """,
-            )
-        else:
-            rows = base._fetch_rows(conn, f"SELECT * FROM {table_name} ORDER BY date ASC")
+    if table_name in INCREMENTAL_EXPORT_TABLES:
+        return _export_append_only_table(base, table_name, incremental)
 
     out_path = base.data_dir() / filename
-    base._atomic_write_csv(out_path, fieldnames, rows)
+    started = time.perf_counter()
+    with base._connect() as conn:
+        rows = base._iter_rows(conn, _export_select_sql(table_name, fieldnames))
+        written = base._atomic_write_csv(out_path, fieldnames, rows)
+    _log_export_rate("rewrite", table_name, written, started)
     return out_path
 
 
 def export_all_tables_to_csv() -> None:
     for table_name in _base().TABLE_EXPORTS:
         export_table_to_csv(table_name)
+
+
+DEFAULT_EXPORT_INTERVAL_SEC = 2.0
+
+# Serialises exports so a slower, older snapshot never replaces a newer CSV.
+_EXPORT_RUN_LOCK = threading.Lock()
+
+
+def _export_interval_from_env() -> float:
+    raw = os.getenv("KTRIPPEDIA_EXPORT_INTERVAL_SEC", "").strip()
+    if not raw:
+        return DEFAULT_EXPORT_INTERVAL_SEC
+    try:
+        return float(raw)
+    except ValueError:
+        logging.warning("Invalid KTRIPPEDIA_EXPORT_INTERVAL_SEC=%s; fallback to %s", raw, DEFAULT_EXPORT_INTERVAL_SEC)
+        return DEFAULT_EXPORT_INTERVAL_SEC
+
+
+class _BackgroundExporter:
+    def __init__(self, interval_sec: float) -> None:
+        self.interval_sec = interval_sec
+        self._lock = threading.Lock()
+        self._dirty: dict[str, bool] = {}
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="ktrippedia-csv-exporter", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def mark(self, table_name: str, incremental: bool) -> None:
+        with self._lock:
+            # A table stays incremental only while every pending write asked for it.
+            self._dirty[table_name] = self._dirty.get(table_name, True) and incremental
+        self._wake.set()
+
+    def flush(self) -> None:
+        with _EXPORT_RUN_LOCK:
+            with self._lock:
+                pending = self._dirty
+                self._dirty = {}
+                self._wake.clear()
+            for table_name, incremental in pending.items():
+                try:
+                    export_table_to_csv(table_name, incremental=incremental)
+                except Exception:
+                    logging.exception("Background CSV export failed table=%s", table_name)
+
+    def stop(self) -> None:
+        self._stopping.set()
+        self._wake.set()
+        self._thread.join()
+        self.flush()
+
+    def _run(self) -> None:
+        while not self._stopping.is_set():
+            self._wake.wait()
+            # Debounce: let a burst of writes accumulate before exporting once per table.
+            if self._stopping.wait(self.interval_sec):
+                return
+            self.flush()
+
+
+_EXPORTER_LOCK = threading.Lock()
+_exporter: _BackgroundExporter | None = None
+_atexit_registered = False
+
+
+def start_background_exporter(interval_sec: float | None = None) -> bool:
+    global _exporter
+    global _atexit_registered
+    interval = _export_interval_from_env() if interval_sec is None else interval_sec
+    if interval <= 0:
+        return False
+    with _EXPORTER_LOCK:
+        if _exporter is not None:
+            return True
+        _exporter = _BackgroundExporter(interval)
+        _exporter.start()
+        if not _atexit_registered:
+            atexit.register(stop_background_exporter)
+            _atexit_registered = True
+    logging.info("Started background CSV exporter interval=%.2fs", interval)
+    return True
+
+
+def stop_background_exporter() -> None:
+    global _exporter
+    with _EXPORTER_LOCK:
+        exporter = _exporter
+        _exporter = None
+    if exporter is not None:
+        exporter.stop()
+
+
+def flush_exports() -> None:
+    exporter = _exporter
+    if exporter is not None:
+        exporter.flush()
+
+
+_suppress_depth = 0
+_suppressed: dict[str, bool] = {}
+
+
+@contextmanager
+def suppress_exports() -> Iterator[None]:
+    """Defer export requests for the duration of a bulk write.
+
+    Suppression is process-wide, so requests from every thread are collected rather than dropped;
+    when the outermost block exits each table they named is marked dirty once.
+    """
+    global _suppress_depth
+    with _EXPORTER_LOCK:
+        _suppress_depth += 1
+    try:
+        yield
+    finally:
+        with _EXPORTER_LOCK:
+            _suppress_depth -= 1
+            deferred = dict(_suppressed) if not _suppress_depth else {}
+            if deferred:
+                _suppressed.clear()
+        for table_name, incremental in deferred.items():
+            mark_table_dirty(table_name, incremental=incremental)
+
+
+def mark_table_dirty(table_name: str, *, incremental: bool = False) -> None:
+    if table_name not in _base().TABLE_EXPORTS:
+        raise ValueError(f"Unsupported export table: {table_name}")
+    with _EXPORTER_LOCK:
+        if _suppress_depth:
+            # A table stays incremental only while every deferred write asked for it.
+            _suppressed[table_name] = _suppressed.get(table_name, True) and incremental
+            return
+    exporter = _exporter
+    if exporter is None:
+        export_table_to_csv(table_name, incremental=incremental)
+        return
+    exporter.mark(table_name, incremental)
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import importlib
+import itertools
 import sqlite3
+from collections.abc import Iterable, Iterator, Mapping, Sequence
 from pathlib import Path
-from typing import Any, Protocol, cast
+from typing import Any, Protocol, TypeVar, cast
 
 
 class _StorageBaseModule(Protocol):
@@ -17,9 +19,13 @@ class _StorageBaseModule(Protocol):
 
     def pseudonymize_lead_email(self, lead_email: str) -> str: ...
 
+    def review_content_hash(self, rating: object, title: object, content: object, review_updated_at: object) -> str: ...
+
+    def _rollup_community_events(self, conn: sqlite3.Connection, after_id: int = 0) -> None: ...
+
 
 class _StorageExportsModule(Protocol):
-    def export_table_to_csv(self, table_name: str) -> Path: ...
+    def mark_table_dirty(self, table_name: str, *, incremental: bool = False) -> None: ...
 
 
 def _base() -> _StorageBaseModule:
@@ -30,6 +36,55 @@ def _exports() -> _StorageExportsModule:
     return cast(_StorageExportsModule, cast(object, importlib.import_module("src.storage_exports")))
 
 
+UPSERT_CHUNK_SIZE = 5000
+
+APP_REVIEW_COLUMNS = (
+    "timestamp",
+    "date",
+    "service_name",
+    "store",
+    "app_id",
+    "country",
+    "language",
+    "review_id",
+    "review_created_at",
+    "review_updated_at",
+    "rating",
+    "title",
+    "content",
+    "reviewer_name",
+    "source_url",
+)
+APP_REVIEW_KEY_COLUMNS = ("store", "app_id", "country", "review_id")
+
+LANDING_EVENT_COLUMNS = (
+    "timestamp",
+    "date",
+    "session_id",
+    "language",
+    "channel",
+    "source_id",
+    "post_id",
+    "event_type",
+    "cta_type",
+    "lead_email",
+    "consent",
+)
+MIGRATION_MANIFEST_COLUMNS = ("path", "table_name", "size", "mtime_ns", "content_hash", "row_count")
+ANALYTICS_EVENT_COLUMNS = ("timestamp", "date", "event_name", "client_id", "channel", "language", "status", "payload")
+
+_T = TypeVar("_T")
+
+
+def _chunked(items: Iterable[_T], size: int) -> Iterator[list[_T]]:
+    iterator = iter(items)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
 def upsert_table_rows(table_name: str, rows: list[dict[str, str]], overwrite_date: str | None = None) -> None:
     base = _base()
     base.ensure_schema()
@@ -68,17 +123,14 @@ def upsert_table_rows(table_name: str, rows: list[dict[str, str]], overwrite_dat
                 update_columns = ["visitors", "pilot_cta", "first_scan_cta", "total_cta"]
             set_sql = ", ".join([f"{c}=excluded.{c}" for c in update_columns])
 
-            for row in rows:
-                values = [row.get(c, "") for c in columns]
-                conn.execute(
-                    f"""
-                    INSERT INTO {table_name} ({column_sql}) VALUES ({placeholders})
-                    ON CONFLICT DO UPDATE SET {set_sql}
-                    """,
-                    values,
-                )
+            sql = f"""
+                INSERT INTO {table_name} ({column_sql}) VALUES ({placeholders})
+                ON CONFLICT DO UPDATE SET {set_sql}
+            """
+            for chunk in _chunked(rows, UPSERT_CHUNK_SIZE):
+                conn.executemany(sql, [[row.get(c, "") for c in columns] for row in chunk])
 
-    _exports().export_table_to_csv(table_name)
+    _exports().mark_table_dirty(table_name)
 
 
 def upsert_landing_cvr_row(date_iso: str, channel: str) -> None:
@@ -93,7 +145,103 @@ def upsert_landing_cvr_row(date_iso: str, channel: str) -> None:
             """,
             (date_iso, channel),
         )
-    _exports().export_table_to_csv("landing_cvr_daily")
+    _exports().mark_table_dirty("landing_cvr_daily")
+
+
+CVR_FIELDS = ("visitors", "pilot_cta", "first_scan_cta", "total_cta")
+
+
+def _insert_landing_event(
+    conn: sqlite3.Connection,
+    *,
+    timestamp: str,
+    date_iso: str,
+    session_id: str,
+    language: str,
+    channel: str,
+    source_id: str,
+    post_id: str,
+    event_type: str,
+    cta_type: str,
+    lead_email: str,
+    consent: bool,
+) -> bool:
+    before = conn.total_changes
+    conn.execute(
+        """
+        INSERT INTO landing_events (
+          timestamp,
+          date,
+          session_id,
+          language,
+          channel,
+          source_id,
+          post_id,
+          event_type,
+          cta_type,
+          lead_email,
+          consent
+        )
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(date, session_id, channel, source_id, post_id, event_type, cta_type, lead_email) DO NOTHING
+        """,
+        (
+            timestamp,
+            date_iso,
+            session_id,
+            language,
+            channel,
+            source_id,
+            post_id,
+            event_type,
+            cta_type,
+            lead_email,
+            1 if consent else 0,
+        ),
+    )
+    return conn.total_changes > before
+
+
+def _validate_cvr_fields(increments: dict[str, int]) -> None:
+    for field in increments:
+        if field not in CVR_FIELDS:
+            raise ValueError(f"Unsupported cvr field: {field}")
+
+
+def _apply_cvr_increments(conn: sqlite3.Connection, date_iso: str, channel: str, increments: dict[str, int]) -> None:
+    amounts = [int(increments.get(field, 0)) for field in CVR_FIELDS]
+    set_sql = ", ".join([f"{field} = {field} + excluded.{field}" for field in CVR_FIELDS if field in increments])
+    conn.execute(
+        f"""
+        INSERT INTO landing_cvr_daily (date, channel, visitors, pilot_cta, first_scan_cta, total_cta)
+        VALUES (?, ?, ?, ?, ?, ?)
+        ON CONFLICT(date, channel) DO UPDATE SET {set_sql}
+        """,
+        (date_iso, channel, *amounts),
+    )
+
+
+COMMUNITY_EVENT_FIELDS = {"visit": "visitors", "cta_click": "cta", "lead_submit": "leads"}
+
+
+def _apply_community_rollup(
+    conn: sqlite3.Connection,
+    date_iso: str,
+    source_id: str,
+    post_id: str,
+    event_type: str,
+) -> None:
+    field = COMMUNITY_EVENT_FIELDS.get(event_type.strip())
+    if field is None:
+        return
+    conn.execute(
+        f"""
+        INSERT INTO community_source_daily (date, source_id, post_id, {field})
+        VALUES (?, ?, ?, 1)
+        ON CONFLICT(date, source_id, post_id) DO UPDATE SET {field} = {field} + 1
+        """,
+        (date_iso, (source_id or "").strip(), (post_id or "").strip()),
+    )
 
 
 def append_landing_event_if_new(
@@ -110,68 +258,73 @@ def append_landing_event_if_new(
     lead_email: str,
     consent: bool,
 ) -> bool:
+    return record_interaction(
+        timestamp=timestamp,
+        date_iso=date_iso,
+        session_id=session_id,
+        language=language,
+        channel=channel,
+        source_id=source_id,
+        post_id=post_id,
+        event_type=event_type,
+        cta_type=cta_type,
+        lead_email=lead_email,
+        consent=consent,
+    )
+
+
+def record_interaction(
+    *,
+    timestamp: str,
+    date_iso: str,
+    session_id: str,
+    language: str,
+    channel: str,
+    source_id: str,
+    post_id: str,
+    event_type: str,
+    cta_type: str,
+    lead_email: str,
+    consent: bool,
+    cvr_increments: dict[str, int] | None = None,
+) -> bool:
+    increments = {field: amount for field, amount in (cvr_increments or {}).items() if amount}
+    _validate_cvr_fields(increments)
     base = _base()
     base.ensure_schema()
     normalized_lead_email = base.pseudonymize_lead_email(lead_email)
-    inserted = False
     with base._connect() as conn:
-        before = conn.total_changes
-        conn.execute(
-            """
-            INSERT INTO landing_events (
-              timestamp,
-              date,
-              session_id,
-              language,
-              channel,
-              source_id,
-              post_id,
-              event_type,
-              cta_type,
-              lead_email,
-              consent
-            )
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ON CONFLICT(date, session_id, channel, source_id, post_id, event_type, cta_type, lead_email) DO NOTHING
-            """,
-            (
-                timestamp,
-                date_iso,
-                session_id,
-                language,
-                channel,
-                source_id,
-                post_id,
-                event_type,
-                cta_type,
-                normalized_lead_email,
-                1 if consent else 0,
-            ),
+        inserted = _insert_landing_event(
+            conn,
+            timestamp=timestamp,
+            date_iso=date_iso,
+            session_id=session_id,
+            language=language,
+            channel=channel,
+            source_id=source_id,
+            post_id=post_id,
+            event_type=event_type,
+            cta_type=cta_type,
+            lead_email=normalized_lead_email,
+            consent=consent,
         )
-        inserted = conn.total_changes > before
-    _exports().export_table_to_csv("landing_events")
+        if inserted and increments:
+            _apply_cvr_increments(conn, date_iso, channel, increments)
+        if inserted and channel.strip() == "community":
+            _apply_community_rollup(conn, date_iso, source_id, post_id, event_type)
+    _exports().mark_table_dirty("landing_events", incremental=True)
+    if inserted and increments:
+        _exports().mark_table_dirty("landing_cvr_daily")
     return inserted
 
 
 def increment_landing_cvr(date_iso: str, channel: str, field: str, amount: int = 1) -> None:
-    if field not in {"visitors", "pilot_cta", "first_scan_cta", "total_cta"}:
-        raise ValueError(f"Unsupported cvr field: {field}")
+    _validate_cvr_fields({field: amount})
     base = _base()
     base.ensure_schema()
     with base._connect() as conn:
-        conn.execute(
-            """
-            INSERT INTO landing_cvr_daily (date, channel, visitors, pilot_cta, first_scan_cta, total_cta)
-            VALUES (?, ?, 0, 0, 0, 0)
-            ON CONFLICT(date, channel) DO NOTHING
-            """,
-            (date_iso, channel),
-        )
-        conn.execute(
-            f"UPDATE landing_cvr_daily SET {field} = {field} + ? WHERE date = ? AND channel = ?",
-            (amount, date_iso, channel),
-        )
-    _exports().export_table_to_csv("landing_cvr_daily")
+        _apply_cvr_increments(conn, date_iso, channel, {field: amount})
+    _exports().mark_table_dirty("landing_cvr_daily")
 
 
 def append_analytics_event(
@@ -195,93 +348,261 @@ def append_analytics_event(
             """,
             (timestamp, date_iso, event_name, client_id, channel, language, status, payload),
         )
-    _exports().export_table_to_csv("analytics_events")
+    _exports().mark_table_dirty("analytics_events", incremental=True)
+
+
+def _stage_rows(conn: sqlite3.Connection, table_name: str, columns: Sequence[str], rows: Iterable[Sequence[Any]]) -> str:
+    staging = f"temp.staging_{table_name}"
+    column_sql = ", ".join(columns)
+    conn.execute(f"CREATE TEMP TABLE IF NOT EXISTS staging_{table_name} AS SELECT {column_sql} FROM {table_name} WHERE 0")
+    conn.execute(f"DELETE FROM {staging}")
+    placeholders = ", ".join(["?"] * len(columns))
+    for chunk in _chunked(rows, UPSERT_CHUNK_SIZE):
+        conn.executemany(f"INSERT INTO {staging} ({column_sql}) VALUES ({placeholders})", chunk)
+    return staging
+
+
+def _upsert_migration_manifest(conn: sqlite3.Connection, entries: Iterable[dict[str, Any]]) -> None:
+    column_sql = ", ".join(MIGRATION_MANIFEST_COLUMNS)
+    placeholders = ", ".join(["?"] * len(MIGRATION_MANIFEST_COLUMNS))
+    set_sql = ", ".join(f"{c}=excluded.{c}" for c in MIGRATION_MANIFEST_COLUMNS if c != "path")
+    conn.executemany(
+        f"""
+        INSERT INTO migration_manifest ({column_sql}, ingested_at)
+        VALUES ({placeholders}, strftime('%Y-%m-%dT%H:%M:%S', 'now'))
+        ON CONFLICT(path) DO UPDATE SET {set_sql}, ingested_at = excluded.ingested_at
+        """,
+        [[entry.get(c, 0 if c == "row_count" else "") for c in MIGRATION_MANIFEST_COLUMNS] for entry in entries],
+    )
+
+
+def fetch_migration_manifest() -> dict[str, dict[str, Any]]:
+    """Ingested CSV sources keyed by path (relative to the data directory)."""
+    base = _base()
+    base.ensure_schema()
+    with base._connect() as conn:
+        rows = base._fetch_rows(conn, "SELECT * FROM migration_manifest")
+    return {str(row["path"]): row for row in rows}
+
+
+def record_migration_manifest(entries: Iterable[dict[str, Any]]) -> None:
+    base = _base()
+    base.ensure_schema()
+    with base._connect() as conn:
+        _upsert_migration_manifest(conn, entries)
+
 
+def bulk_insert_landing_events(
+    rows: Iterable[Sequence[Any]],
+    manifest_entries: Iterable[dict[str, Any]] = (),
+) -> int:
+    """Insert landing events (``LANDING_EVENT_COLUMNS`` order) in one transaction; returns how many were new.
 
-def upsert_app_reviews(rows: list[dict[str, str]]) -> dict[str, int]:
+    Rows are streamed into a temp staging table and copied over with ``ON CONFLICT DO NOTHING``, so
+    duplicates, within the batch or against stored events, are dropped in SQL. Lead emails are
+    pseudonymised unless they already are, and new community events are added to the rollup.
+    ``manifest_entries`` are recorded in the same transaction, marking their source files ingested.
+    """
     base = _base()
     base.ensure_schema()
-    if not rows:
-        return {"inserted": 0, "updated": 0, "total": 0}
+    email_index = LANDING_EVENT_COLUMNS.index("lead_email")
+
+    def pseudonymized(batch: Iterable[Sequence[Any]]) -> Iterator[list[Any]]:
+        for row in batch:
+            values = list(row)
+            email = str(values[email_index] or "")
+            if not email.startswith("sha256:"):
+                values[email_index] = base.pseudonymize_lead_email(email)
+            yield values
 
-    inserted = 0
-    updated = 0
+    column_sql = ", ".join(LANDING_EVENT_COLUMNS)
     with base._connect() as conn:
-        for row in rows:
-            store = str(row.get("store", "")).strip()
-            app_id = str(row.get("app_id", "")).strip()
-            country = str(row.get("country", "")).strip().upper()
-            review_id = str(row.get("review_id", "")).strip()
-            if not store or not app_id or not country or not review_id:
-                raise ValueError("store, app_id, country, review_id are required for app_reviews upsert")
-
-            exists = conn.execute(
-                """
-                SELECT 1
-                FROM app_reviews
-                WHERE store = ? AND app_id = ? AND country = ? AND review_id = ?
-                LIMIT 1
-                """,
-                (store, app_id, country, review_id),
-            ).fetchone()
-
-            conn.execute(
-                """
-                INSERT INTO app_reviews (
-                  timestamp,
-                  date,
-                  service_name,
-                  store,
-                  app_id,
-                  country,
-                  language,
-                  review_id,
-                  review_created_at,
-                  review_updated_at,
-                  rating,
-                  title,
-                  content,
-                  reviewer_name,
-                  source_url
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT(store, app_id, country, review_id) DO UPDATE SET
-                  timestamp = excluded.timestamp,
-                  date = excluded.date,
-                  service_name = excluded.service_name,
-                  language = excluded.language,
-                  review_created_at = excluded.review_created_at,
-                  review_updated_at = excluded.review_updated_at,
-                  rating = excluded.rating,
-                  title = excluded.title,
-                  content = excluded.content,
-                  reviewer_name = excluded.reviewer_name,
-                  source_url = excluded.source_url
-                """,
-                (
-                    str(row.get("timestamp", "")).strip(),
-                    str(row.get("date", "")).strip(),
-                    str(row.get("service_name", "")).strip(),
-                    store,
-                    app_id,
-                    country,
-                    str(row.get("language", "")).strip(),
-                    review_id,
-                    str(row.get("review_created_at", "")).strip(),
-                    str(row.get("review_updated_at", "")).strip(),
-                    str(row.get("rating", "")).strip(),
-                    str(row.get("title", "")).strip(),
-                    str(row.get("content", "")).strip(),
-                    str(row.get("reviewer_name", "")).strip(),
-                    str(row.get("source_url", "")).strip(),
-                ),
+        staging = _stage_rows(conn, "landing_events", LANDING_EVENT_COLUMNS, pseudonymized(rows))
+        last_id = int(conn.execute("SELECT COALESCE(MAX(id), 0) FROM landing_events").fetchone()[0])
+        before = conn.total_changes
+        conn.execute(
+            f"""
+            INSERT INTO landing_events ({column_sql})
+            SELECT {column_sql} FROM {staging} WHERE true ORDER BY rowid
+            ON CONFLICT DO NOTHING
+            """
+        )
+        inserted = conn.total_changes - before
+        if inserted:
+            base._rollup_community_events(conn, last_id)
+        conn.execute(f"DELETE FROM {staging}")
+        _upsert_migration_manifest(conn, manifest_entries)
+    if inserted:
+        _exports().mark_table_dirty("landing_events", incremental=True)
+    return inserted
+
+
+def bulk_insert_analytics_events(
+    rows: Iterable[Sequence[Any]],
+    manifest_entries: Iterable[dict[str, Any]] = (),
+) -> int:
+    """Insert analytics events (``ANALYTICS_EVENT_COLUMNS`` order) in one transaction; returns how many were inserted.
+
+    ``analytics_events`` has no natural key and identical rows are separate hits, so every row is
+    kept, as with ``append_analytics_event``. The migration manifest keeps a source file from being
+    ingested twice; ``manifest_entries`` are recorded in the same transaction.
+    """
+    base = _base()
+    base.ensure_schema()
+    column_sql = ", ".join(ANALYTICS_EVENT_COLUMNS)
+    placeholders = ", ".join(["?"] * len(ANALYTICS_EVENT_COLUMNS))
+    with base._connect() as conn:
+        before = conn.total_changes
+        for chunk in _chunked(rows, UPSERT_CHUNK_SIZE):
+            conn.executemany(f"INSERT INTO analytics_events ({column_sql}) VALUES ({placeholders})", chunk)
+        inserted = conn.total_changes - before
+        _upsert_migration_manifest(conn, manifest_entries)
+    if inserted:
+        _exports().mark_table_dirty("analytics_events", incremental=True)
+    return inserted
+
+
+APP_REVIEW_UPSERT_OUTCOMES = ("inserted", "updated", "unchanged")
+
+
+def _app_review_values(row: dict[str, str]) -> tuple[str, ...]:
+    values = {column: str(row.get(column, "")).strip() for column in APP_REVIEW_COLUMNS}
+    values["country"] = values["country"].upper()
+    if not all(values[column] for column in APP_REVIEW_KEY_COLUMNS):
+        raise ValueError("store, app_id, country, review_id are required for app_reviews upsert")
+    content_hash = _base().review_content_hash(
+        values["rating"],
+        values["title"],
+        values["content"],
+        values["review_updated_at"],
+    )
+    return (*[values[column] for column in APP_REVIEW_COLUMNS], content_hash)
+
+
+def _upsert_app_review_chunk(conn: sqlite3.Connection, chunk: list[tuple[str, ...]]) -> dict[str, int]:
+    columns = (*APP_REVIEW_COLUMNS, "content_hash")
+    column_sql = ", ".join(columns)
+    key_sql = ", ".join(APP_REVIEW_KEY_COLUMNS)
+    key_match_sql = " AND ".join([f"target.{c} = staged.{c}" for c in APP_REVIEW_KEY_COLUMNS])
+    update_sql = ", ".join([f"{c} = excluded.{c}" for c in columns if c not in APP_REVIEW_KEY_COLUMNS])
+
+    conn.execute("DELETE FROM temp.app_reviews_staging")
+    conn.executemany(
+        f"INSERT INTO temp.app_reviews_staging ({column_sql}) VALUES ({', '.join(['?'] * len(columns))})",
+        chunk,
+    )
+    # Compare each staged row with the version it would overwrite: the previous staged row for the
+    # same key, or the stored row. Matching fingerprints are left untouched.
+    conn.execute(
+        f"""
+        UPDATE temp.app_reviews_staging
+        SET outcome = classified.outcome
+        FROM (
+          SELECT
+            staged.seq,
+            CASE
+              WHEN staged.nth = 1 AND target.review_id IS NULL THEN 'inserted'
+              WHEN staged.content_hash = CASE WHEN staged.nth = 1 THEN target.content_hash ELSE staged.prev_hash END
+                THEN 'unchanged'
+              ELSE 'updated'
+            END AS outcome
+          FROM (
+            SELECT
+              seq,
+              {key_sql},
+              content_hash,
+              ROW_NUMBER() OVER (PARTITION BY {key_sql} ORDER BY seq) AS nth,
+              LAG(content_hash) OVER (PARTITION BY {key_sql} ORDER BY seq) AS prev_hash
+            FROM temp.app_reviews_staging
+          ) AS staged
+          LEFT JOIN app_reviews AS target ON {key_match_sql}
+        ) AS classified
+        WHERE temp.app_reviews_staging.seq = classified.seq
+        """
+    )
+    counts = dict.fromkeys(APP_REVIEW_UPSERT_OUTCOMES, 0)
+    for outcome, count in conn.execute("SELECT outcome, COUNT(*) FROM temp.app_reviews_staging GROUP BY outcome"):
+        counts[str(outcome)] = int(count)
+    # WHERE outcome != 'unchanged' also disambiguates the upsert clause from a join constraint.
+    conn.execute(
+        f"""
+        INSERT INTO app_reviews ({column_sql})
+        SELECT {column_sql} FROM temp.app_reviews_staging WHERE outcome != 'unchanged' ORDER BY seq
+        ON CONFLICT(store, app_id, country, review_id) DO UPDATE SET {update_sql}
+        """
+    )
+    return counts
+
+
+def upsert_app_reviews(rows: Iterable[dict[str, str]]) -> dict[str, int]:
+    base = _base()
+    base.ensure_schema()
+
+    stats = dict.fromkeys(APP_REVIEW_UPSERT_OUTCOMES, 0)
+    total = 0
+    with base._connect() as conn:
+        conn.execute(
+            f"""
+            CREATE TEMP TABLE IF NOT EXISTS app_reviews_staging (
+              seq INTEGER PRIMARY KEY,
+              {", ".join([f"{c} TEXT" for c in APP_REVIEW_COLUMNS])},
+              content_hash TEXT,
+              outcome TEXT
             )
-            if exists:
-                updated += 1
-            else:
-                inserted += 1
+            """
+        )
+        try:
+            for chunk in _chunked((_app_review_values(row) for row in rows), UPSERT_CHUNK_SIZE):
+                for outcome, count in _upsert_app_review_chunk(conn, chunk).items():
+                    stats[outcome] += count
+                total += len(chunk)
+        finally:
+            conn.execute("DROP TABLE IF EXISTS temp.app_reviews_staging")
 
-    _exports().export_table_to_csv("app_reviews")
-    return {"inserted": inserted, "updated": updated, "total": len(rows)}
+    if stats["inserted"] or stats["updated"]:
+        _exports().mark_table_dirty("app_reviews")
+    return {**stats, "total": total}
+
+
+def fetch_app_review_watermarks() -> dict[tuple[str, str, str], dict[str, str]]:
+    base = _base()
+    base.ensure_schema()
+    with base._connect() as conn:
+        rows = conn.execute(
+            "SELECT store, app_id, country, review_updated_at, review_id FROM app_review_watermarks"
+        ).fetchall()
+    return {
+        (str(row["store"]), str(row["app_id"]), str(row["country"])): {
+            "review_updated_at": str(row["review_updated_at"]),
+            "review_id": str(row["review_id"]),
+        }
+        for row in rows
+    }
+
+
+def update_app_review_watermark(
+    *,
+    store: str,
+    app_id: str,
+    country: str,
+    review_updated_at: str,
+    review_id: str,
+    updated_at: str,
+) -> None:
+    base = _base()
+    base.ensure_schema()
+    with base._connect() as conn:
+        conn.execute(
+            """
+            INSERT INTO app_review_watermarks (store, app_id, country, review_updated_at, review_id, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT(store, app_id, country) DO UPDATE SET
+              review_updated_at = excluded.review_updated_at,
+              review_id = excluded.review_id,
+              updated_at = excluded.updated_at
+            """,
+            (store, app_id, country.upper(), review_updated_at, review_id, updated_at),
+        )
 
 
 def fetch_metrics_rows(table_name: str, date_iso: str) -> list[dict[str, Any]]:
@@ -291,7 +612,135 @@ def fetch_metrics_rows(table_name: str, date_iso: str) -> list[dict[str, Any]]:
         return base._fetch_rows(conn, f"SELECT * FROM {table_name} WHERE date = ?", (date_iso,))
 
 
+def fetch_metrics_rows_range(table_name: str, start_iso: str, end_iso: str) -> dict[str, list[dict[str, Any]]]:
+    """Fetch every row dated ``start_iso``..``end_iso`` (inclusive) in one query, keyed by date."""
+    base = _base()
+    base.ensure_schema()
+    grouped: dict[str, list[dict[str, Any]]] = {}
+    with base._connect() as conn:
+        rows = base._fetch_rows(conn, f"SELECT * FROM {table_name} WHERE date BETWEEN ? AND ?", (start_iso, end_iso))
+    for row in rows:
+        grouped.setdefault(str(row.get("date", "")), []).append(row)
+    return grouped
+
+
+def fetch_landing_cvr_totals(channel: str, start_iso: str, end_iso: str) -> dict[str, int]:
+    """Sum a channel's ``landing_cvr_daily`` visitors and total_cta over ``start_iso``..``end_iso``."""
+    base = _base()
+    base.ensure_schema()
+    with base._connect() as conn:
+        row = conn.execute(
+            """
+            SELECT COALESCE(SUM(visitors), 0), COALESCE(SUM(total_cta), 0)
+            FROM landing_cvr_daily
+            WHERE channel = ? AND date BETWEEN ? AND ?
+            """,
+            (channel, start_iso, end_iso),
+        ).fetchone()
+    return {"visitors": int(row[0]), "total_cta": int(row[1])}
+
+
+def fetch_community_source_rows(start_iso: str, end_iso: str) -> list[dict[str, Any]]:
+    """Community visitors/cta/leads per (source_id, post_id) summed over ``start_iso``..``end_iso``.
+
+    Reads the ``community_source_daily`` rollup, so the cost scales with sources rather than events.
+    Blank ids are returned as empty strings.
+    """
+    base = _base()
+    base.ensure_schema()
+    with base._connect() as conn:
+        return base._fetch_rows(
+            conn,
+            """
+            SELECT source_id, post_id, SUM(visitors) AS visitors, SUM(cta) AS cta, SUM(leads) AS leads
+            FROM community_source_daily
+            WHERE date BETWEEN ? AND ?
+            GROUP BY source_id, post_id
+            ORDER BY source_id, post_id
+            """,
+            (start_iso, end_iso),
+        )
+
+
+def fetch_community_daily_totals(start_iso: str, end_iso: str) -> list[dict[str, Any]]:
+    """Community visitors/cta (``landing_cvr_daily``) and leads (rollup) per date, ordered by date."""
+    base = _base()
+    base.ensure_schema()
+    with base._connect() as conn:
+        return base._fetch_rows(
+            conn,
+            """
+            SELECT date, SUM(visitors) AS visitors, SUM(cta) AS cta, SUM(leads) AS leads
+            FROM (
+              SELECT date, visitors, total_cta AS cta, 0 AS leads
+              FROM landing_cvr_daily
+              WHERE channel = 'community' AND date BETWEEN ? AND ?
+              UNION ALL
+              SELECT date, 0, 0, leads
+              FROM community_source_daily
+              WHERE date BETWEEN ? AND ?
+            )
+            GROUP BY date
+            ORDER BY date
+            """,
+            (start_iso, end_iso, start_iso, end_iso),
+        )
+
+
+def fetch_grouped_counts(date_iso: str, groups: Mapping[str, Sequence[str]]) -> dict[str, list[tuple[Any, ...]]]:
+    """Count one date's rows per distinct combination of columns, for several tables in one connection.
+
+    Each result row is ``(*column_values, count)``. Callers normalise the (few) distinct values
+    instead of every row.
+    """
+    by_date = fetch_grouped_counts_by_date(date_iso, date_iso, groups)
+    return by_date.get(date_iso) or {table_name: [] for table_name in groups}
+
+
+def fetch_grouped_counts_by_date(
+    start_iso: str,
+    end_iso: str,
+    groups: Mapping[str, Sequence[str]],
+) -> dict[str, dict[str, list[tuple[Any, ...]]]]:
+    """Like :func:`fetch_grouped_counts` for every date in ``start_iso``..``end_iso``, grouped by date.
+
+    Only dates with at least one row appear in the result; each has an entry for every table.
+    """
+    base = _base()
+    base.ensure_schema()
+    for table_name, columns in groups.items():
+        if table_name not in base.TABLE_EXPORTS:
+            raise ValueError(f"Unsupported table: {table_name}")
+        unknown = set(columns) - set(base.TABLE_EXPORTS[table_name][1])
+        if not columns or unknown:
+            raise ValueError(f"Unsupported columns for {table_name}: {sorted(unknown) or columns}")
+
+    results: dict[str, dict[str, list[tuple[Any, ...]]]] = {}
+    with base._connect() as conn:
+        cur = conn.cursor()
+        cur.row_factory = None
+        try:
+            for table_name, columns in groups.items():
+                column_sql = ", ".join(columns)
+                cur.execute(
+                    f"SELECT date, {column_sql}, COUNT(*) FROM {table_name} "
+                    f"WHERE date BETWEEN ? AND ? GROUP BY date, {column_sql}",
+                    (start_iso, end_iso),
+                )
+                for date_iso, *values in cur.fetchall():
+                    per_date = results.setdefault(str(date_iso), {name: [] for name in groups})
+                    per_date[table_name].append(tuple(values))
+        finally:
+            cur.close()
+    return results
+
+
 def append_pre_apply_history(path: Path, date_iso: str, summary_line: str) -> None:
+    append_pre_apply_history_entries(path, [(date_iso, summary_line)])
+
+
+def append_pre_apply_history_entries(path: Path, entries: Iterable[tuple[str, str]]) -> None:
+    """Insert several ``(date_iso, summary_line)`` history entries with a single rewrite of ``path``."""
     if not path.exists():
         return
     lines = path.read_text(encoding="utf-8").splitlines()
@@ -299,9 +748,14 @@ def append_pre_apply_history(path: Path, date_iso: str, summary_line: str) -> No
     if history_header not in lines:
         lines.extend(["", history_header])
     idx = lines.index(history_header)
-    tail = lines[idx + 1 :]
-    entry = f"- {date_iso}: {summary_line}"
-    if entry in tail:
-        return
-    lines.insert(idx + 1, entry)
-    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    existing = set(lines[idx + 1 :])
+    changed = False
+    for date_iso, summary_line in entries:
+        entry = f"- {date_iso}: {summary_line}"
+        if entry in existing:
+            continue
+        lines.insert(idx + 1, entry)
+        existing.add(entry)
+        changed = True
+    if changed:
+        path.write_text("\n".join(lines) + "\n", encoding="utf-8")
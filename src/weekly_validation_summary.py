@@ -1,9 +1,20 @@
 from __future__ import annotations
 
 import csv
+import datetime as dt
 from pathlib import Path
 
-from src.storage import date_token_to_iso, normalize_date_token
+from src.storage import (
+    date_token_to_iso,
+    db_path,
+    fetch_community_daily_totals,
+    fetch_community_source_rows,
+    fetch_landing_cvr_totals,
+    normalize_date_token,
+)
+
+SUMMARY_SOURCES = ("auto", "sqlite", "csv")
+TREND_FIELDS = ("visitors", "cta", "leads")
 
 
 def to_iso(date_token: str) -> str:
@@ -31,7 +42,50 @@ def in_range(date_iso: str, start_iso: str, end_iso: str) -> bool:
     return start_iso <= date_iso <= end_iso
 
 
-def build_summary(root: Path, start_iso: str, end_iso: str) -> tuple[dict[str, float | int], list[dict[str, float | int | str]]]:
+def sqlite_available(root: Path) -> bool:
+    """True when the configured SQLite database is the one under ``root/data`` and already exists."""
+    configured = db_path()
+    return configured.exists() and configured.parent.resolve() == (root / "data").resolve()
+
+
+def build_summary(
+    root: Path,
+    start_iso: str,
+    end_iso: str,
+    source: str = "auto",
+) -> tuple[dict[str, float | int], list[dict[str, float | int | str]]]:
+    if _use_sqlite(root, source):
+        return build_summary_from_sqlite(start_iso, end_iso)
+    return build_summary_from_csv(root, start_iso, end_iso)
+
+
+def _use_sqlite(root: Path, source: str) -> bool:
+    if source not in SUMMARY_SOURCES:
+        raise ValueError(f"source must be one of {', '.join(SUMMARY_SOURCES)}")
+    return source == "sqlite" or (source == "auto" and sqlite_available(root))
+
+
+def build_summary_from_sqlite(
+    start_iso: str,
+    end_iso: str,
+) -> tuple[dict[str, float | int], list[dict[str, float | int | str]]]:
+    totals = fetch_landing_cvr_totals("community", start_iso, end_iso)
+    source_map: dict[tuple[str, str], dict[str, int]] = {}
+    for row in fetch_community_source_rows(start_iso, end_iso):
+        source_id = str(row.get("source_id", "")).strip() or "unknown"
+        post_id = str(row.get("post_id", "")).strip() or "unknown"
+        values = source_map.setdefault((source_id, post_id), {"visitors": 0, "cta": 0, "leads": 0})
+        for field in values:
+            values[field] += int(row.get(field) or 0)
+    leads = sum(values["leads"] for values in source_map.values())
+    return _summarize(totals["visitors"], totals["total_cta"], leads, source_map)
+
+
+def build_summary_from_csv(
+    root: Path,
+    start_iso: str,
+    end_iso: str,
+) -> tuple[dict[str, float | int], list[dict[str, float | int | str]]]:
     cvr_rows = read_csv(root / "data" / "landing_cvr.csv")
     event_rows = read_csv(root / "data" / "landing_events.csv")
 
@@ -71,6 +125,15 @@ def build_summary(root: Path, start_iso: str, end_iso: str) -> tuple[dict[str, f
             source_map[key]["leads"] += 1
             leads += 1
 
+    return _summarize(visitors, cta, leads, source_map)
+
+
+def _summarize(
+    visitors: int,
+    cta: int,
+    leads: int,
+    source_map: dict[tuple[str, str], dict[str, int]],
+) -> tuple[dict[str, float | int], list[dict[str, float | int | str]]]:
     cta_rate = round((cta / visitors * 100.0), 2) if visitors else 0.0
     lead_rate = round((leads / visitors * 100.0), 2) if visitors else 0.0
 
@@ -168,13 +231,157 @@ def write_markdown(
     out_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
 
 
-def run_weekly_summary(root: Path, start_token: str, end_token: str, out_relative_path: str) -> Path:
+def run_weekly_summary(
+    root: Path,
+    start_token: str,
+    end_token: str,
+    out_relative_path: str,
+    source: str = "auto",
+) -> Path:
     start_iso = to_iso(start_token)
     end_iso = to_iso(end_token)
     if start_iso > end_iso:
         raise ValueError("start must be <= end")
 
-    summary, source_rows = build_summary(root=root, start_iso=start_iso, end_iso=end_iso)
+    summary, source_rows = build_summary(root=root, start_iso=start_iso, end_iso=end_iso, source=source)
     out_path = root / out_relative_path
     write_markdown(out_path=out_path, start_iso=start_iso, end_iso=end_iso, summary=summary, source_rows=source_rows)
     return out_path
+
+
+def daily_community_totals(root: Path, start_iso: str, end_iso: str, source: str = "auto") -> dict[str, dict[str, int]]:
+    """Community visitors/cta/leads per date in one pass over the chosen source."""
+    if _use_sqlite(root, source):
+        return {
+            str(row["date"]): {field: int(row.get(field) or 0) for field in TREND_FIELDS}
+            for row in fetch_community_daily_totals(start_iso, end_iso)
+        }
+
+    daily: dict[str, dict[str, int]] = {}
+    for row in read_csv(root / "data" / "landing_cvr.csv"):
+        date_iso = (row.get("date", "") or "").strip()
+        if (row.get("channel", "") or "").strip() != "community" or not in_range(date_iso, start_iso, end_iso):
+            continue
+        values = daily.setdefault(date_iso, {field: 0 for field in TREND_FIELDS})
+        values["visitors"] += parse_int(row.get("visitors", ""))
+        values["cta"] += parse_int(row.get("total_cta", ""))
+    for row in read_csv(root / "data" / "landing_events.csv"):
+        date_iso = (row.get("date", "") or "").strip()
+        if (row.get("channel", "") or "").strip() != "community" or not in_range(date_iso, start_iso, end_iso):
+            continue
+        if (row.get("event_type", "") or "").strip() == "lead_submit":
+            daily.setdefault(date_iso, {field: 0 for field in TREND_FIELDS})["leads"] += 1
+    return daily
+
+
+def build_trend(
+    root: Path,
+    end_iso: str,
+    weeks: int,
+    source: str = "auto",
+) -> tuple[list[dict[str, int | str]], dict[str, dict[str, float | int]]]:
+    """Weekly windows ending at ``end_iso`` with week-over-week deltas, plus rolling 7d/28d totals.
+
+    Daily totals are loaded once and turned into prefix sums, so every window is an O(1) difference.
+    """
+    if weeks < 1:
+        raise ValueError("weeks must be >= 1")
+    end = dt.date.fromisoformat(end_iso)
+    first_week_start = end - dt.timedelta(days=7 * weeks - 1)
+    # Reach back far enough for the week before the first one and for its 28-day rolling window.
+    history_start = first_week_start - dt.timedelta(days=21)
+    days = [history_start + dt.timedelta(days=offset) for offset in range((end - history_start).days + 1)]
+    daily = daily_community_totals(root, history_start.isoformat(), end_iso, source=source)
+
+    prefix = {field: [0] for field in TREND_FIELDS}
+    for day in days:
+        values = daily.get(day.isoformat(), {})
+        for field in TREND_FIELDS:
+            prefix[field].append(prefix[field][-1] + values.get(field, 0))
+
+    def window(end_index: int, length: int) -> dict[str, int]:
+        start_index = max(0, end_index + 1 - length)
+        return {field: prefix[field][end_index + 1] - prefix[field][start_index] for field in TREND_FIELDS}
+
+    rows: list[dict[str, int | str]] = []
+    for week in range(weeks):
+        week_end_index = (first_week_start - history_start).days + 7 * week + 6
+        current = window(week_end_index, 7)
+        previous = window(week_end_index - 7, 7)
+        rolling_28d = window(week_end_index, 28)
+        row: dict[str, int | str] = {
+            "week_start": days[week_end_index - 6].isoformat(),
+            "week_end": days[week_end_index].isoformat(),
+        }
+        for field in TREND_FIELDS:
+            row[field] = current[field]
+            row[f"{field}_delta"] = current[field] - previous[field]
+            row[f"rolling_28d_{field}"] = rolling_28d[field]
+        rows.append(row)
+
+    rolling: dict[str, dict[str, float | int]] = {}
+    for label, length in (("7d", 7), ("28d", 28)):
+        totals = window(len(days) - 1, length)
+        rolling[label] = {
+            **totals,
+            "cta_rate": round((totals["cta"] / totals["visitors"] * 100.0), 2) if totals["visitors"] else 0.0,
+            "lead_rate": round((totals["leads"] / totals["visitors"] * 100.0), 2) if totals["visitors"] else 0.0,
+        }
+    return rows, rolling
+
+
+def write_trend_markdown(
+    out_path: Path,
+    end_iso: str,
+    rows: list[dict[str, int | str]],
+    rolling: dict[str, dict[str, float | int]],
+) -> None:
+    lines = [
+        "# Weekly Community Validation Trend",
+        "",
+        f"- Period: {rows[0]['week_start']} ~ {end_iso} ({len(rows)} weeks)",
+        "- Scope: demand-validation landing only (not product launch)",
+        "",
+        f"## Rolling Metrics (as of {end_iso})",
+        "",
+        "| window | visitors | cta | leads | cta_rate | lead_rate |",
+        "|---|---:|---:|---:|---:|---:|",
+    ]
+    for label, values in rolling.items():
+        lines.append(
+            f"| {label} | {values['visitors']} | {values['cta']} | {values['leads']} | {values['cta_rate']}% | {values['lead_rate']}% |"
+        )
+    lines.extend(
+        [
+            "",
+            "## Weekly Windows",
+            "",
+            "| week | visitors | WoW | cta | WoW | leads | WoW | 28d visitors | 28d cta | 28d leads |",
+            "|---|---:|---:|---:|---:|---:|---:|---:|---:|---:|",
+        ]
+    )
+    for row in rows:
+        lines.append(
+            f"| {row['week_start']} ~ {row['week_end']} "
+            f"| {row['visitors']} | {int(row['visitors_delta']):+d} "
+            f"| {row['cta']} | {int(row['cta_delta']):+d} "
+            f"| {row['leads']} | {int(row['leads_delta']):+d} "
+            f"| {row['rolling_28d_visitors']} | {row['rolling_28d_cta']} | {row['rolling_28d_leads']} |"
+        )
+
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    out_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def run_weekly_trend(
+    root: Path,
+    end_token: str,
+    weeks: int,
+    out_relative_path: str,
+    source: str = "auto",
+) -> Path:
+    end_iso = to_iso(end_token)
+    rows, rolling = build_trend(root=root, end_iso=end_iso, weeks=weeks, source=source)
+    out_path = root / out_relative_path
+    write_trend_markdown(out_path=out_path, end_iso=end_iso, rows=rows, rolling=rolling)
+    return out_path
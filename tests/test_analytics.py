@@ -2,12 +2,15 @@ import csv
 import json
 import os
 import tempfile
+import threading
+import time
 import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 from urllib.error import URLError
 from unittest.mock import patch
 
-from src.analytics import GA4Tracker
+from src.analytics import GA4DispatchQueue, GA4Tracker, dispatch_queue
 
 
 def read_rows(path: Path) -> list[dict[str, str]]:
@@ -17,6 +20,35 @@ def read_rows(path: Path) -> list[dict[str, str]]:
         return list(csv.DictReader(handle))
 
 
+class _StubCollectServer:
+    def __init__(self) -> None:
+        self.bodies: list[dict] = []
+        owner = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self) -> None:  # noqa: N802
+                length = int(self.headers.get("Content-Length", "0"))
+                owner.bodies.append(json.loads(self.rfile.read(length).decode("utf-8")))
+                self.send_response(204)
+                self.end_headers()
+
+            def log_message(self, format, *args) -> None:  # noqa: A002
+                del format, args
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    @property
+    def endpoint(self) -> str:
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}/mp/collect"
+
+    def close(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+
 class AnalyticsTest(unittest.TestCase):
     def setUp(self) -> None:
         self.temp_dir = tempfile.TemporaryDirectory()
@@ -71,6 +103,7 @@ class AnalyticsTest(unittest.TestCase):
             language="EN",
             params={"cta_type": "pilot", "source_id": "reddit", "post_id": "r1"},
         )
+        tracker.flush()
 
         self.assertTrue(mocked_urlopen.called)
         rows = read_rows(self.root / "data" / "analytics_events.csv")
@@ -87,6 +120,8 @@ class AnalyticsTest(unittest.TestCase):
         os.environ["GA4_MEASUREMENT_ID"] = "G-TEST1234"
         os.environ["GA4_API_SECRET"] = "secret-value"
         tracker = GA4Tracker.from_env()
+        tracker.retry_backoff_sec = 0.0
+        failed_before = dispatch_queue().stats()["failed"]
 
         tracker.track(
             date_token="20260216",
@@ -96,11 +131,145 @@ class AnalyticsTest(unittest.TestCase):
             language="EN",
             params={"cta_type": "pilot"},
         )
+        tracker.flush()
 
+        self.assertEqual(mocked_urlopen.call_count, tracker.max_attempts)
         rows = read_rows(self.root / "data" / "analytics_events.csv")
         self.assertEqual(len(rows), 1)
         self.assertEqual(rows[0]["event_name"], "cta_click")
         self.assertEqual(rows[0]["status"], "error_URLError")
+        self.assertEqual(dispatch_queue().stats()["failed"], failed_before + 1)
+
+    @patch("src.analytics.request.urlopen")
+    def test_track_returns_before_delivery_completes(self, mocked_urlopen) -> None:
+        release = threading.Event()
+
+        class _Resp:
+            status = 204
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, exc_type, exc, tb):
+                return False
+
+        def slow_urlopen(req, timeout):  # type: ignore[no-untyped-def]
+            del req, timeout
+            release.wait(5)
+            return _Resp()
+
+        mocked_urlopen.side_effect = slow_urlopen
+        tracker = GA4Tracker(measurement_id="G-TEST1234", api_secret="secret-value")
+        tracker.track(date_token="20260216", event_name="page_view", client_id="cid-async", channel="referral")
+
+        self.assertEqual(read_rows(self.root / "data" / "analytics_events.csv"), [])
+        release.set()
+        tracker.flush()
+        rows = read_rows(self.root / "data" / "analytics_events.csv")
+        self.assertEqual([row["status"] for row in rows], ["sent_204"])
+
+    def test_dispatch_queue_counts_overflow(self) -> None:
+        dispatcher = GA4DispatchQueue(maxsize=1)
+        gate = threading.Event()
+        started = threading.Event()
+
+        def blocking_job() -> bool:
+            started.set()
+            gate.wait(5)
+            return True
+
+        self.assertTrue(dispatcher.submit(blocking_job))
+        started.wait(5)
+        self.assertTrue(dispatcher.submit(lambda: False))
+        self.assertFalse(dispatcher.submit(lambda: True))
+        self.assertFalse(dispatcher.flush(timeout=0.05))
+        gate.set()
+        self.assertTrue(dispatcher.flush(timeout=5))
+
+        stats = dispatcher.stats()
+        self.assertEqual(stats["enqueued"], 2)
+        self.assertEqual(stats["dropped"], 1)
+        self.assertEqual(stats["delivered"], 1)
+        self.assertEqual(stats["failed"], 1)
+        self.assertEqual(stats["pending"], 0)
+
+    def test_batching_sends_one_request_per_full_batch(self) -> None:
+        stub = _StubCollectServer()
+        self.addCleanup(stub.close)
+        tracker = GA4Tracker(
+            measurement_id="G-TEST1234",
+            api_secret="secret-value",
+            batch_size=3,
+            batch_interval_ms=60_000,
+            endpoint=stub.endpoint,
+        )
+        for idx in range(4):
+            tracker.track(
+                date_token="20260216",
+                event_name=f"event_{idx}",
+                client_id="cid-batch",
+                channel="community",
+                language="EN",
+            )
+        dispatch_queue().flush()
+        self.assertEqual(len(stub.bodies), 1)
+        self.assertEqual([event["name"] for event in stub.bodies[0]["events"]], ["event_0", "event_1", "event_2"])
+
+        tracker.flush()
+        self.assertEqual(len(stub.bodies), 2)
+        self.assertEqual(stub.bodies[1]["client_id"], "cid-batch")
+        rows = read_rows(self.root / "data" / "analytics_events.csv")
+        self.assertEqual([row["event_name"] for row in rows], ["event_0,event_1,event_2", "event_3"])
+        self.assertEqual({row["status"] for row in rows}, {"sent_204"})
+        self.assertEqual(len(json.loads(rows[0]["payload"])["events"]), 3)
+
+    def test_batching_flushes_after_interval_and_caps_batch_size(self) -> None:
+        stub = _StubCollectServer()
+        self.addCleanup(stub.close)
+        tracker = GA4Tracker(
+            measurement_id="G-TEST1234",
+            api_secret="secret-value",
+            batch_size=100,
+            batch_interval_ms=50,
+            endpoint=stub.endpoint,
+        )
+        self.assertEqual(tracker.effective_batch_size(), 25)
+        tracker.track(date_token="20260216", event_name="page_view", client_id="cid-a", channel="referral")
+        tracker.track(date_token="20260216", event_name="page_view", client_id="cid-b", channel="referral")
+
+        deadline = time.monotonic() + 5
+        while len(stub.bodies) < 2 and time.monotonic() < deadline:
+            time.sleep(0.02)
+        dispatch_queue().flush()
+        self.assertEqual(sorted(body["client_id"] for body in stub.bodies), ["cid-a", "cid-b"])
+
+    def test_batching_splits_batches_by_logged_dimensions(self) -> None:
+        stub = _StubCollectServer()
+        self.addCleanup(stub.close)
+        tracker = GA4Tracker(
+            measurement_id="G-TEST1234",
+            api_secret="secret-value",
+            batch_size=10,
+            batch_interval_ms=60_000,
+            endpoint=stub.endpoint,
+        )
+        tracker.track(date_token="20260216", event_name="page_view", client_id="cid-mix", channel="community", language="EN")
+        tracker.track(date_token="20260217", event_name="page_view", client_id="cid-mix", channel="community", language="EN")
+        tracker.track(date_token="20260217", event_name="cta_click", client_id="cid-mix", channel="referral", language="EN")
+        tracker.track(date_token="20260217", event_name="lead_submit", client_id="cid-mix", channel="referral", language="JA")
+        tracker.flush()
+
+        self.assertEqual(len(stub.bodies), 4)
+        rows = read_rows(self.root / "data" / "analytics_events.csv")
+        self.assertEqual(
+            sorted((row["channel"], row["language"], row["event_name"]) for row in rows),
+            [
+                ("community", "EN", "page_view"),
+                ("community", "EN", "page_view"),
+                ("referral", "EN", "cta_click"),
+                ("referral", "JA", "lead_submit"),
+            ],
+        )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,181 @@
+import csv
+import os
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from src import csv_to_sqlite_migration, storage_exports
+from src.csv_to_sqlite_migration import run_migration
+from src.storage import (
+    TABLE_EXPORTS,
+    fetch_community_source_rows,
+    fetch_migration_manifest,
+    pseudonymize_lead_email,
+)
+
+LANDING_EVENT_FIELDS = TABLE_EXPORTS["landing_events"][1]
+ANALYTICS_FIELDS = ["timestamp", "date", "event_name", "client_id", "channel", "language", "status", "payload"]
+
+
+def write_csv(path: Path, fieldnames: list[str], rows: list[dict[str, str]]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", newline="", encoding="utf-8") as handle:
+        writer = csv.DictWriter(handle, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def landing_event(date_iso: str, session_id: str, event_type: str, **extra: str) -> dict[str, str]:
+    row = {field: "" for field in LANDING_EVENT_FIELDS}
+    row.update(
+        {
+            "timestamp": f"{date_iso}T10:00:00",
+            "date": date_iso,
+            "session_id": session_id,
+            "language": "EN",
+            "channel": "community",
+            "source_id": "reddit",
+            "post_id": "r1",
+            "event_type": event_type,
+            "consent": "0",
+        }
+    )
+    row.update(extra)
+    return row
+
+
+class CsvToSqliteMigrationTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.temp_dir.name)
+        self.data_dir = self.root / "data"
+        os.environ["KTRIPPEDIA_DATA_DIR"] = str(self.data_dir)
+
+    def tearDown(self) -> None:
+        os.environ.pop("KTRIPPEDIA_DATA_DIR", None)
+        self.temp_dir.cleanup()
+
+    def test_bulk_migration_dedups_and_exports_each_table_once(self) -> None:
+        visit = landing_event("2026-02-16", "s1", "visit")
+        lead = landing_event("2026-02-16", "s1", "lead_submit", lead_email="Me@Example.com", consent="1")
+        hashed_lead = landing_event(
+            "2026-02-17",
+            "s2",
+            "lead_submit",
+            lead_email=pseudonymize_lead_email("you@example.com"),
+            consent="1",
+        )
+        write_csv(self.data_dir / "20260216_landing_events.csv", LANDING_EVENT_FIELDS, [visit, lead, visit])
+        write_csv(
+            self.data_dir / "archive" / "20260217_landing_events.csv",
+            LANDING_EVENT_FIELDS,
+            [visit, hashed_lead, landing_event("2026-02-17", "s3", "visit", channel="referral")],
+        )
+        analytics = {
+            "timestamp": "2026-02-16T10:00:00",
+            "date": "20260216",
+            "event_name": "page_view",
+            "client_id": "c1",
+            "channel": "community",
+            "language": "EN",
+            "status": "sent",
+            "payload": "{}",
+        }
+        write_csv(self.data_dir / "20260216_analytics_events.csv", ANALYTICS_FIELDS, [analytics, analytics])
+
+        self.assertEqual(run_migration(self.root, dry_run=True)["landing_events"], 6)
+        self.assertEqual(run_migration(self.root, dry_run=True, workers=2)["landing_events"], 6)
+        with patch.object(storage_exports, "export_table_to_csv", wraps=storage_exports.export_table_to_csv) as export:
+            stats = run_migration(self.root, dry_run=False)
+
+        self.assertEqual(stats["landing_events"], 4)
+        # Identical analytics rows are separate hits; analytics_events has no natural key.
+        self.assertEqual(stats["analytics_events"], 2)
+        exported = [call.args[0] for call in export.call_args_list]
+        self.assertEqual(sorted(exported), sorted(set(exported)))
+        self.assertIn("landing_events", exported)
+
+        conn = sqlite3.connect(self.data_dir / "ktrippedia.db")
+        try:
+            emails = {row[0] for row in conn.execute("SELECT lead_email FROM landing_events WHERE lead_email != ''")}
+            analytics_dates = [row[0] for row in conn.execute("SELECT date FROM analytics_events")]
+        finally:
+            conn.close()
+        self.assertEqual(emails, {pseudonymize_lead_email("me@example.com"), pseudonymize_lead_email("you@example.com")})
+        self.assertEqual(analytics_dates, ["2026-02-16", "2026-02-16"])
+        self.assertEqual(
+            fetch_community_source_rows("2026-02-16", "2026-02-17"),
+            [{"source_id": "reddit", "post_id": "r1", "visitors": 1, "cta": 0, "leads": 2}],
+        )
+        with (self.data_dir / "landing_events.csv").open(newline="", encoding="utf-8") as handle:
+            self.assertEqual(len(list(csv.DictReader(handle))), 4)
+
+        rerun = run_migration(self.root, dry_run=False, workers=2)
+        self.assertEqual((rerun["landing_events"], rerun["analytics_events"]), (0, 0))
+        self.assertEqual(fetch_community_source_rows("2026-02-16", "2026-02-17")[0]["leads"], 2)
+
+    def test_rerun_skips_ingested_files_and_resumes_with_new_ones(self) -> None:
+        first = self.data_dir / "20260216_landing_events.csv"
+        write_csv(first, LANDING_EVENT_FIELDS, [landing_event("2026-02-16", "s1", "visit")])
+        self.assertEqual(run_migration(self.root, dry_run=False)["landing_events"], 1)
+        manifest = fetch_migration_manifest()
+        self.assertEqual(manifest["20260216_landing_events.csv"]["row_count"], 1)
+        self.assertIn("landing_events.csv", manifest)
+
+        parse = csv_to_sqlite_migration.parse_landing_event_file
+        with patch.object(csv_to_sqlite_migration, "parse_landing_event_file", wraps=parse) as parsed:
+            self.assertEqual(run_migration(self.root, dry_run=False)["landing_events"], 0)
+        parsed.assert_not_called()
+
+        # Same content under a new mtime and path (archived) is hashed and skipped, not re-parsed.
+        archived = self.data_dir / "archive" / first.name
+        archived.parent.mkdir()
+        first.rename(archived)
+        os.utime(archived, ns=(1, 1))
+        write_csv(self.data_dir / "20260217_landing_events.csv", LANDING_EVENT_FIELDS, [landing_event("2026-02-17", "s2", "visit")])
+        with patch.object(csv_to_sqlite_migration, "parse_landing_event_file", wraps=parse) as parsed:
+            self.assertEqual(run_migration(self.root, dry_run=False)["landing_events"], 1)
+        self.assertEqual([call.args[0].name for call in parsed.call_args_list], ["20260217_landing_events.csv"])
+        self.assertEqual(fetch_migration_manifest()["archive/20260216_landing_events.csv"]["mtime_ns"], 1)
+
+        with patch.object(csv_to_sqlite_migration, "parse_landing_event_file", wraps=parse) as parsed:
+            self.assertEqual(run_migration(self.root, dry_run=False, force=True)["landing_events"], 0)
+        # The exported landing_events.csv is owned by the database and is not read back.
+        self.assertEqual(parsed.call_count, 2)
+
+    def test_new_cvr_file_leaves_earlier_totals_unchanged(self) -> None:
+        fields = ["date", "channel", "visitors", "pilot_cta", "first_scan_cta", "total_cta"]
+
+        def cvr(date_iso: str, visitors: str) -> dict[str, str]:
+            return {
+                "date": date_iso,
+                "channel": "community",
+                "visitors": visitors,
+                "pilot_cta": "1",
+                "first_scan_cta": "0",
+                "total_cta": "1",
+            }
+
+        def totals() -> list[tuple[str, int, int]]:
+            conn = sqlite3.connect(self.data_dir / "ktrippedia.db")
+            try:
+                return list(conn.execute("SELECT date, visitors, total_cta FROM landing_cvr_daily ORDER BY date"))
+            finally:
+                conn.close()
+
+        write_csv(self.data_dir / "20260216_landing_cvr.csv", fields, [cvr("2026-02-16", "3")])
+        self.assertEqual(run_migration(self.root, dry_run=False)["landing_cvr_daily"], 1)
+        self.assertEqual(totals(), [("2026-02-16", 3, 1)])
+
+        write_csv(self.data_dir / "20260217_landing_cvr.csv", fields, [cvr("2026-02-17", "5")])
+        self.assertEqual(run_migration(self.root, dry_run=False)["landing_cvr_daily"], 1)
+        self.assertEqual(totals(), [("2026-02-16", 3, 1), ("2026-02-17", 5, 1)])
+
+        run_migration(self.root, dry_run=False, force=True)
+        self.assertEqual(totals(), [("2026-02-16", 3, 1), ("2026-02-17", 5, 1)])
+
+
+if __name__ == "__main__":
+    unittest.main()
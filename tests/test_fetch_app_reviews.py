@@ -1,10 +1,14 @@
 import csv
 import importlib.util
 import tempfile
+import threading
+import time
 import unittest
 from pathlib import Path
 from unittest.mock import patch
 
+from src import storage_exports
+
 
 def load_script_module():  # type: ignore[no-untyped-def]
     root = Path(__file__).resolve().parents[1]
@@ -67,6 +71,47 @@ class FetchAppReviewsScriptTest(unittest.TestCase):
         self.assertEqual(target["apple_app_id"], "")
         self.assertEqual(target["markets"], ["KR", "US", "JP"])
 
+    def test_load_targets_reads_csv_and_tsv_with_header_aliases(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            csv_path = root / "targets.csv"
+            csv_path.write_text(
+                "\ufeff앱 이름,Playstore,AppStore,국가\n"
+                "Example App,https://play.google.com/store/apps/details?id=com.example.app,"
+                "https://apps.apple.com/us/app/example/id123456789,\"KR, US\"\n"
+                ",,,\n"
+                "Apple Only,,https://apps.apple.com/jp/app/other/id987654321,\n",
+                encoding="utf-8",
+            )
+            tsv_path = root / "targets.tsv"
+            tsv_path.write_text("service_name\tgoogle_id\nTsv App\tcom.example.tsv\n", encoding="utf-8")
+
+            with patch.dict("sys.modules", {"pandas": None}):
+                csv_targets = self.module.load_targets(csv_path, ["KR", "US", "JP"])
+                tsv_targets = self.module.load_targets(tsv_path, ["JP"])
+
+        self.assertEqual(
+            csv_targets,
+            [
+                {
+                    "service_name": "Example App",
+                    "google_app_id": "com.example.app",
+                    "apple_app_id": "123456789",
+                    "markets": ["KR", "US"],
+                },
+                {
+                    "service_name": "Apple Only",
+                    "google_app_id": "",
+                    "apple_app_id": "987654321",
+                    "markets": ["KR", "US", "JP"],
+                },
+            ],
+        )
+        self.assertEqual(
+            tsv_targets,
+            [{"service_name": "Tsv App", "google_app_id": "com.example.tsv", "apple_app_id": "", "markets": ["JP"]}],
+        )
+
     def test_run_collection_collects_both_stores_and_writes_csv(self) -> None:
         with tempfile.TemporaryDirectory() as temp_dir:
             root = Path(temp_dir)
@@ -112,13 +157,23 @@ class FetchAppReviewsScriptTest(unittest.TestCase):
 
             created_xlsx: list[Path] = []
 
-            def fake_xlsx(path, rows, sheet_name):  # type: ignore[no-untyped-def]
-                del rows, sheet_name
-                path.parent.mkdir(parents=True, exist_ok=True)
-                path.write_text("ok", encoding="utf-8")
-                created_xlsx.append(path)
+            class FakeWorkbook:
+                def __init__(self, path: Path) -> None:
+                    self.path = path
+
+                def append(self, rows) -> None:  # type: ignore[no-untyped-def]
+                    del rows
 
-            with patch.object(self.module, "write_reviews_xlsx", side_effect=fake_xlsx):
+                def save(self) -> None:
+                    self.path.parent.mkdir(parents=True, exist_ok=True)
+                    self.path.write_text("ok", encoding="utf-8")
+                    created_xlsx.append(self.path)
+
+            def fake_xlsx(path, sheet_name):  # type: ignore[no-untyped-def]
+                del sheet_name
+                return FakeWorkbook(path)
+
+            with patch.object(self.module, "open_reviews_xlsx", side_effect=fake_xlsx):
                 summary = self.module.run_collection(
                     root=root,
                     date_token="20260216",
@@ -135,6 +190,7 @@ class FetchAppReviewsScriptTest(unittest.TestCase):
             self.assertEqual(summary["rows_collected"], 2)
             self.assertEqual(summary["rows_inserted"], 2)
             self.assertEqual(summary["rows_updated"], 0)
+            self.assertEqual(summary["rows_unchanged"], 0)
             self.assertEqual(summary["errors"], [])
             self.assertEqual(summary["by_store_country"]["google_play:US"], 1)
             self.assertEqual(summary["by_store_country"]["apple_app_store:US"], 1)
@@ -144,6 +200,316 @@ class FetchAppReviewsScriptTest(unittest.TestCase):
             self.assertEqual(len(csv_rows), 2)
             self.assertEqual({row["store"] for row in csv_rows}, {"google_play", "apple_app_store"})
 
+    def test_run_collection_parallel_summary_is_deterministic(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            targets = [
+                {
+                    "service_name": f"App {idx}",
+                    "google_app_id": f"com.example.app{idx}",
+                    "apple_app_id": f"{idx}00",
+                    "markets": ["KR", "US"],
+                }
+                for idx in range(3)
+            ]
+            active = {"now": 0, "peak": 0}
+            lock = threading.Lock()
+
+            def make_collector(prefix: str):  # type: ignore[no-untyped-def]
+                def collector(app_id, country, lang, limit):  # type: ignore[no-untyped-def]
+                    del lang, limit
+                    with lock:
+                        active["now"] += 1
+                        active["peak"] = max(active["peak"], active["now"])
+                    time.sleep(0.02)
+                    with lock:
+                        active["now"] -= 1
+                    if app_id == "100" and country == "US":
+                        raise RuntimeError("boom")
+                    return [
+                        {
+                            "review_id": f"{prefix}-{app_id}-{country}",
+                            "review_created_at": "2026-02-16T10:00:00",
+                            "review_updated_at": "2026-02-16T10:00:00",
+                            "rating": "5",
+                            "title": "",
+                            "content": "ok",
+                            "reviewer_name": "",
+                            "source_url": "",
+                        }
+                    ]
+
+                return collector
+
+            writer_threads: set[str] = set()
+            original_upsert = self.module.upsert_app_reviews
+
+            def recording_upsert(rows):  # type: ignore[no-untyped-def]
+                writer_threads.add(threading.current_thread().name)
+                return original_upsert(rows)
+
+            no_limits = {
+                "google_play": self.module.RateLimiter(max_concurrent=4),
+                "apple_app_store": self.module.RateLimiter(max_concurrent=4),
+            }
+            with patch.object(self.module, "upsert_app_reviews", side_effect=recording_upsert):
+                summary = self.module.run_collection(
+                    root=root,
+                    date_token="20260216",
+                    targets=targets,
+                    limit_per_app_country=0,
+                    save_xlsx=False,
+                    out_dir=root / "out",
+                    google_collector=make_collector("g"),
+                    apple_collector=make_collector("a"),
+                    workers=6,
+                    rate_limiters=no_limits,
+                )
+
+            self.assertGreater(active["peak"], 1)
+            self.assertEqual(writer_threads, {"review-writer"})
+            self.assertEqual(summary["rows_collected"], 11)
+            self.assertEqual(summary["rows_inserted"], 11)
+            self.assertEqual(summary["errors"], ["apple_app_store:App 1:US:boom"])
+            self.assertEqual(
+                list(summary["by_store_country"].items()),
+                [("google_play:KR", 3), ("apple_app_store:KR", 3), ("google_play:US", 3), ("apple_app_store:US", 2)],
+            )
+            self.assertEqual(len(read_rows(root / "data" / "app_reviews.csv")), 11)
+
+    def test_run_collection_incremental_passes_and_advances_watermark(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            target = {"service_name": "Example", "google_app_id": "com.example.app", "apple_app_id": "", "markets": ["US"]}
+            received: list[object] = []
+            batches = [
+                [("g-2", "2026-02-16T11:00:00"), ("g-1", "2026-02-16T10:00:00")],
+                [("g-3", "2026-02-17T09:00:00")],
+            ]
+
+            def fake_google(app_id, country, lang, limit, since=None):  # type: ignore[no-untyped-def]
+                del app_id, country, lang, limit
+                received.append(since)
+                return [
+                    {
+                        "review_id": review_id,
+                        "review_created_at": updated,
+                        "review_updated_at": updated,
+                        "rating": "5",
+                        "title": "",
+                        "content": "",
+                        "reviewer_name": "",
+                        "source_url": "",
+                    }
+                    for review_id, updated in batches[len(received) - 1]
+                ]
+
+            for _ in range(2):
+                self.module.run_collection(
+                    root=root,
+                    date_token="20260217",
+                    targets=[target],
+                    limit_per_app_country=0,
+                    save_xlsx=False,
+                    out_dir=root / "out",
+                    google_collector=fake_google,
+                    incremental=True,
+                )
+
+            self.assertEqual(received[0], None)
+            self.assertEqual(received[1], {"review_updated_at": "2026-02-16T11:00:00", "review_id": "g-2"})
+            watermarks = self.module.fetch_app_review_watermarks()
+            self.assertEqual(watermarks[("google_play", "com.example.app", "US")]["review_id"], "g-3")
+            self.assertEqual(len(read_rows(root / "data" / "app_reviews.csv")), 3)
+
+    def test_run_collection_capped_pass_keeps_watermark_for_next_pass(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            target = {"service_name": "Example", "google_app_id": "com.example.app", "apple_app_id": "", "markets": ["US"]}
+            received: list[object] = []
+            newest_first = [f"2026-02-16T{hour:02d}:00:00" for hour in range(20, 14, -1)]
+
+            def fake_google(app_id, country, lang, limit, since=None):  # type: ignore[no-untyped-def]
+                del app_id, country, lang
+                received.append(since)
+                for idx, updated in enumerate(newest_first):
+                    if (limit and idx >= limit) or (since and updated <= since["review_updated_at"]):
+                        return
+                    yield {
+                        "review_id": f"g-{idx}",
+                        "review_created_at": updated,
+                        "review_updated_at": updated,
+                        "rating": "5",
+                        "title": "",
+                        "content": "",
+                        "reviewer_name": "",
+                        "source_url": "",
+                    }
+
+            def collect(limit: int) -> dict[str, object]:
+                return self.module.run_collection(
+                    root=root,
+                    date_token="20260216",
+                    targets=[target],
+                    limit_per_app_country=limit,
+                    save_xlsx=False,
+                    out_dir=root / "out",
+                    google_collector=fake_google,
+                    incremental=True,
+                )
+
+            self.assertEqual(collect(2)["rows_collected"], 2)
+            self.assertEqual(self.module.fetch_app_review_watermarks(), {})
+
+            self.assertEqual(collect(0)["rows_collected"], 6)
+            self.assertEqual(received, [None, None])
+            watermarks = self.module.fetch_app_review_watermarks()
+            self.assertEqual(watermarks[("google_play", "com.example.app", "US")]["review_id"], "g-0")
+            self.assertEqual(len(read_rows(root / "data" / "app_reviews.csv")), 6)
+
+    def test_run_collection_streams_chunks_and_keeps_watermark_on_failure(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            targets = [
+                {"service_name": "Example", "google_app_id": "com.example.ok", "apple_app_id": "", "markets": ["US"]},
+                {"service_name": "Broken", "google_app_id": "com.example.broken", "apple_app_id": "", "markets": ["US"]},
+            ]
+
+            def fake_google(app_id, country, lang, limit):  # type: ignore[no-untyped-def]
+                del country, lang, limit
+                for idx in range(7):
+                    if app_id == "com.example.broken" and idx == 3:
+                        raise RuntimeError("page fetch failed")
+                    yield {
+                        "review_id": f"{app_id}-{idx}",
+                        "review_created_at": f"2026-02-16T{20 - idx:02d}:00:00",
+                        "review_updated_at": f"2026-02-16T{20 - idx:02d}:00:00",
+                        "rating": "5",
+                        "title": "",
+                        "content": "",
+                        "reviewer_name": "",
+                        "source_url": "",
+                    }
+
+            upsert_sizes: list[int] = []
+            original_upsert = self.module.upsert_app_reviews
+
+            def counting_upsert(rows):  # type: ignore[no-untyped-def]
+                upsert_sizes.append(len(rows))
+                return original_upsert(rows)
+
+            with (
+                patch.object(self.module, "upsert_app_reviews", side_effect=counting_upsert),
+                patch.object(storage_exports, "export_table_to_csv", wraps=storage_exports.export_table_to_csv) as export,
+            ):
+                summary = self.module.run_collection(
+                    root=root,
+                    date_token="20260216",
+                    targets=targets,
+                    limit_per_app_country=0,
+                    save_xlsx=False,
+                    out_dir=root / "out",
+                    google_collector=fake_google,
+                    workers=1,
+                    chunk_size=3,
+                )
+
+            self.assertEqual(upsert_sizes, [3, 3, 1, 3])
+            # Chunks do not export on their own; the run exports app_reviews once at the end.
+            self.assertEqual([call.args[0] for call in export.call_args_list], ["app_reviews"])
+            self.assertEqual(summary["by_store_country"], {"google_play:US": 7})
+            self.assertEqual(len(summary["errors"]), 1)
+            watermarks = self.module.fetch_app_review_watermarks()
+            self.assertNotIn(("google_play", "com.example.broken", "US"), watermarks)
+            self.assertEqual(watermarks[("google_play", "com.example.ok", "US")]["review_id"], "com.example.ok-0")
+            self.assertEqual(len(read_rows(root / "data" / "app_reviews.csv")), 10)
+
+    def test_run_collection_consolidated_xlsx_uses_one_workbook(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            targets = [
+                {"service_name": name, "google_app_id": f"com.example.{name}", "apple_app_id": "1", "markets": ["KR", "US"]}
+                for name in ("alpha", "beta")
+            ]
+
+            def fake_collector(app_id, country, lang, limit):  # type: ignore[no-untyped-def]
+                del lang, limit
+                return [
+                    {
+                        "review_id": f"{app_id}-{country}",
+                        "review_created_at": "2026-02-16T10:00:00",
+                        "review_updated_at": "2026-02-16T10:00:00",
+                        "rating": "5",
+                        "title": "",
+                        "content": "",
+                        "reviewer_name": "",
+                        "source_url": "",
+                    }
+                ]
+
+            opened: list[Path] = []
+            appended: dict[str, int] = {}
+            saves: list[Path] = []
+
+            class FakeWorkbook:
+                def __init__(self, path: Path) -> None:
+                    self.path = path
+
+                def append(self, rows, sheet_name=None) -> None:  # type: ignore[no-untyped-def]
+                    appended[sheet_name] = appended.get(sheet_name, 0) + len(rows)
+
+                def save(self) -> None:
+                    saves.append(self.path)
+
+            def fake_open(path, sheet_name=None):  # type: ignore[no-untyped-def]
+                del sheet_name
+                opened.append(path)
+                return FakeWorkbook(path)
+
+            with patch.object(self.module, "open_reviews_xlsx", side_effect=fake_open):
+                summary = self.module.run_collection(
+                    root=root,
+                    date_token="20260216",
+                    targets=targets,
+                    limit_per_app_country=0,
+                    save_xlsx=True,
+                    out_dir=root / "out",
+                    google_collector=fake_collector,
+                    apple_collector=fake_collector,
+                    rate_limiters={},
+                    xlsx_layout="consolidated",
+                )
+
+            self.assertEqual(summary["errors"], [])
+            self.assertEqual(opened, [root / "out" / "app_reviews_20260216.xlsx"])
+            self.assertEqual(saves, opened)
+            self.assertEqual(
+                list(appended),
+                ["google_play_KR", "apple_app_store_KR", "google_play_US", "apple_app_store_US"],
+            )
+            self.assertEqual(set(appended.values()), {2})
+
+    @unittest.skipUnless(importlib.util.find_spec("openpyxl"), "openpyxl is not installed")
+    def test_write_reviews_xlsx_streams_styled_rows(self) -> None:
+        from openpyxl import load_workbook
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "reviews.xlsx"
+            workbook = self.module.open_reviews_xlsx(path, sheet_name="Example_US")
+            workbook.append([{"service_name": "Example", "title": "t1", "content": "c1"}])
+            workbook.append([{"service_name": "Example", "title": "t2", "content": "c2"}])
+            workbook.save()
+
+            sheet = load_workbook(path).active
+            self.assertEqual(sheet.title, "Example_US")
+            self.assertEqual([cell.value for cell in sheet[1]], self.module.XLSX_COLUMNS)
+            self.assertEqual(sheet.max_row, 3)
+            self.assertEqual(sheet["H3"].value, "c2")
+            self.assertTrue(sheet["H3"].alignment.wrap_text)
+            self.assertTrue(sheet["A1"].font.bold)
+            self.assertEqual(sheet.auto_filter.ref, "A1:K3")
+            self.assertEqual(sheet.column_dimensions["H"].width, 80)
+
 
 if __name__ == "__main__":
     unittest.main()
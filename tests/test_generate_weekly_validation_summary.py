@@ -1,10 +1,15 @@
 import csv
+import os
 import subprocess
 import sys
 import tempfile
 import unittest
 from pathlib import Path
 
+from src.landing_tracker import save_lead, track_cta, track_visit
+from src.storage import export_all_tables_to_csv
+from src.weekly_validation_summary import build_summary, build_trend, run_weekly_trend
+
 
 def write_csv(path: Path, fieldnames: list[str], rows: list[dict[str, str]]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
@@ -160,6 +165,106 @@ class WeeklyValidationSummaryScriptTest(unittest.TestCase):
             self.assertIn("| reddit | r1 |", text)
             self.assertIn("| facebook | f1 |", text)
 
+    def test_sqlite_summary_matches_csv_fallback(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            os.environ["KTRIPPEDIA_DATA_DIR"] = str(root / "data")
+            try:
+                for day, session_id, source_id, post_id in (
+                    ("20260215", "s0", "reddit", "r1"),
+                    ("20260216", "s1", "reddit", "r1"),
+                    ("20260216", "s2", "reddit", "r1"),
+                    ("20260217", "s3", "facebook", "f1"),
+                    ("20260217", "s4", "", ""),
+                ):
+                    track_visit(date_token=day, session_id=session_id, channel="community", source_id=source_id, post_id=post_id)
+                    track_cta(
+                        date_token=day,
+                        session_id=session_id,
+                        channel="community",
+                        cta_type="pilot",
+                        language="EN",
+                        source_id=source_id,
+                        post_id=post_id,
+                    )
+                save_lead(
+                    date_token="20260216",
+                    session_id="s1",
+                    channel="community",
+                    language="EN",
+                    lead_email="s1@example.com",
+                    consent=True,
+                    source_id="reddit",
+                    post_id="r1",
+                )
+                track_visit(date_token="20260216", session_id="s5", channel="referral")
+                export_all_tables_to_csv()
+
+                sqlite_summary, sqlite_rows = build_summary(root, "2026-02-16", "2026-02-22", source="sqlite")
+                csv_summary, csv_rows = build_summary(root, "2026-02-16", "2026-02-22", source="csv")
+                auto_summary, _ = build_summary(root, "2026-02-16", "2026-02-22")
+            finally:
+                os.environ.pop("KTRIPPEDIA_DATA_DIR", None)
+
+            self.assertEqual(sqlite_summary, csv_summary)
+            self.assertEqual(auto_summary, sqlite_summary)
+            self.assertEqual(sqlite_summary["visitors"], 4)
+            self.assertEqual(sqlite_summary["leads"], 1)
+            key = lambda row: (row["source_id"], row["post_id"])  # noqa: E731
+            self.assertEqual(sorted(sqlite_rows, key=key), sorted(csv_rows, key=key))
+
+    def test_trend_windows_deltas_and_rolling(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            os.environ["KTRIPPEDIA_DATA_DIR"] = str(root / "data")
+            try:
+                # One visit per day on 2026-02-02..2026-02-22, plus a lead on 2026-02-20.
+                for day in range(2, 23):
+                    track_visit(date_token=f"202602{day:02d}", session_id=f"s{day}", channel="community", source_id="reddit", post_id="r1")
+                track_cta(
+                    date_token="20260220",
+                    session_id="s20",
+                    channel="community",
+                    cta_type="pilot",
+                    language="EN",
+                    source_id="reddit",
+                    post_id="r1",
+                )
+                save_lead(
+                    date_token="20260220",
+                    session_id="s20",
+                    channel="community",
+                    language="EN",
+                    lead_email="s20@example.com",
+                    consent=True,
+                    source_id="reddit",
+                    post_id="r1",
+                )
+                export_all_tables_to_csv()
+
+                rows, rolling = build_trend(root, "2026-02-22", weeks=2, source="sqlite")
+                self.assertEqual((rows, rolling), build_trend(root, "2026-02-22", weeks=2, source="csv"))
+                out_path = run_weekly_trend(root, "20260222", 2, "reports/trend.md")
+            finally:
+                os.environ.pop("KTRIPPEDIA_DATA_DIR", None)
+
+            self.assertEqual(
+                [(row["week_start"], row["week_end"]) for row in rows],
+                [("2026-02-09", "2026-02-15"), ("2026-02-16", "2026-02-22")],
+            )
+            self.assertEqual([row["visitors"] for row in rows], [7, 7])
+            self.assertEqual([row["visitors_delta"] for row in rows], [0, 0])
+            self.assertEqual([row["leads_delta"] for row in rows], [0, 1])
+            self.assertEqual([row["rolling_28d_visitors"] for row in rows], [14, 21])
+            self.assertEqual(rolling["7d"]["cta"], 1)
+            self.assertEqual(rolling["28d"]["visitors"], 21)
+            self.assertEqual(rolling["28d"]["lead_rate"], 4.76)
+            text = out_path.read_text(encoding="utf-8")
+            self.assertIn("| 2026-02-16 ~ 2026-02-22 | 7 | +0 | 1 | +1 | 1 | +1 | 21 | 1 | 1 |", text)
+
+        with self.assertRaises(ValueError):
+            build_trend(root, "2026-02-22", weeks=0, source="csv")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -121,6 +121,25 @@ class LandingTrackerTest(unittest.TestCase):
         self.assertEqual({row["source_id"] for row in cta_events}, {"reddit", "facebook"})
         self.assertEqual({row["post_id"] for row in cta_events}, {"r2", "f1"})
 
+    def test_track_cta_retry_does_not_double_count(self) -> None:
+        for _ in range(2):
+            track_cta(
+                date_token="20260222",
+                session_id="session-retry",
+                channel="community",
+                cta_type="pilot",
+                language="EN",
+                source_id="reddit",
+                post_id="r2",
+            )
+
+        cvr_rows = read_rows(self.data_dir / "landing_cvr.csv")
+        self.assertEqual(len(cvr_rows), 1)
+        self.assertEqual(cvr_rows[0]["pilot_cta"], "1")
+        self.assertEqual(cvr_rows[0]["total_cta"], "1")
+        events = read_rows(self.data_dir / "landing_events.csv")
+        self.assertEqual(len([row for row in events if row["event_type"] == "cta_click"]), 1)
+
     def test_save_lead_requires_consent(self) -> None:
         date_token = "20260222"
         session_id = "session-3"
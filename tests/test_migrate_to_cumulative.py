@@ -1,7 +1,9 @@
 import hashlib
+import tempfile
 import unittest
+from pathlib import Path
 
-from scripts.migrate_to_cumulative import merge_landing_events
+from scripts.migrate_to_cumulative import merge_landing_events, migrate_csvs
 
 
 class MigrateToCumulativeTest(unittest.TestCase):
@@ -85,6 +87,38 @@ class MigrateToCumulativeTest(unittest.TestCase):
         expected_digest = hashlib.sha256("user@example.com".encode("utf-8")).hexdigest()
         self.assertEqual(merged[0]["lead_email"], f"sha256:{expected_digest}")
 
+    def test_parallel_parsing_matches_sequential_merge(self) -> None:
+        sources = {
+            "20260216_landing_events.csv": "date,session_id,channel,event_type,lead_email\n2026-02-16,s1,community,visit,\n",
+            "20260217_landing_events.csv": (
+                "date,session_id,channel,event_type,lead_email\n"
+                "2026-02-16,s1,community,visit,\n"
+                "2026-02-17,s2,community,lead_submit,A@example.com\n"
+            ),
+            "20260216_landing_cvr.csv": "date,channel,visitors,pilot_cta,first_scan_cta,total_cta\n2026-02-16,community,3,1,0,1\n",
+            "20260217_landing_cvr.csv": "date,channel,visitors,pilot_cta,first_scan_cta,total_cta\n2026-02-16,community,2,0,1,1\n",
+            "20260218_trip_safety.csv": "scenario_id,date,resolved\nS001,2026-02-18,yes,extra\nS002,2026-02-18\n",
+        }
+        outputs = []
+        for workers in (1, 3):
+            with tempfile.TemporaryDirectory() as tmp:
+                root = Path(tmp)
+                data_dir = root / "data"
+                (data_dir / "archive").mkdir(parents=True)
+                for name, text in sources.items():
+                    folder = data_dir / "archive" if name.startswith("20260217") else data_dir
+                    (folder / name).write_text(text, encoding="utf-8")
+
+                migrate_csvs(root, workers=workers)
+
+                outputs.append({path.name: path.read_text(encoding="utf-8") for path in sorted(data_dir.glob("*.csv"))})
+                self.assertFalse(list(data_dir.glob("2026*.csv")))
+
+        self.assertEqual(outputs[0], outputs[1])
+        self.assertEqual(set(outputs[0]), {"landing_events.csv", "landing_cvr.csv", "trip_safety.csv"})
+        self.assertIn("2026-02-16,community,5,1,1,2", outputs[0]["landing_cvr.csv"])
+        self.assertEqual(len(outputs[0]["landing_events.csv"].splitlines()), 3)
+
 
 if __name__ == "__main__":
     unittest.main()
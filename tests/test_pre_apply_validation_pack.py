@@ -17,9 +17,12 @@ from src.pre_apply_validation_pack import (
     TRIP_SAFETY_FIELDS,
     build_trip_scenario_rows,
     calculate_metrics,
+    calculate_metrics_range,
+    date_range_tokens,
     evaluate_targets,
     parse_bool,
     run,
+    run_range,
     validate_date_token,
 )
 from src.landing_tracker import save_lead, track_cta, track_visit
@@ -202,6 +205,81 @@ class ValidationPackTest(unittest.TestCase):
         self.assertEqual(metrics["banned_count"], 0)
         self.assertTrue(all(targets.values()))
 
+    def test_metrics_normalise_messy_tokens_in_sql(self) -> None:
+        date_iso = "2026-02-23"
+        upsert_table_rows(
+            "interview_log",
+            [
+                {"interview_id": "I1", "date": date_iso, "segment": "fit_foreign", "pain_tags": "", "quote": "  "},
+                {"interview_id": "I2", "date": date_iso, "segment": " fit_foreign ", "pain_tags": "A; b", "quote": "x"},
+                {"interview_id": "I3", "date": date_iso, "segment": "field_staff", "pain_tags": "a;c", "quote": ""},
+            ],
+        )
+        upsert_table_rows(
+            "landing_cvr_daily",
+            [
+                {"date": date_iso, "channel": "community", "visitors": "10", "total_cta": "3"},
+                {"date": date_iso, "channel": "referral", "visitors": "abc", "total_cta": ""},
+                {"date": date_iso, "channel": "sns_shortform", "visitors": "2.9", "total_cta": "0"},
+            ],
+        )
+        upsert_table_rows(
+            "trip_safety",
+            [
+                {"scenario_id": "S1", "date": date_iso, "resolved": " Yes ", "show_mode_used": "TRUE"},
+                {"scenario_id": "S2", "date": date_iso, "resolved": "no", "show_mode_used": "1"},
+                {"scenario_id": "S3", "date": date_iso, "resolved": "maybe", "show_mode_used": "yes"},
+                {"scenario_id": "S4", "date": date_iso, "resolved": "", "show_mode_used": ""},
+            ],
+        )
+        upsert_table_rows(
+            "b2b_pipeline",
+            [{"meeting_id": "B1", "date": date_iso, "status": " Completed ", "loi_signed": "T", "intent_email": "f"}],
+        )
+        upsert_table_rows(
+            "trip_pass_pricing",
+            [
+                {"response_id": f"P{idx}", "date": date_iso, "willing_to_pay": value}
+                for idx, value in enumerate(["Y", "n", "\tyes\n", "?"])
+            ],
+        )
+        upsert_table_rows(
+            "guardrail_checklist",
+            [
+                {"check_id": "G1", "date": date_iso, "banned_expression_found": "no", "evidence_missing": "", "confidence_missing": ""},
+                {"check_id": "G2", "date": date_iso, "banned_expression_found": "", "evidence_missing": "maybe", "confidence_missing": ""},
+                {"check_id": "G3", "date": date_iso, "banned_expression_found": "", "evidence_missing": "", "confidence_missing": "YES"},
+            ],
+        )
+
+        metrics = calculate_metrics("20260223")
+
+        self.assertEqual(
+            metrics,
+            {
+                "interview_total": 2,
+                "interview_fit": 1,
+                "interview_field": 1,
+                "repeated_pain_points": 1,
+                "visitors": 12,
+                "total_cta": 3,
+                "cta_rate": 25.0,
+                "scenarios_completed": 2,
+                "show_mode_rate": 100.0,
+                "resolved_rate": 50.0,
+                "completed_meetings": 1,
+                "loi_count": 1,
+                "intent_count": 0,
+                "pricing_total": 3,
+                "willing_count": 2,
+                "willing_rate": 66.67,
+                "reviewed_guardrails": 2,
+                "banned_count": 0,
+                "evidence_missing_count": 0,
+                "confidence_missing_count": 1,
+            },
+        )
+
     def test_run_creates_reports_without_bootstrap(self) -> None:
         run(date_token="20260216", root=self.root, overwrite=False, bootstrap=False)
 
@@ -211,6 +289,49 @@ class ValidationPackTest(unittest.TestCase):
         report_text = (self.root / "reports" / "pre_apply_validation.md").read_text(encoding="utf-8")
         self.assertIn("## Community Breakdown", report_text)
 
+    def test_date_range_tokens(self) -> None:
+        self.assertEqual(date_range_tokens("20260227", "20260302"), ["20260227", "20260228", "20260301", "20260302"])
+        self.assertEqual(date_range_tokens("20260216", "20260216"), ["20260216"])
+        with self.assertRaises(ValueError):
+            date_range_tokens("20260217", "20260216")
+
+    def test_metrics_range_matches_single_date_metrics(self) -> None:
+        for date_iso, visitors in (("2026-02-16", "30"), ("2026-02-18", "12")):
+            upsert_table_rows(
+                "landing_cvr_daily",
+                [{"date": date_iso, "channel": "community", "visitors": visitors, "total_cta": "6"}],
+            )
+            upsert_table_rows(
+                "trip_safety",
+                [{"scenario_id": "S001", "date": date_iso, "resolved": "yes", "show_mode_used": "no"}],
+            )
+
+        metrics_by_date = calculate_metrics_range("20260216", "20260218")
+
+        self.assertEqual(list(metrics_by_date), ["2026-02-16", "2026-02-17", "2026-02-18"])
+        for date_iso, metrics in metrics_by_date.items():
+            self.assertEqual(metrics, calculate_metrics(date_iso.replace("-", "")))
+        self.assertEqual(metrics_by_date["2026-02-18"]["cta_rate"], 50.0)
+        self.assertEqual(metrics_by_date["2026-02-17"]["visitors"], 0)
+
+    def test_run_range_renders_every_date(self) -> None:
+        run_range(start_token="20260216", end_token="20260218", root=self.root, overwrite=False, bootstrap=True)
+
+        cards_text = (self.root / "reports" / "decision_cards.md").read_text(encoding="utf-8")
+        for date_iso in ("2026-02-16", "2026-02-17", "2026-02-18"):
+            self.assertEqual(cards_text.count(f"## Date {date_iso}"), 1)
+        self.assertEqual(cards_text.count("### Card 01 - S001"), 3)
+
+        report_text = (self.root / "reports" / "pre_apply_validation.md").read_text(encoding="utf-8")
+        self.assertIn("Latest: 2026-02-18", report_text)
+        history = report_text.split("## History", 1)[1].strip().splitlines()
+        self.assertEqual([line.split(":", 1)[0] for line in history], ["- 2026-02-18", "- 2026-02-17", "- 2026-02-16"])
+
+        run_range(start_token="20260216", end_token="20260218", root=self.root, overwrite=False, bootstrap=False)
+        rerun_text = (self.root / "reports" / "decision_cards.md").read_text(encoding="utf-8")
+        self.assertEqual(rerun_text.count("## Date "), 3)
+        self.assertEqual(rerun_text.count("### Card 01 - S001"), 3)
+
     def test_run_bootstrap_creates_data_exports(self) -> None:
         run(date_token="20260216", root=self.root, overwrite=False, bootstrap=True)
 
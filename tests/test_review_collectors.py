@@ -1,21 +1,69 @@
 import datetime as dt
+import json
+import re
 import sys
+import threading
+import time
 import types
 import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest.mock import patch
 
 from src.review_collectors.apple_store import collect_apple_reviews
-from src.review_collectors.common import parse_apple_app_id_from_link, parse_google_app_id_from_link
+from src.review_collectors.common import RateLimiter, parse_apple_app_id_from_link, parse_google_app_id_from_link
 from src.review_collectors.google_play import collect_google_reviews
 
 
-class FakeResponse:
-    def __init__(self, status_code: int, payload: dict) -> None:
-        self.status_code = status_code
-        self._payload = payload
+class RssFixtureServer:
+    """Local stand-in for the iTunes customer-reviews feed, keyed by page number."""
 
-    def json(self) -> dict:
-        return self._payload
+    def __init__(self, pages: dict[int, dict]) -> None:
+        self.pages = pages
+        self.requested: list[int] = []
+        self.client_ports: set[int] = set()
+        fixture = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self) -> None:  # noqa: N802
+                page = int(re.search(r"/page=(\d+)/", self.path).group(1))
+                fixture.requested.append(page)
+                fixture.client_ports.add(self.client_address[1])
+                payload = fixture.pages.get(page)
+                body = json.dumps(payload if payload is not None else {}).encode("utf-8")
+                self.send_response(200 if payload is not None else 404)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args) -> None:  # type: ignore[no-untyped-def]
+                del args
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self.base_url = f"http://127.0.0.1:{self._server.server_address[1]}"
+        self._thread = threading.Thread(target=self._server.serve_forever, args=(0.05,), daemon=True)
+
+    def __enter__(self) -> "RssFixtureServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+def apple_entry(review_id: str, updated: str) -> dict:
+    return {
+        "id": {"label": review_id},
+        "updated": {"label": updated},
+        "im:rating": {"label": "5"},
+        "title": {"label": review_id},
+        "content": {"label": "text"},
+        "author": {"name": {"label": "alice"}},
+    }
 
 
 class ReviewCollectorsTest(unittest.TestCase):
@@ -29,8 +77,7 @@ class ReviewCollectorsTest(unittest.TestCase):
         fake_module = types.ModuleType("google_play_scraper")
         fake_module.Sort = types.SimpleNamespace(NEWEST="newest")
 
-        def fake_reviews_all(*args, **kwargs):  # type: ignore[no-untyped-def]
-            del args, kwargs
+        def fake_page() -> list[dict]:
             return [
                 {
                     "reviewId": "g-1",
@@ -50,7 +97,11 @@ class ReviewCollectorsTest(unittest.TestCase):
                 },
             ]
 
-        fake_module.reviews_all = fake_reviews_all  # type: ignore[attr-defined]
+        def fake_reviews(app_id, **kwargs):  # type: ignore[no-untyped-def]
+            del app_id, kwargs
+            return fake_page(), None
+
+        fake_module.reviews = fake_reviews  # type: ignore[attr-defined]
 
         with patch.dict(sys.modules, {"google_play_scraper": fake_module}):
             rows = collect_google_reviews(app_id="com.example.app", country="US", lang="en", limit=1)
@@ -85,16 +136,10 @@ class ReviewCollectorsTest(unittest.TestCase):
             }
         }
 
-        fake_requests = types.ModuleType("requests")
-
-        def fake_get(*args, **kwargs):  # type: ignore[no-untyped-def]
-            del args, kwargs
-            return FakeResponse(200, payload)
-
-        fake_requests.get = fake_get  # type: ignore[attr-defined]
-
-        with patch.dict(sys.modules, {"requests": fake_requests}):
-            rows = collect_apple_reviews(app_id="123456789", country="US", lang="en", limit=2)
+        with RssFixtureServer({1: payload}) as server:
+            rows = collect_apple_reviews(
+                app_id="123456789", country="US", lang="en", limit=2, base_url=server.base_url
+            )
 
         self.assertEqual(len(rows), 2)
         self.assertEqual(rows[0]["review_id"], "a-1")
@@ -102,6 +147,116 @@ class ReviewCollectorsTest(unittest.TestCase):
         self.assertEqual(rows[1]["rating"], "4")
         self.assertTrue(rows[0]["source_url"].startswith("https://apps.apple.com/us/app/id123456789"))
 
+    def test_rate_limiter_caps_concurrency_and_spaces_starts(self) -> None:
+        limiter = RateLimiter(max_concurrent=2, min_interval_sec=0.02)
+        lock = threading.Lock()
+        state = {"active": 0, "peak": 0}
+        starts: list[float] = []
+
+        def work() -> None:
+            with limiter:
+                with lock:
+                    starts.append(time.monotonic())
+                    state["active"] += 1
+                    state["peak"] = max(state["peak"], state["active"])
+                time.sleep(0.03)
+                with lock:
+                    state["active"] -= 1
+
+        threads = [threading.Thread(target=work) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(state["peak"], 2)
+        # Individual gaps jitter with thread wake-ups; the scheduled span of 4 intervals cannot shrink.
+        ordered = sorted(starts)
+        self.assertGreaterEqual(ordered[-1] - ordered[0], 0.07)
+
+    def test_collect_apple_reviews_stops_at_watermark(self) -> None:
+        page = {
+            "feed": {
+                "entry": [apple_entry(f"a-{idx}", f"2026-02-16T{10 - idx:02d}:00:00-07:00") for idx in range(50)],
+            }
+        }
+
+        with RssFixtureServer({1: page, 2: page}) as server:
+            rows = collect_apple_reviews(
+                app_id="123456789",
+                country="US",
+                lang="en",
+                since={"review_updated_at": "2026-02-16T08:00:00-07:00", "review_id": "a-2"},
+                base_url=server.base_url,
+                max_concurrent_pages=1,
+            )
+
+        self.assertEqual([row["review_id"] for row in rows], ["a-0", "a-1"])
+        self.assertEqual(server.requested, [1])
+
+    def test_collect_apple_reviews_fetches_pages_concurrently_in_order(self) -> None:
+        pages = {
+            number: {
+                "feed": {
+                    "entry": [
+                        apple_entry(f"p{number}-{idx:02d}", f"2026-02-{20 - number:02d}T10:00:00Z")
+                        for idx in range(50 if number < 3 else 7)
+                    ]
+                }
+            }
+            for number in range(1, 4)
+        }
+
+        with RssFixtureServer(pages) as server:
+            rows = collect_apple_reviews(
+                app_id="123456789",
+                country="US",
+                lang="en",
+                base_url=server.base_url,
+                max_concurrent_pages=2,
+            )
+
+        self.assertEqual(len(rows), 107)
+        self.assertEqual(rows[0]["review_id"], "p1-00")
+        self.assertEqual(rows[50]["review_id"], "p2-00")
+        self.assertEqual(rows[-1]["review_id"], "p3-06")
+        # At most one page past the short page 3 is in flight; keep-alive reuses one socket per slot.
+        self.assertLessEqual(max(server.requested), 4)
+        self.assertLessEqual(len(server.client_ports), 2)
+
+    def test_collect_google_reviews_pages_until_watermark(self) -> None:
+        fake_module = types.ModuleType("google_play_scraper")
+        fake_module.Sort = types.SimpleNamespace(NEWEST="newest")
+        pages = {
+            None: ([{"reviewId": "g-3", "at": dt.datetime(2026, 2, 16, 12, 0, 0)}], "page-2"),
+            "page-2": ([{"reviewId": "g-2", "at": dt.datetime(2026, 2, 16, 11, 0, 0)}], "page-3"),
+            "page-3": ([{"reviewId": "g-1", "at": dt.datetime(2026, 2, 16, 10, 0, 0)}], "page-4"),
+        }
+        requested: list[object] = []
+
+        def fake_reviews(app_id, *, lang, country, sort, count, continuation_token):  # type: ignore[no-untyped-def]
+            del app_id, lang, country, sort, count
+            requested.append(continuation_token)
+            return pages[continuation_token]
+
+        def fail_reviews_all(*args, **kwargs):  # type: ignore[no-untyped-def]
+            raise AssertionError("incremental collection must not walk the full history")
+
+        fake_module.reviews = fake_reviews  # type: ignore[attr-defined]
+        fake_module.reviews_all = fail_reviews_all  # type: ignore[attr-defined]
+
+        with patch.dict(sys.modules, {"google_play_scraper": fake_module}):
+            with patch("src.review_collectors.google_play.PAGE_SLEEP_SEC", 0):
+                rows = collect_google_reviews(
+                    app_id="com.example.app",
+                    country="US",
+                    lang="en",
+                    since={"review_updated_at": "2026-02-16T10:30:00", "review_id": "g-0"},
+                )
+
+        self.assertEqual([row["review_id"] for row in rows], ["g-3", "g-2"])
+        self.assertEqual(requested, [None, "page-2", "page-3"])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,15 +1,29 @@
 import csv
 import os
+import sqlite3
 import tempfile
 import threading
 import unittest
 from pathlib import Path
+from unittest.mock import patch
 
+from src import storage_base, storage_exports, storage_records
 from src.storage import (
+    append_analytics_event,
     append_landing_event_if_new,
+    close_pooled_connections,
+    connection_pool_stats,
     date_token_to_iso,
+    ensure_schema,
+    export_all_tables_to_csv,
     export_table_to_csv,
+    fetch_community_source_rows,
+    flush_exports,
     increment_landing_cvr,
+    pseudonymize_lead_email,
+    record_interaction,
+    start_background_exporter,
+    stop_background_exporter,
     upsert_app_reviews,
     upsert_table_rows,
 )
@@ -29,6 +43,7 @@ class StorageTest(unittest.TestCase):
         os.environ["KTRIPPEDIA_DATA_DIR"] = str(self.root / "data")
 
     def tearDown(self) -> None:
+        stop_background_exporter()
         os.environ.pop("KTRIPPEDIA_DATA_DIR", None)
         self.temp_dir.cleanup()
 
@@ -104,6 +119,217 @@ class StorageTest(unittest.TestCase):
         self.assertEqual({row["source_id"] for row in rows}, {"reddit", "facebook"})
         self.assertEqual({row["post_id"] for row in rows}, {"r1", "f1"})
 
+    def _append_visit(self, session_id: str, timestamp: str) -> bool:
+        return append_landing_event_if_new(
+            timestamp=timestamp,
+            date_iso="2026-02-16",
+            session_id=session_id,
+            language="EN",
+            channel="referral",
+            source_id="",
+            post_id="",
+            event_type="visit",
+            cta_type="",
+            lead_email="",
+            consent=False,
+        )
+
+    def test_landing_events_export_appends_new_rows(self) -> None:
+        csv_path = self.root / "data" / "landing_events.csv"
+        self._append_visit("s1", "2026-02-16T10:00:00")
+        first_size = csv_path.stat().st_size
+        self._append_visit("s2", "2026-02-16T10:05:00")
+
+        rows = read_rows(csv_path)
+        self.assertEqual([row["session_id"] for row in rows], ["s1", "s2"])
+        self.assertGreater(csv_path.stat().st_size, first_size)
+        with csv_path.open("r", encoding="utf-8") as handle:
+            self.assertEqual(sum(1 for line in handle if line.startswith("timestamp,")), 1)
+
+    def test_landing_events_export_rewrites_when_order_or_file_changes(self) -> None:
+        csv_path = self.root / "data" / "landing_events.csv"
+        self._append_visit("s1", "2026-02-16T10:00:00")
+        self._append_visit("s2", "2026-02-16T09:00:00")
+        self.assertEqual([row["session_id"] for row in read_rows(csv_path)], ["s2", "s1"])
+
+        csv_path.write_text("timestamp\n", encoding="utf-8")
+        self._append_visit("s3", "2026-02-16T11:00:00")
+        self.assertEqual([row["session_id"] for row in read_rows(csv_path)], ["s2", "s1", "s3"])
+
+    def test_analytics_events_incremental_matches_full_export(self) -> None:
+        for idx in range(3):
+            append_analytics_event(
+                timestamp=f"2026-02-16T10:0{idx}:00",
+                date_iso="2026-02-16",
+                event_name="page_view",
+                client_id=f"cid-{idx}",
+                channel="referral",
+                language="EN",
+                status="skipped_env_missing",
+                payload="{}",
+            )
+        csv_path = self.root / "data" / "analytics_events.csv"
+        incremental_text = csv_path.read_text(encoding="utf-8")
+        export_all_tables_to_csv()
+        self.assertEqual(csv_path.read_text(encoding="utf-8"), incremental_text)
+        self.assertEqual([row["client_id"] for row in read_rows(csv_path)], ["cid-0", "cid-1", "cid-2"])
+
+    def test_record_interaction_counts_only_new_events(self) -> None:
+        kwargs = {
+            "timestamp": "2026-02-16T10:00:00",
+            "date_iso": "2026-02-16",
+            "session_id": "s1",
+            "language": "EN",
+            "channel": "community",
+            "source_id": "reddit",
+            "post_id": "r1",
+            "event_type": "cta_click",
+            "cta_type": "pilot",
+            "lead_email": "",
+            "consent": False,
+            "cvr_increments": {"pilot_cta": 1, "total_cta": 1},
+        }
+        self.assertTrue(record_interaction(**kwargs))
+        self.assertFalse(record_interaction(**kwargs))
+
+        rows = read_rows(self.root / "data" / "landing_cvr.csv")
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]["pilot_cta"], "1")
+        self.assertEqual(rows[0]["total_cta"], "1")
+        self.assertEqual(rows[0]["visitors"], "0")
+
+        with self.assertRaises(ValueError):
+            record_interaction(**{**kwargs, "session_id": "s2", "cvr_increments": {"bogus": 1}})
+        self.assertEqual(len(read_rows(self.root / "data" / "landing_events.csv")), 1)
+
+    def test_community_rollup_tracks_new_events_and_backfills(self) -> None:
+        base_kwargs = {
+            "timestamp": "2026-02-16T10:00:00",
+            "date_iso": "2026-02-16",
+            "language": "EN",
+            "channel": "community",
+            "source_id": "reddit",
+            "post_id": "r1",
+            "cta_type": "",
+            "lead_email": "",
+            "consent": False,
+        }
+        for session_id, event_type in (("s1", "visit"), ("s1", "visit"), ("s2", "visit"), ("s1", "cta_click")):
+            append_landing_event_if_new(**base_kwargs, session_id=session_id, event_type=event_type)
+        append_landing_event_if_new(
+            **{**base_kwargs, "lead_email": "a@example.com", "consent": True}, session_id="s1", event_type="lead_submit"
+        )
+        append_landing_event_if_new(**{**base_kwargs, "channel": "referral"}, session_id="s3", event_type="visit")
+        append_landing_event_if_new(**{**base_kwargs, "date_iso": "2026-02-17", "source_id": " "}, session_id="s4", event_type="visit")
+
+        self.assertEqual(
+            fetch_community_source_rows("2026-02-16", "2026-02-16"),
+            [{"source_id": "reddit", "post_id": "r1", "visitors": 2, "cta": 1, "leads": 1}],
+        )
+        self.assertEqual(
+            fetch_community_source_rows("2026-02-16", "2026-02-17"),
+            [
+                {"source_id": "", "post_id": "r1", "visitors": 1, "cta": 0, "leads": 0},
+                {"source_id": "reddit", "post_id": "r1", "visitors": 2, "cta": 1, "leads": 1},
+            ],
+        )
+
+        db_file = self.root / "data" / "ktrippedia.db"
+        conn = sqlite3.connect(db_file)
+        try:
+            with conn:
+                conn.execute("DELETE FROM community_source_daily")
+                conn.execute(f"PRAGMA user_version = {storage_base.SCHEMA_VERSION - 1}")
+        finally:
+            conn.close()
+        close_pooled_connections()
+        storage_base._schema_ready = False
+        ensure_schema()
+
+        self.assertEqual(len(fetch_community_source_rows("2026-02-16", "2026-02-17")), 2)
+        self.assertEqual(fetch_community_source_rows("2026-02-16", "2026-02-16")[0]["visitors"], 2)
+
+    def _create_legacy_landing_db(self) -> Path:
+        db_file = self.root / "data" / "ktrippedia.db"
+        db_file.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(db_file)
+        conn.executescript(
+            """
+            CREATE TABLE landing_events (
+              id INTEGER PRIMARY KEY AUTOINCREMENT,
+              timestamp TEXT NOT NULL,
+              date TEXT NOT NULL,
+              session_id TEXT NOT NULL,
+              language TEXT,
+              channel TEXT NOT NULL,
+              event_type TEXT NOT NULL,
+              cta_type TEXT,
+              lead_email TEXT,
+              consent INTEGER NOT NULL DEFAULT 0
+            );
+            CREATE UNIQUE INDEX ux_landing_events_dedup
+            ON landing_events (date, session_id, channel, event_type, cta_type, lead_email);
+            INSERT INTO landing_events (timestamp, date, session_id, language, channel, event_type, cta_type, lead_email, consent)
+            VALUES ('2026-02-16T10:00:00', '2026-02-16', 's1', 'EN', 'referral', 'lead_submit', '', 'Me@Example.com', 1);
+            INSERT INTO landing_events (timestamp, date, session_id, language, channel, event_type, cta_type, lead_email, consent)
+            VALUES ('2026-02-16T10:01:00', '2026-02-16', 's1', 'EN', 'referral', 'lead_submit', '', 'me@example.com', 1);
+            CREATE TABLE app_reviews (
+              timestamp TEXT NOT NULL,
+              date TEXT NOT NULL,
+              service_name TEXT NOT NULL,
+              store TEXT NOT NULL,
+              app_id TEXT NOT NULL,
+              country TEXT NOT NULL,
+              language TEXT NOT NULL,
+              review_id TEXT NOT NULL,
+              review_created_at TEXT,
+              review_updated_at TEXT,
+              rating TEXT,
+              title TEXT,
+              content TEXT,
+              reviewer_name TEXT,
+              source_url TEXT,
+              PRIMARY KEY (store, app_id, country, review_id)
+            );
+            INSERT INTO app_reviews (timestamp, date, service_name, store, app_id, country, language, review_id, review_updated_at, rating, title, content)
+            VALUES ('2026-02-16T10:00:00', '2026-02-16', 'svc', 'google_play', 'a', 'US', 'en', 'r1', '2026-02-15', '5', 'Hi', 'Body');
+            """
+        )
+        conn.commit()
+        conn.close()
+        return db_file
+
+    def test_ensure_schema_migrates_legacy_database_once(self) -> None:
+        db_file = self._create_legacy_landing_db()
+        ensure_schema()
+
+        conn = sqlite3.connect(db_file)
+        try:
+            self.assertEqual(conn.execute("PRAGMA user_version").fetchone()[0], storage_base.SCHEMA_VERSION)
+            rows = conn.execute("SELECT lead_email, source_id, post_id FROM landing_events").fetchall()
+            self.assertEqual(rows, [(pseudonymize_lead_email("me@example.com"), None, None)])
+            review_hash = conn.execute("SELECT content_hash FROM app_reviews").fetchone()[0]
+            self.assertEqual(review_hash, storage_base.review_content_hash("5", "Hi", "Body", "2026-02-15"))
+            with conn:
+                conn.execute(
+                    """
+                    INSERT INTO landing_events (timestamp, date, session_id, channel, event_type, lead_email)
+                    VALUES ('2026-02-16T11:00:00', '2026-02-16', 's2', 'referral', 'lead_submit', 'raw@example.com')
+                    """
+                )
+        finally:
+            conn.close()
+
+        # A cold start on an up-to-date database must not re-run the data migrations.
+        storage_base._schema_ready = False
+        ensure_schema()
+        conn = sqlite3.connect(db_file)
+        try:
+            emails = [row[0] for row in conn.execute("SELECT lead_email FROM landing_events ORDER BY id")]
+        finally:
+            conn.close()
+        self.assertEqual(emails[-1], "raw@example.com")
+
     def test_concurrent_increment(self) -> None:
         date_iso = date_token_to_iso("20260216")
 
@@ -121,6 +347,87 @@ class StorageTest(unittest.TestCase):
         self.assertEqual(len(rows), 1)
         self.assertEqual(rows[0]["visitors"], "100")
 
+    def test_background_exporter_coalesces_until_flush(self) -> None:
+        date_iso = date_token_to_iso("20260216")
+        self.assertTrue(start_background_exporter(interval_sec=60.0))
+        csv_path = self.root / "data" / "landing_cvr.csv"
+        original_export = storage_exports.export_table_to_csv
+        with patch.object(storage_exports, "export_table_to_csv", wraps=original_export) as mocked_export:
+            for _ in range(5):
+                increment_landing_cvr(date_iso=date_iso, channel="referral", field="visitors", amount=1)
+            self.assertFalse(csv_path.exists())
+
+            flush_exports()
+
+        self.assertEqual(mocked_export.call_count, 1)
+        rows = read_rows(csv_path)
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]["visitors"], "5")
+
+    def test_background_exporter_stop_writes_pending_tables(self) -> None:
+        start_background_exporter(interval_sec=60.0)
+        self._append_visit("s1", "2026-02-16T10:00:00")
+        csv_path = self.root / "data" / "landing_events.csv"
+        self.assertFalse(csv_path.exists())
+
+        stop_background_exporter()
+
+        self.assertEqual([row["session_id"] for row in read_rows(csv_path)], ["s1"])
+
+    def test_background_exporter_disabled_by_non_positive_interval(self) -> None:
+        self.assertFalse(start_background_exporter(interval_sec=0))
+        self._append_visit("s1", "2026-02-16T10:00:00")
+        self.assertEqual(len(read_rows(self.root / "data" / "landing_events.csv")), 1)
+
+    def test_suppressed_exports_are_replayed_after_the_block(self) -> None:
+        date_iso = date_token_to_iso("20260216")
+        csv_path = self.root / "data" / "landing_cvr.csv"
+        original_export = storage_exports.export_table_to_csv
+        with patch.object(storage_exports, "export_table_to_csv", wraps=original_export) as mocked_export:
+            with storage_exports.suppress_exports():
+                increment_landing_cvr(date_iso=date_iso, channel="referral", field="visitors", amount=1)
+                # Writes from other threads are deferred too, not lost.
+                worker = threading.Thread(
+                    target=increment_landing_cvr,
+                    kwargs={"date_iso": date_iso, "channel": "referral", "field": "visitors", "amount": 1},
+                )
+                worker.start()
+                worker.join()
+                self.assertFalse(csv_path.exists())
+
+        self.assertEqual([call.args[0] for call in mocked_export.call_args_list], ["landing_cvr_daily"])
+        self.assertEqual(read_rows(csv_path)[0]["visitors"], "2")
+
+    def test_connection_pool_reuses_connection_per_thread(self) -> None:
+        close_pooled_connections()
+        date_iso = date_token_to_iso("20260216")
+        before = connection_pool_stats()
+        for _ in range(3):
+            increment_landing_cvr(date_iso=date_iso, channel="referral", field="visitors", amount=1)
+        after = connection_pool_stats()
+
+        self.assertEqual(after["open"], 1)
+        self.assertEqual(after["misses"] - before["misses"], 1)
+        self.assertGreater(after["hits"] - before["hits"], 3)
+
+        worker = threading.Thread(
+            target=increment_landing_cvr,
+            kwargs={"date_iso": date_iso, "channel": "referral", "field": "visitors"},
+        )
+        worker.start()
+        worker.join()
+        self.assertEqual(connection_pool_stats()["open"], 1)
+        self.assertEqual(read_rows(self.root / "data" / "landing_cvr.csv")[0]["visitors"], "4")
+
+    def test_connection_pool_switches_database_on_path_change(self) -> None:
+        self._append_visit("s1", "2026-02-16T10:00:00")
+        os.environ["KTRIPPEDIA_DATA_DIR"] = str(self.root / "other")
+        self._append_visit("s2", "2026-02-16T10:00:00")
+
+        self.assertEqual(connection_pool_stats()["open"], 1)
+        self.assertEqual([row["session_id"] for row in read_rows(self.root / "other" / "landing_events.csv")], ["s2"])
+        self.assertEqual([row["session_id"] for row in read_rows(self.root / "data" / "landing_events.csv")], ["s1"])
+
     def test_upsert_table_rows_updates_same_key(self) -> None:
         upsert_table_rows(
             "trip_safety",
@@ -165,6 +472,22 @@ class StorageTest(unittest.TestCase):
         self.assertEqual(len(rows), 1)
         self.assertEqual(rows[0]["restriction"], "shellfish_allergy")
 
+    def test_export_streams_rows_in_batches_and_reports_rate(self) -> None:
+        rows = [
+            {"scenario_id": f"S{idx:05d}", "date": "2026-02-16", "persona": "fit_foreign", "time_sec": str(idx)}
+            for idx in range(2500)
+        ]
+        upsert_table_rows("trip_safety", rows)
+
+        with self.assertLogs(level="INFO") as logs:
+            out_path = export_table_to_csv("trip_safety")
+
+        exported = read_rows(out_path)
+        self.assertEqual(len(exported), 2500)
+        self.assertEqual(exported[-1]["time_sec"], "2499")
+        self.assertEqual(exported[0]["menu"], "")
+        self.assertTrue(any("table=trip_safety rows=2500" in line and "rows_per_sec=" in line for line in logs.output))
+
     def test_community_outreach_table_export(self) -> None:
         upsert_table_rows(
             "community_outreach_log",
@@ -228,6 +551,82 @@ class StorageTest(unittest.TestCase):
         self.assertEqual(rows[0]["rating"], "5")
         self.assertEqual(rows[0]["content"], "updated")
 
+    def test_upsert_app_reviews_bulk_counts_across_chunks(self) -> None:
+        def review(review_id: str, content: str) -> dict[str, str]:
+            return {
+                "timestamp": "2026-02-16T10:00:00",
+                "date": "2026-02-16",
+                "service_name": "Ask Before You Eat",
+                "store": "apple_app_store",
+                "app_id": "123456789",
+                "country": "jp",
+                "language": "ja",
+                "review_id": review_id,
+                "rating": "5",
+                "content": content,
+            }
+
+        upsert_app_reviews([review("r0", "old")])
+        batch = [review(f"r{idx}", "new") for idx in range(5)] + [review("r4", "latest")]
+        with patch.object(storage_records, "UPSERT_CHUNK_SIZE", 2):
+            stats = upsert_app_reviews(iter(batch))
+
+        self.assertEqual(stats, {"inserted": 4, "updated": 2, "unchanged": 0, "total": 6})
+        rows = {row["review_id"]: row for row in read_rows(self.root / "data" / "app_reviews.csv")}
+        self.assertEqual(len(rows), 5)
+        self.assertEqual(rows["r0"]["content"], "new")
+        self.assertEqual(rows["r4"]["content"], "latest")
+        self.assertEqual(rows["r4"]["country"], "JP")
+
+    def test_upsert_app_reviews_skips_unchanged_fingerprints(self) -> None:
+        def review(review_id: str, content: str, timestamp: str) -> dict[str, str]:
+            return {
+                "timestamp": timestamp,
+                "date": "2026-02-16",
+                "service_name": "Ask Before You Eat",
+                "store": "google_play",
+                "app_id": "com.example.app",
+                "country": "US",
+                "language": "en",
+                "review_id": review_id,
+                "review_updated_at": "2026-02-16T09:00:00",
+                "rating": "5",
+                "content": content,
+            }
+
+        upsert_app_reviews([review("r1", "same", "2026-02-16T10:00:00"), review("r2", "old", "2026-02-16T10:00:00")])
+        stats = upsert_app_reviews(
+            [
+                review("r1", "same", "2026-02-17T10:00:00"),
+                review("r2", "new", "2026-02-17T10:00:00"),
+                review("r2", "new", "2026-02-17T10:00:00"),
+                review("r3", "fresh", "2026-02-17T10:00:00"),
+            ]
+        )
+
+        self.assertEqual(stats, {"inserted": 1, "updated": 1, "unchanged": 2, "total": 4})
+        export_table_to_csv("app_reviews")
+        rows = {row["review_id"]: row for row in read_rows(self.root / "data" / "app_reviews.csv")}
+        self.assertEqual(rows["r1"]["timestamp"], "2026-02-16T10:00:00")
+        self.assertEqual(rows["r2"]["content"], "new")
+        self.assertEqual(rows["r2"]["timestamp"], "2026-02-17T10:00:00")
+
+        with patch.object(storage_exports, "mark_table_dirty") as mark_dirty:
+            repeat = upsert_app_reviews([review("r3", "fresh", "2026-02-18T10:00:00")])
+        self.assertEqual(repeat["unchanged"], 1)
+        mark_dirty.assert_not_called()
+
+    def test_upsert_app_reviews_rejects_missing_key_atomically(self) -> None:
+        with self.assertRaises(ValueError):
+            upsert_app_reviews(
+                [
+                    {"store": "google_play", "app_id": "a", "country": "US", "review_id": "r1"},
+                    {"store": "google_play", "app_id": "a", "country": "US", "review_id": ""},
+                ]
+            )
+        stats = upsert_app_reviews([{"store": "google_play", "app_id": "a", "country": "US", "review_id": "r1"}])
+        self.assertEqual(stats["inserted"], 1)
+
 
 if __name__ == "__main__":
     unittest.main()